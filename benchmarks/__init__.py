@@ -0,0 +1,20 @@
+"""Performance benchmarks for the ``fca_api`` package.
+
+Each module is a standalone suite run with ``python -m benchmarks.<suite>``
+from the project root. Suites measure the working tree in ``src`` (via
+fresh subprocesses where cold-start behaviour matters), compare the results
+against a baseline stored in ``benchmarks/baselines`` and exit non-zero on
+regressions.
+
+Suites:
+    - `cold_start`: Import time, first client construction and first model
+      validation per type
+    - `replay`: Offline throughput and per-stage latency of every client
+      endpoint, replaying the responses recorded for the unit tests
+    - `type_layer`: Microbenchmarks of model validation and the field parsers
+
+Run ``make benchmarks`` to run every suite, or pass ``--update-baseline`` to
+a suite to record new reference numbers after an intentional change.
+``--history`` appends each run to a JSON Lines file under
+``benchmarks/history`` so results can be tracked across releases.
+"""
@@ -0,0 +1,132 @@
+"""Cold-start benchmarks.
+
+Every measurement runs in a fresh interpreter so module caches, compiled
+pydantic schemas and lazily imported submodules start cold, as they do for a
+short-lived CLI or serverless handler.
+
+Measured:
+    - ``python -X importtime`` for ``import fca_api`` and
+      ``import fca_api.async_api``, with a per-module breakdown of the
+      ``fca_api`` modules (informational)
+    - number of modules loaded by ``import fca_api``
+    - first construction of `fca_api.async_api.Client`
+    - first validation of every model in `fca_api.types`, which includes
+      building the model's (deferred) core schema
+
+Usage::
+
+    python -m benchmarks.cold_start
+    python -m benchmarks.cold_start --repeat 10 --update-baseline
+"""
+
+import argparse
+import collections
+import json
+import re
+import sys
+
+from . import harness
+
+_IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s+)(\S+)\s*$")
+
+_MODULE_COUNT_CODE = """
+import sys
+before = set(sys.modules)
+import fca_api
+print(len(set(sys.modules) - before))
+"""
+
+_CLIENT_CODE = """
+import asyncio
+import json
+import time
+
+start = time.perf_counter()
+import fca_api.async_api
+imported = time.perf_counter()
+client = fca_api.async_api.Client(credentials=("bench@example.com", "bench-key"))
+constructed = time.perf_counter()
+asyncio.run(client.aclose())
+print(json.dumps({"import": imported - start, "construct": constructed - imported}))
+"""
+
+_VALIDATION_CODE = """
+import importlib
+import inspect
+import json
+import time
+
+import pydantic
+
+import fca_api.types
+
+timings = {}
+for module_name in sorted(fca_api.types._SUBMODULES):
+    module = importlib.import_module(f"fca_api.types.{module_name}")
+    for name, model in inspect.getmembers(module, inspect.isclass):
+        if not issubclass(model, pydantic.BaseModel) or model.__module__ != module.__name__:
+            continue
+        start = time.perf_counter()
+        try:
+            model.model_validate({})
+        except pydantic.ValidationError:
+            pass
+        timings[f"{module_name}.{name}"] = time.perf_counter() - start
+print(json.dumps(timings))
+"""
+
+
+def parse_importtime(stderr: str) -> dict[str, int]:
+    """Return the cumulative import time in microseconds per module."""
+    out = {}
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_RE.match(line)
+        if match is None:
+            continue
+        _self_us, cumulative_us, _indent, module = match.groups()
+        out.setdefault(module, int(cumulative_us))
+    return out
+
+
+def import_time(statement: str, repeat: int) -> list[dict[str, int]]:
+    """Run ``statement`` under ``-X importtime`` ``repeat`` times."""
+    return [parse_importtime(harness.run_python(statement, "-X", "importtime").stderr) for _ in range(repeat)]
+
+
+def _median_json(code: str, repeat: int) -> dict[str, float]:
+    samples = collections.defaultdict(list)
+    for _ in range(repeat):
+        for key, value in json.loads(harness.run_python(code).stdout).items():
+            samples[key].append(value)
+    return {key: harness.median(values) for key, values in samples.items()}
+
+
+def collect(args: argparse.Namespace) -> list[harness.Metric]:
+    """Collect all cold-start metrics."""
+    metrics = []
+    for statement, module in (("import fca_api", "fca_api"), ("import fca_api.async_api", "fca_api.async_api")):
+        runs = import_time(statement, args.repeat)
+        metrics.append(
+            harness.Metric(f"importtime: {statement}", harness.median(run[module] for run in runs) / 1000, "ms")
+        )
+    # Per-module breakdown of the client import, which loads the most of the package.
+    for module in sorted({name for run in runs for name in run if name.startswith("fca_api")}):
+        value = harness.median(run.get(module, 0) for run in runs) / 1000
+        metrics.append(harness.Metric(f"importtime: {module}", value, "ms", gate=False))
+
+    module_counts = [int(harness.run_python(_MODULE_COUNT_CODE).stdout) for _ in range(args.repeat)]
+    metrics.append(harness.Metric("modules loaded by import fca_api", harness.median(module_counts), "count"))
+
+    client = _median_json(_CLIENT_CODE, args.repeat)
+    metrics.append(harness.Metric("first Client(): import", client["import"] * 1000, "ms"))
+    metrics.append(harness.Metric("first Client(): construct", client["construct"] * 1000, "ms"))
+
+    validation = _median_json(_VALIDATION_CODE, args.repeat)
+    metrics.append(harness.Metric("first validation: all models", sum(validation.values()) * 1000, "ms"))
+    for name, value in sorted(validation.items()):
+        metrics.append(harness.Metric(f"first validation: {name}", value * 1000, "ms"))
+    return metrics
+
+
+if __name__ == "__main__":
+    sys.exit(harness.main("cold_start", collect, description=__doc__.splitlines()[0]))
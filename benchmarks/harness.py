@@ -0,0 +1,260 @@
+"""Shared helpers for the benchmark suites: metrics, baselines and reporting.
+
+A suite collects a list of `Metric` values and hands them to `main`, which
+prints a report, compares the gated metrics against the suite's stored
+baseline and returns the process exit code.
+
+A metric regresses when it is worse than its baseline by more than the
+relative ``--tolerance`` *and* by more than the absolute slack for its unit
+(see `MIN_DELTA`), so that sub-millisecond jitter on fast measurements does
+not fail a run.
+"""
+
+import argparse
+import dataclasses
+import datetime
+import json
+import os
+import pathlib
+import platform
+import statistics
+import subprocess
+import sys
+import typing
+
+PROJECT_ROOT = pathlib.Path(__file__).resolve().parent.parent
+SRC_DIR = PROJECT_ROOT / "src"
+BASELINE_DIR = pathlib.Path(__file__).resolve().parent / "baselines"
+# Responses recorded for the unit tests, used as realistic offline payloads.
+RESOURCES_DIR = PROJECT_ROOT / "tests" / "units" / "test_client" / "resources"
+
+# Absolute change below which a metric is never reported as a regression.
+MIN_DELTA: dict[str, float] = {
+    "ms": 2.0,
+    "us": 2.0,
+    "ns": 50.0,
+    "count": 0.0,
+    "ops/s": 0.0,
+    "MiB": 0.5,
+}
+
+
+@dataclasses.dataclass(frozen=True)
+class Metric:
+    """A single benchmark measurement.
+
+    Attributes:
+        name: Stable identifier, used as the baseline key.
+        value: The measured value (usually a median over repeats).
+        unit: Unit of ``value``; selects the absolute slack in `MIN_DELTA`.
+        higher_is_better: ``True`` for throughput-style metrics.
+        gate: Whether the metric is compared against the baseline. Informational
+            breakdowns are recorded with ``gate=False``.
+    """
+
+    name: str
+    value: float
+    unit: str
+    higher_is_better: bool = False
+    gate: bool = True
+
+
+@dataclasses.dataclass(frozen=True)
+class Regression:
+    """A gated metric that is worse than its baseline."""
+
+    metric: Metric
+    baseline: float
+
+    @property
+    def change(self) -> float:
+        """Relative change against the baseline (positive is worse)."""
+        if not self.baseline:
+            return float("inf")
+        delta = (self.metric.value - self.baseline) / self.baseline
+        return -delta if self.metric.higher_is_better else delta
+
+
+def median(samples: typing.Iterable[float]) -> float:
+    """Return the median of ``samples``."""
+    return statistics.median(samples)
+
+
+def use_working_tree() -> None:
+    """Make in-process imports of ``fca_api`` resolve to the working tree."""
+    if str(SRC_DIR) not in sys.path:
+        sys.path.insert(0, str(SRC_DIR))
+
+
+def run_python(code: str, *args: str) -> subprocess.CompletedProcess:
+    """Run ``code`` in a fresh interpreter against the working tree.
+
+    ``src`` is prepended to ``PYTHONPATH`` so the subprocess imports the
+    checked-out package rather than any installed copy.
+
+    Raises:
+        subprocess.CalledProcessError: If the subprocess exits non-zero.
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC_DIR), env.get("PYTHONPATH")]))
+    env.pop("PYTHONPROFILEIMPORTTIME", None)
+    return subprocess.run(
+        [sys.executable, *args, "-c", code],
+        capture_output=True,
+        check=True,
+        cwd=PROJECT_ROOT,
+        env=env,
+        text=True,
+    )
+
+
+def load_baseline(path: pathlib.Path) -> dict[str, float]:
+    """Load the metric values stored at ``path`` (empty if it does not exist)."""
+    if not path.exists():
+        return {}
+    data = json.loads(path.read_text())
+    return {name: entry["value"] for name, entry in data["metrics"].items()}
+
+
+def save_baseline(path: pathlib.Path, metrics: typing.Sequence[Metric]) -> None:
+    """Store the gated ``metrics`` as the baseline at ``path``."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "metrics": {
+            metric.name: {"value": round(metric.value, 4), "unit": metric.unit} for metric in metrics if metric.gate
+        },
+    }
+    path.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n")
+
+
+def append_history(path: pathlib.Path, metrics: typing.Sequence[Metric]) -> None:
+    """Append a timestamped record of ``metrics`` to the JSON Lines file at ``path``.
+
+    Records carry the git revision and interpreter so results can be tracked
+    across releases.
+    """
+    revision = subprocess.run(
+        ["git", "rev-parse", "--short", "HEAD"],
+        capture_output=True,
+        check=False,
+        cwd=PROJECT_ROOT,
+        text=True,
+    ).stdout.strip()
+    record = {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "revision": revision or None,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "metrics": {metric.name: {"value": round(metric.value, 4), "unit": metric.unit} for metric in metrics},
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a") as fh:
+        fh.write(json.dumps(record, sort_keys=True) + "\n")
+
+
+def compare(
+    metrics: typing.Sequence[Metric],
+    baseline: dict[str, float],
+    tolerance: float,
+) -> list[Regression]:
+    """Return the gated metrics that regressed against ``baseline``.
+
+    Metrics without a baseline entry are never regressions.
+    """
+    regressions = []
+    for metric in metrics:
+        if not metric.gate or metric.name not in baseline:
+            continue
+        reference = baseline[metric.name]
+        delta = reference - metric.value if metric.higher_is_better else metric.value - reference
+        if delta > abs(reference) * tolerance and delta > MIN_DELTA.get(metric.unit, 0.0):
+            regressions.append(Regression(metric, reference))
+    return regressions
+
+
+def report(
+    title: str,
+    metrics: typing.Sequence[Metric],
+    baseline: dict[str, float],
+    regressions: typing.Sequence[Regression],
+    out: typing.TextIO = sys.stdout,
+) -> None:
+    """Print a table of ``metrics`` with their baseline and relative change."""
+    regressed = {el.metric.name for el in regressions}
+    width = max((len(metric.name) for metric in metrics), default=10)
+    print(f"== {title} ({platform.python_implementation()} {platform.python_version()})", file=out)
+    for metric in metrics:
+        line = f"{metric.name:<{width}}  {metric.value:>12.3f} {metric.unit:<6}"
+        if metric.name in baseline:
+            reference = baseline[metric.name]
+            change = (metric.value - reference) / reference * 100 if reference else 0.0
+            line += f"  baseline {reference:>12.3f}  {change:+7.1f}%"
+        if not metric.gate:
+            line += "  (info)"
+        if metric.name in regressed:
+            line += "  REGRESSION"
+        print(line.rstrip(), file=out)
+    print(file=out)
+
+
+def main(
+    suite: str,
+    collect: typing.Callable[[argparse.Namespace], list[Metric]],
+    argv: typing.Optional[typing.Sequence[str]] = None,
+    description: typing.Optional[str] = None,
+    add_arguments: typing.Optional[typing.Callable[[argparse.ArgumentParser], None]] = None,
+) -> int:
+    """Run a benchmark suite from the command line.
+
+    Args:
+        suite: Suite name; the baseline defaults to ``baselines/<suite>.json``.
+        collect: Called with the parsed arguments; returns the measurements.
+        argv: Command line arguments (defaults to ``sys.argv[1:]``).
+        description: Help text for the argument parser.
+        add_arguments: Optional hook adding suite-specific arguments.
+
+    Returns:
+        ``0`` on success, ``1`` if any gated metric regressed.
+    """
+    parser = argparse.ArgumentParser(prog=f"python -m benchmarks.{suite}", description=description)
+    parser.add_argument("--repeat", type=int, default=5, help="Number of repeats per measurement (median is kept).")
+    parser.add_argument("--baseline", type=pathlib.Path, default=BASELINE_DIR / f"{suite}.json")
+    parser.add_argument("--tolerance", type=float, default=0.3, help="Allowed relative regression (default: 0.3).")
+    parser.add_argument("--update-baseline", action="store_true", help="Store the results as the new baseline.")
+    parser.add_argument("--json", type=pathlib.Path, help="Also write the raw results to this file.")
+    parser.add_argument(
+        "--history",
+        type=pathlib.Path,
+        help=f"Append the results to this JSON Lines file (e.g. benchmarks/history/{suite}.jsonl).",
+    )
+    if add_arguments is not None:
+        add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    metrics = collect(args)
+    if args.json is not None:
+        args.json.write_text(json.dumps([dataclasses.asdict(metric) for metric in metrics], indent=2) + "\n")
+    if args.history is not None:
+        append_history(args.history, metrics)
+    if args.update_baseline:
+        save_baseline(args.baseline, metrics)
+        report(suite, metrics, {}, [])
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    regressions = compare(metrics, baseline, args.tolerance)
+    report(suite, metrics, baseline, regressions)
+    if not baseline:
+        print(f"No baseline at {args.baseline}; run with --update-baseline to create one.")
+    for regression in regressions:
+        metric = regression.metric
+        print(
+            f"Regression: {metric.name} {metric.value:.3f} {metric.unit} vs baseline "
+            f"{regression.baseline:.3f} {metric.unit} ({regression.change:+.0%})"
+        )
+    return 1 if regressions else 0
@@ -0,0 +1,321 @@
+"""Offline throughput benchmarks replaying recorded API responses.
+
+Every `fca_api.async_api.Client` endpoint is driven against the responses
+recorded under ``tests/units/test_client/resources``, replayed through the
+test suite's ``CachingSession`` and ``cache_filename.make``, so the suite
+runs fully offline and exercises exactly the code paths the unit tests do.
+
+For each endpoint and concurrency level the suite reports:
+
+    - throughput (calls/s, gated against the baseline, and items/s)
+    - median call latency and per-item latency
+    - a per-call split of where the time went:
+
+      - ``transport``: replayed response construction and gzip decoding
+      - ``json``: ``httpx.Response.json`` decoding
+      - ``validation``: ``fca_api.types`` model validation
+      - ``other``: reshaping of the raw payload, pagination and the rest of
+        the client
+
+Stages are measured with a single timer stack. This is exact because the
+replayed transport never suspends, so stages of concurrent calls cannot
+interleave.
+
+Usage::
+
+    python -m benchmarks.replay
+    python -m benchmarks.replay --concurrency 1,16 --min-time 1 --json replay.json
+"""
+
+import argparse
+import asyncio
+import collections
+import contextlib
+import dataclasses
+import inspect
+import json
+import logging
+import math
+import pathlib
+import sys
+import time
+import typing
+from unittest import mock
+
+from . import harness
+
+harness.use_working_tree()
+sys.path.insert(0, str(harness.PROJECT_ROOT / "tests"))
+
+import httpx  # noqa: E402
+from test_plugins.mock_session import cache_filename, session  # noqa: E402
+
+import fca_api  # noqa: E402
+
+STAGES = ("transport", "json", "validation")
+
+
+@dataclasses.dataclass(frozen=True)
+class Scenario:
+    """A `fca_api.async_api.Client` call with recorded responses."""
+
+    method: str
+    args: tuple = ()
+    kwargs: dict = dataclasses.field(default_factory=dict)
+
+
+# Arguments mirror the calls made by the tests in ``tests/units/test_client``.
+SCENARIOS = (
+    Scenario("search_frn", ("revolution",), {"result_count": 10_000}),
+    Scenario("search_irn", ("bob",)),
+    Scenario("search_prn", ("global equity fund",)),
+    Scenario("get_firm", ("552016",)),
+    Scenario("get_firm_names", ("552016",), {"result_count": 100}),
+    Scenario("get_firm_addresses", ("552016",), {"result_count": 100}),
+    Scenario("get_firm_controlled_functions", ("552016",)),
+    Scenario("get_firm_individuals", ("552016",), {"result_count": 5000}),
+    Scenario("get_firm_permissions", ("122702",), {"result_count": 5000}),
+    Scenario("get_firm_requirements", ("122702",), {"result_count": 5000}),
+    Scenario("get_firm_requirement_investment_types", ("552016", "OR-0263614"), {"result_count": 100}),
+    Scenario("get_firm_regulators", ("552016",), {"result_count": 100}),
+    Scenario("get_firm_passports", ("122702",), {"result_count": 100}),
+    Scenario("get_firm_passport_permissions", ("122702", "GIBRALTAR"), {"result_count": 100}),
+    Scenario("get_firm_waivers", ("122702",), {"result_count": 5000}),
+    Scenario("get_firm_exclusions", ("122702",), {"result_count": 5000}),
+    Scenario("get_firm_disciplinary_history", ("122702",), {"result_count": 5000}),
+    Scenario("get_firm_appointed_representatives", ("454811",), {"result_count": 5000}),
+    Scenario("get_individual", ("BXK69703",)),
+    Scenario("get_individual_controlled_functions", ("BXK69703",), {"result_count": 100}),
+    Scenario("get_individual_disciplinary_history", ("NPD01015",), {"result_count": 100}),
+    Scenario("get_fund", ("185045",)),
+    Scenario("get_fund_names", ("185045",), {"result_count": 100}),
+    Scenario("get_fund_subfunds", ("185045",), {"result_count": 100}),
+    Scenario("get_regulated_markets", (), {"result_count": 100}),
+)
+
+
+class StageTimer:
+    """Accumulates exclusive wall time per named stage."""
+
+    def __init__(self) -> None:
+        self.totals: collections.Counter[str] = collections.Counter()
+        self._children: list[float] = []
+
+    @contextlib.contextmanager
+    def stage(self, name: str) -> typing.Iterator[None]:
+        """Time the body as ``name``, excluding any nested stages."""
+        self._children.append(0.0)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.totals[name] += elapsed - self._children.pop()
+            if self._children:
+                self._children[-1] += elapsed
+
+    def reset(self) -> None:
+        self.totals.clear()
+
+
+def client_endpoints() -> list[str]:
+    """Return the names of the public `fca_api.async_api.Client` endpoints."""
+    return [
+        name
+        for name, _ in inspect.getmembers(fca_api.async_api.Client, inspect.iscoroutinefunction)
+        if not name.startswith("_") and name != "aclose"
+    ]
+
+
+def _request_key(url: str, params: typing.Optional[dict]) -> tuple:
+    return (url, tuple(sorted((params or {}).items())))
+
+
+class ReplaySession(session.CachingSession):
+    """Read-only `CachingSession` serving responses recorded by any test.
+
+    Recordings are indexed by request so that a call resolves to the test
+    directory that recorded it, and decoded recordings are kept in memory so
+    repeated calls measure the client rather than fixture file I/O.
+    """
+
+    def __init__(self, resources_dir: pathlib.Path, timer: StageTimer) -> None:
+        super().__init__(headers={"ACCEPT": "application/json"}, cache_dir=resources_dir, cache_mode="readonly")
+        self.timer = timer
+        self._index: dict[tuple, pathlib.PurePath] = {}
+        self._recorded: dict[pathlib.Path, tuple] = {}
+        for path in sorted(resources_dir.rglob("*.json")):
+            request = json.loads(path.read_text())["request"]
+            self._index.setdefault(
+                _request_key(request["url"], request["params"]),
+                path.parent.relative_to(resources_dir),
+            )
+
+    def _get_cache_filename(self, url: str, **kwargs: typing.Any) -> pathlib.Path:
+        key = _request_key(url, kwargs.get("params"))
+        if key not in self._index:
+            raise LookupError(f"No recorded response for GET {url} (params={kwargs.get('params')})")
+        cache_filename.G_CUR_TEST_PREFIX = self._index[key]
+        return super()._get_cache_filename(url, **kwargs)
+
+    async def _read_response_from_cache(self, cache_file: pathlib.Path) -> httpx.Response:
+        if cache_file not in self._recorded:
+            response = await super()._read_response_from_cache(cache_file)
+            self._recorded[cache_file] = (
+                response.status_code,
+                response.headers,
+                response.request,
+                b"".join(response.stream),
+            )
+        status_code, headers, request, content = self._recorded[cache_file]
+        return httpx.Response(status_code, headers=headers, content=content, request=request)
+
+    async def get(self, url: str, **kwargs: typing.Any) -> httpx.Response:
+        # Nothing below suspends, so the stage cannot interleave with other calls.
+        with self.timer.stage("transport"):
+            response = await super().get(url, **kwargs)
+            response.read()
+        return response
+
+
+@contextlib.contextmanager
+def instrument(timer: StageTimer) -> typing.Iterator[None]:
+    """Attribute JSON decoding and model validation to their stages."""
+    json_fn = httpx.Response.json
+    validate_fn = fca_api.types.base.Base.model_validate.__func__
+
+    def timed_json(self, **kwargs):
+        with timer.stage("json"):
+            return json_fn(self, **kwargs)
+
+    def timed_validate(cls, data):
+        with timer.stage("validation"):
+            return validate_fn(cls, data)
+
+    with (
+        mock.patch.object(httpx.Response, "json", timed_json),
+        mock.patch.object(fca_api.types.base.Base, "model_validate", classmethod(timed_validate)),
+    ):
+        yield
+
+
+@dataclasses.dataclass
+class RunResult:
+    """Measurements of one scenario at one concurrency level."""
+
+    calls: int
+    items: int
+    wall: float
+    latencies: list[float]
+    stages: dict[str, float]
+
+
+async def run_scenario(
+    client: fca_api.async_api.Client,
+    timer: StageTimer,
+    scenario: Scenario,
+    calls: int,
+    concurrency: int,
+) -> RunResult:
+    """Make ``calls`` calls of ``scenario`` with ``concurrency`` workers."""
+    method = getattr(client, scenario.method)
+    pending = iter(range(calls))
+    latencies: list[float] = []
+    items = 0
+
+    async def worker() -> None:
+        nonlocal items
+        for _ in pending:
+            start = time.perf_counter()
+            result = await method(*scenario.args, **scenario.kwargs)
+            latencies.append(time.perf_counter() - start)
+            items += len(result.data) if hasattr(result, "data") else 1
+
+    timer.reset()
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall = time.perf_counter() - start
+    stages = {name: timer.totals[name] for name in STAGES}
+    stages["other"] = max(wall - sum(stages.values()), 0.0)
+    return RunResult(calls, items, wall, latencies, stages)
+
+
+def _scenario_metrics(scenario: Scenario, concurrency: int, runs: list[RunResult]) -> list[harness.Metric]:
+    prefix = f"{scenario.method} @c{concurrency}"
+    calls = runs[0].calls
+    items_per_call = runs[0].items / calls
+    latency = harness.median(harness.median(run.latencies) for run in runs)
+    metrics = [
+        harness.Metric(f"{prefix}: calls/s", harness.median(run.calls / run.wall for run in runs), "ops/s", True),
+        harness.Metric(
+            f"{prefix}: items/s", harness.median(run.items / run.wall for run in runs), "ops/s", True, gate=False
+        ),
+        harness.Metric(f"{prefix}: latency p50", latency * 1e6, "us", gate=False),
+    ]
+    if items_per_call:
+        metrics.append(harness.Metric(f"{prefix}: per-item latency", latency / items_per_call * 1e6, "us", gate=False))
+    for stage in (*STAGES, "other"):
+        value = harness.median(run.stages[stage] / calls for run in runs)
+        metrics.append(harness.Metric(f"{prefix}: {stage} per call", value * 1e6, "us", gate=False))
+    return metrics
+
+
+async def _collect(args: argparse.Namespace) -> list[harness.Metric]:
+    # Some recordings trigger per-item data warnings; keep the report readable.
+    logging.getLogger("fca_api").setLevel(logging.ERROR)
+    timer = StageTimer()
+    scenarios = [el for el in SCENARIOS if not args.endpoints or el.method in args.endpoints]
+    metrics = []
+    async with ReplaySession(harness.RESOURCES_DIR, timer) as api_session:
+        client = fca_api.async_api.Client(credentials=api_session)
+        with instrument(timer):
+            for scenario in scenarios:
+                # Warm up: load the recordings and build the deferred model schemas,
+                # then size each run to last at least --min-time.
+                await run_scenario(client, timer, scenario, 1, 1)
+                warm = await run_scenario(client, timer, scenario, 3, 1)
+                calls = max(args.calls, math.ceil(args.min_time / (warm.wall / warm.calls)))
+                for concurrency in args.concurrency:
+                    runs = [
+                        await run_scenario(client, timer, scenario, max(calls, concurrency), concurrency)
+                        for _ in range(args.repeat)
+                    ]
+                    metrics.extend(_scenario_metrics(scenario, concurrency, runs))
+    return metrics
+
+
+def collect(args: argparse.Namespace) -> list[harness.Metric]:
+    """Collect the replay throughput metrics."""
+    covered = {el.method for el in SCENARIOS}
+    missing = [name for name in client_endpoints() if name not in covered]
+    if missing:
+        print(f"Endpoints without a replay scenario: {', '.join(missing)}", file=sys.stderr)
+    return asyncio.run(_collect(args))
+
+
+def _add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--concurrency",
+        type=lambda value: [int(el) for el in value.split(",")],
+        default=[1, 8, 32],
+        help="Comma-separated concurrency levels (default: 1,8,32).",
+    )
+    parser.add_argument("--calls", type=int, default=5, help="Minimum calls per endpoint and concurrency level.")
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.1,
+        help="Minimum duration in seconds of each run; sets the number of calls (default: 0.1).",
+    )
+    parser.add_argument("--endpoints", nargs="*", help="Only run these Client methods.")
+
+
+if __name__ == "__main__":
+    sys.exit(
+        harness.main(
+            "replay",
+            collect,
+            description=__doc__.splitlines()[0],
+            add_arguments=_add_arguments,
+        )
+    )
@@ -0,0 +1,196 @@
+"""Microbenchmarks for the type layer and field parsers.
+
+Validation is the client's CPU hot path. This suite times, in-process and
+with ``timeit``:
+
+    - ``Base.model_validate`` key normalisation, as the difference between
+      validating a raw ``FirmDetails`` payload and validating the same,
+      already-normalised payload with pydantic directly
+    - the `fca_api.types.field_parsers` validators on representative inputs
+    - ``PaginatedResultInfo.model_validate``
+    - the largest models (``FirmDetails``, ``FirmControlledFunction``,
+      ``IndividualControlledFunction``, ``FirmPermission``) on full recorded
+      API pages, per page and per item
+
+Payloads come from the responses recorded under
+``tests/units/test_client/resources`` and are reshaped by the client's own
+page parsers, so they match what the models see in production.
+
+Usage::
+
+    python -m benchmarks.type_layer
+    python -m benchmarks.type_layer --history benchmarks/history/type_layer.jsonl
+"""
+
+import argparse
+import asyncio
+import dataclasses
+import json
+import logging
+import sys
+import timeit
+import typing
+from unittest import mock
+
+from . import harness
+
+harness.use_working_tree()
+
+import httpx  # noqa: E402
+import pydantic  # noqa: E402
+
+import fca_api  # noqa: E402
+
+
+@dataclasses.dataclass(frozen=True)
+class Case:
+    """A microbenchmark: ``fn`` is timed, ``items`` is the work per call."""
+
+    name: str
+    fn: typing.Callable[[], typing.Any]
+    unit: str = "us"
+    items: int = 1
+
+
+def recorded_data(pattern: str) -> typing.Union[list, dict]:
+    """Return the largest recorded ``Data`` payload matching ``pattern``."""
+    payloads = [json.loads(path.read_text())["content"]["json"]["Data"] for path in harness.RESOURCES_DIR.glob(pattern)]
+    if not payloads:
+        raise LookupError(f"No recorded responses match {pattern!r}")
+    return max(payloads, key=lambda data: len(json.dumps(data)))
+
+
+def recorded_result_info(pattern: str) -> dict:
+    """Return the first recorded ``ResultInfo`` matching ``pattern``."""
+    path = min(harness.RESOURCES_DIR.glob(pattern))
+    return json.loads(path.read_text())["content"]["json"]["ResultInfo"]
+
+
+def captured_payloads(
+    model: type[fca_api.types.base.Base],
+    parse_fn: typing.Callable[[typing.Any], list],
+    data: typing.Union[list, dict],
+) -> list[dict]:
+    """Run a client page parser and return what it passes to ``model``."""
+    payloads = []
+    validate = model.model_validate
+
+    def capture(item):
+        payloads.append(item)
+        return validate(item)
+
+    with mock.patch.object(model, "model_validate", capture):
+        parse_fn(data)
+    return payloads
+
+
+def _normalise(data: dict) -> dict:
+    return {key.lower().strip(): value for key, value in data.items() if "[notinuse]" not in key.lower()}
+
+
+def _page_case(name: str, model: type[fca_api.types.base.Base], payloads: list[dict]) -> Case:
+    return Case(name, lambda: [model.model_validate(item) for item in payloads], items=len(payloads))
+
+
+def build_cases(client: fca_api.async_api.Client) -> list[Case]:
+    """Build the benchmark cases from the recorded payloads."""
+    types = fca_api.types
+    parsers = types.field_parsers
+    firm = recorded_data("test_get_firm_resource.py/TestNutmegFirmDetails/test_get_firm/*.json")[0]
+    firm_normalised = _normalise(firm)
+    pydantic_validate = pydantic.BaseModel.model_validate.__func__
+    result_info = recorded_result_info("test_get_firm_resource.py/TestNutmegFirmDetails/test_get_firm_cf/*.json")
+
+    cases = [
+        Case("Base.model_validate: FirmDetails raw payload", lambda: types.firm.FirmDetails.model_validate(firm)),
+        Case(
+            "Base.model_validate: FirmDetails pre-normalised (pydantic only)",
+            lambda: pydantic_validate(
+                types.firm.FirmDetails, firm_normalised, extra=types.settings.model_validate_extra
+            ),
+        ),
+        Case("ParseFcaDate: dd/mm/yyyy", lambda: parsers.ParseFcaDate.func("06/10/2011"), "ns"),
+        Case("ParseFcaDate: dd/mm/yyyy hh:mm", lambda: parsers.ParseFcaDate.func("27/02/2026 11:21"), "ns"),
+        Case("ParseFcaDate: ISO 8601", lambda: parsers.ParseFcaDate.func("2024-01-15T14:30:00"), "ns"),
+        Case("ParseFcaDate: blank", lambda: parsers.ParseFcaDate.func(""), "ns"),
+        Case("StrOrNone: value", lambda: parsers.StrOrNone.func("  Hold and control client money "), "ns"),
+        Case("StrOrNone: n/a", lambda: parsers.StrOrNone.func("N/A"), "ns"),
+        Case("FixIncompleteUrl: full url", lambda: parsers.FixIncompleteUrl.func("https://www.example.com/"), "ns"),
+        Case("FixIncompleteUrl: missing scheme", lambda: parsers.FixIncompleteUrl.func("www.example.com"), "ns"),
+        Case(
+            "PaginatedResultInfo.model_validate",
+            lambda: types.pagination.PaginatedResultInfo.model_validate(result_info),
+        ),
+        _page_case(
+            "FirmControlledFunction: page",
+            types.firm.FirmControlledFunction,
+            captured_payloads(
+                types.firm.FirmControlledFunction,
+                client._parse_firm_controlled_functions_pg,
+                recorded_data("test_get_firm_resource.py/*/*/firm_cf_get_*.json"),
+            ),
+        ),
+        _page_case(
+            "IndividualControlledFunction: page",
+            types.individual.IndividualControlledFunction,
+            captured_payloads(
+                types.individual.IndividualControlledFunction,
+                client._parse_individual_controlled_functions_pg,
+                recorded_data("test_get_individuals_resource.py/*/*/*_cf_get_*.json"),
+            ),
+        ),
+        _page_case(
+            "FirmPermission: page",
+            types.firm.FirmPermission,
+            captured_payloads(
+                types.firm.FirmPermission,
+                client._parse_firm_permissions_pg,
+                recorded_data("test_get_firm_resource.py/*/*/firm_permissions_get_*.json"),
+            ),
+        ),
+    ]
+    return cases
+
+
+def time_case(case: Case, repeat: int) -> list[float]:
+    """Return per-call timings in seconds, one per repeat."""
+    timer = timeit.Timer(case.fn)
+    number, _ = timer.autorange()
+    return [elapsed / number for elapsed in timer.repeat(repeat, number)]
+
+
+def collect(args: argparse.Namespace) -> list[harness.Metric]:
+    """Collect the type layer microbenchmarks."""
+    scale = {"ns": 1e9, "us": 1e6}
+    # Some recordings trigger per-item data warnings; keep the report readable.
+    logging.getLogger("fca_api").setLevel(logging.ERROR)
+    http = httpx.AsyncClient()
+    client = fca_api.async_api.Client(credentials=http)
+    try:
+        cases = build_cases(client)
+    finally:
+        asyncio.run(http.aclose())
+
+    metrics = []
+    timings = {}
+    for case in cases:
+        case.fn()  # build the deferred model schemas outside the timed loop
+        value = harness.median(time_case(case, args.repeat)) * scale[case.unit]
+        timings[case.name] = value
+        metrics.append(harness.Metric(case.name, value, case.unit))
+        if case.items > 1:
+            per_item = harness.Metric(
+                f"{case.name} (per item, {case.items} items)", value / case.items, case.unit, gate=False
+            )
+            metrics.append(per_item)
+
+    overhead = (
+        timings["Base.model_validate: FirmDetails raw payload"]
+        - timings["Base.model_validate: FirmDetails pre-normalised (pydantic only)"]
+    )
+    metrics.append(harness.Metric("Base.model_validate: key normalisation overhead", overhead, "us", gate=False))
+    return metrics
+
+
+if __name__ == "__main__":
+    sys.exit(harness.main("type_layer", collect, description=__doc__.splitlines()[0]))
@@ -30,4 +30,74 @@ See Also:
     - `API Documentation <https://register.fca.org.uk/Developer/s/>`_
 """
 
-from . import __version__, async_api, const, exc, raw_api, raw_status_codes, types
+import typing
+
+from . import __version__
+
+if typing.TYPE_CHECKING:
+    from . import (
+        accounting,
+        async_api,
+        breaker,
+        bulk,
+        caching,
+        cli,
+        concurrency,
+        const,
+        deadlines,
+        exc,
+        export,
+        hooks,
+        jobs,
+        metrics,
+        raw_api,
+        raw_status_codes,
+        scheduling,
+        server,
+        sync_api,
+        tracing,
+        types,
+        warmer,
+    )
+
+# Submodules are imported on first attribute access, so ``import fca_api``
+# only pays for the parts of the package that are actually used.
+_SUBMODULES = frozenset(
+    {
+        "accounting",
+        "async_api",
+        "breaker",
+        "bulk",
+        "caching",
+        "cli",
+        "concurrency",
+        "const",
+        "deadlines",
+        "exc",
+        "export",
+        "hooks",
+        "jobs",
+        "metrics",
+        "raw_api",
+        "raw_status_codes",
+        "scheduling",
+        "server",
+        "sync_api",
+        "tracing",
+        "types",
+        "warmer",
+    }
+)
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name in _SUBMODULES:
+        # ``__import__`` rather than ``importlib.import_module`` so that lazily
+        # imported submodules are still reported by ``python -X importtime``.
+        __import__(f"{__name__}.{name}")
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _SUBMODULES)
@@ -0,0 +1,134 @@
+"""Cost accounting of client calls.
+
+A `CostTracker` accumulates the resources used by client calls made while
+it is active: HTTP requests, cache hits, response bytes, rate limiter
+waits, JSON decoding and model validation (see
+`fca_api.types.cost.CallCost`). Trackers are held in a context variable,
+so they follow the calls of the current task (and of tasks it creates)
+without being passed around, and nest: when a tracker stops, its totals
+are added to the enclosing tracker, if any.
+
+`fca_api.async_api.Client` opens a tracker around each call when created
+with ``report_costs=True``, and attaches the resulting cost to the
+returned object. `track` aggregates the cost of any block of code, e.g.
+to bill a tenant for everything done while serving a request.
+
+When no tracker is active, the clients pay a single context variable
+lookup per request.
+
+Example:
+    Billing a request handler::
+
+        with fca_api.accounting.track() as tracker:
+            firm = await client.get_firm(frn)
+            permissions = await client.get_firm_permissions(frn, result_count=1000)
+        bill(tenant, tracker.cost())
+"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import time
+import typing
+
+from . import types
+
+_current_tracker: contextvars.ContextVar[typing.Optional["CostTracker"]] = contextvars.ContextVar(
+    "fca_api_cost_tracker", default=None
+)
+
+
+class CostTracker:
+    """Mutable accumulator of the resources used by client calls.
+
+    Use `track` to create and activate a tracker.
+    """
+
+    __slots__ = (
+        "requests",
+        "cache_hits",
+        "response_bytes",
+        "limiter_wait",
+        "decode_time",
+        "validation_time",
+        "_started",
+        "_stopped",
+    )
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.cache_hits = 0
+        self.response_bytes = 0
+        self.limiter_wait = 0.0
+        self.decode_time = 0.0
+        self.validation_time = 0.0
+        self._started = time.perf_counter()
+        self._stopped: typing.Optional[float] = None
+
+    def cost(self) -> types.cost.CallCost:
+        """Return the totals so far; the wall time runs until the tracker stops."""
+        stopped = time.perf_counter() if self._stopped is None else self._stopped
+        return types.cost.CallCost(
+            requests=self.requests,
+            cache_hits=self.cache_hits,
+            response_bytes=self.response_bytes,
+            wall_time=stopped - self._started,
+            limiter_wait=self.limiter_wait,
+            decode_time=self.decode_time,
+            validation_time=self.validation_time,
+        )
+
+    def _merge(self, other: "CostTracker") -> None:
+        self.requests += other.requests
+        self.cache_hits += other.cache_hits
+        self.response_bytes += other.response_bytes
+        self.limiter_wait += other.limiter_wait
+        self.decode_time += other.decode_time
+        self.validation_time += other.validation_time
+
+
+def current() -> typing.Optional[CostTracker]:
+    """Return the innermost active tracker, or ``None``."""
+    return _current_tracker.get()
+
+
+def detach() -> None:
+    """Deactivate the tracker of the current context.
+
+    Meant for a copied context (see `contextvars.copy_context`) running work
+    shared by several callers, which must not be billed to the tracker of
+    whichever caller started it.
+    """
+    _current_tracker.set(None)
+
+
+@contextlib.contextmanager
+def activate(tracker: typing.Optional[CostTracker]) -> typing.Iterator[None]:
+    """Make an existing ``tracker`` the active one for the duration of the
+    block, e.g. in a task that should not be billed to the tracker it
+    inherited. Unlike `track`, nothing is merged on exit."""
+    token = _current_tracker.set(tracker)
+    try:
+        yield
+    finally:
+        _current_tracker.reset(token)
+
+
+@contextlib.contextmanager
+def track() -> typing.Iterator[CostTracker]:
+    """Activate a new `CostTracker` for the duration of the block.
+
+    On exit, the tracker's totals are added to the enclosing tracker, if
+    any.
+    """
+    parent = _current_tracker.get()
+    tracker = CostTracker()
+    token = _current_tracker.set(tracker)
+    try:
+        yield tracker
+    finally:
+        _current_tracker.reset(token)
+        tracker._stopped = time.perf_counter()
+        if parent is not None:
+            parent._merge(tracker)
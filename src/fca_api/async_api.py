@@ -45,19 +45,123 @@ Example:
                 print(f"{firm.name} (FRN: {firm.frn})")
 """
 
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import copy
+import functools
 import logging
+import os
 import re
+import sys
 import threading
+import time
 import typing
 
 import httpx
 
-from . import raw_api, types
+from . import accounting, breaker, caching, deadlines, exc, raw_api, tracing, types
+
+if typing.TYPE_CHECKING:
+    import concurrent.futures
+
+    from . import (
+        hooks as fca_hooks,
+        metrics as fca_metrics,
+    )
 
 logger = logging.getLogger(__name__)
 
 T = typing.TypeVar("T")
-BaseSubclassT = typing.TypeVar("BaseSubclassT", bound=types.base.Base)
+BaseSubclassT = typing.TypeVar("BaseSubclassT", bound="types.base.Base")
+ClientMethodT = typing.TypeVar("ClientMethodT", bound=typing.Callable[..., typing.Awaitable[typing.Any]])
+
+#: Parameter names of the reference numbers recorded on client call spans.
+_REF_PARAMS = frozenset({"frn", "irn", "prn"})
+
+
+def _gil_enabled() -> bool:
+    """Whether the GIL is enabled; always the case before Python 3.13."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is None or is_gil_enabled()
+
+
+class _ItemParser:
+    """Page parser converting each item of a list payload independently.
+
+    Unlike arbitrary page parsers, these can be applied to chunks of a page
+    in parallel.
+    """
+
+    __slots__ = ("parse_item",)
+
+    def __init__(self, parse_item: typing.Callable[[typing.Any], typing.Any]) -> None:
+        self.parse_item = parse_item
+
+    def __call__(self, data: list) -> list:
+        parse_item = self.parse_item
+        return [parse_item(item) for item in data]
+
+
+def _with_cost(result: T, cost: types.cost.CallCost) -> T:
+    """Attach ``cost`` to a client call result."""
+    if isinstance(result, types.pagination.MultipageList):
+        return result.model_copy(update={"cost": cost})
+    if isinstance(result, types.cost.CostReported):
+        result._cost = cost
+    return result
+
+
+def _instrumented(method: ClientMethodT) -> ClientMethodT:
+    """Wrap a public `Client` method with its priority, deadline, tracing span
+    and cost report.
+
+    For clients with a priority or call timeout, the call runs under
+    `fca_api.scheduling.priority` or `fca_api.deadlines.deadline`. The span is named after the method and
+    carries the method name, the reference number the method is called with
+    (if any) and the number of items returned. With cost reporting enabled,
+    the call runs under its own `fca_api.accounting` tracker and the cost is
+    attached to the result.
+    """
+    code = method.__code__
+    ref_param = code.co_varnames[1] if code.co_argcount > 1 and code.co_varnames[1] in _REF_PARAMS else None
+    span_name = f"fca_api.Client.{method.__name__}"
+
+    @functools.wraps(method)
+    async def wrapper(self: Client, *args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+        if self._priority is None and self._call_timeout is None:
+            return await instrumented(self, *args, **kwargs)
+        with contextlib.ExitStack() as stack:
+            if self._priority is not None:
+                # Imported on use, as most clients never set a priority
+                from . import scheduling
+
+                stack.enter_context(scheduling.priority(self._priority))
+            if self._call_timeout is not None:
+                stack.enter_context(deadlines.deadline(self._call_timeout))
+            return await instrumented(self, *args, **kwargs)
+
+    async def instrumented(self: Client, *args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+        tracer = self._tracer
+        if tracer is tracing.NOOP_TRACER and not self._report_costs:
+            return await method(self, *args, **kwargs)
+        attributes = {"fca_api.endpoint": method.__name__}
+        if ref_param is not None:
+            attributes[f"fca_api.{ref_param}"] = str(args[0] if args else kwargs[ref_param])
+        with tracer.start_as_current_span(span_name, attributes=attributes) as span:
+            if self._report_costs:
+                with accounting.track() as tracker:
+                    out = await method(self, *args, **kwargs)
+                out = _with_cost(out, tracker.cost())
+            else:
+                out = await method(self, *args, **kwargs)
+            span.set_attribute(
+                "fca_api.item_count", len(out.data) if isinstance(out, types.pagination.MultipageList) else 1
+            )
+        return out
+
+    return typing.cast(ClientMethodT, wrapper)
 
 
 class Client:
@@ -115,6 +219,13 @@ class Client:
     _lock: threading.Lock
     _ctx_enter_count: int
     _page_token_serializer: typing.Optional[types.pagination.PageTokenSerializer]
+    _metrics: typing.Optional[fca_metrics.MetricsRecorder] = None
+    _tracer: tracing.Tracer = tracing.NOOP_TRACER
+    _report_costs: bool = False
+    _priority: typing.Optional[str] = None
+    _call_timeout: typing.Optional[float] = None
+    _parse_offload_threshold: typing.Optional[int] = None
+    _parse_executor: typing.Optional[concurrent.futures.Executor] = None
 
     def __init__(
         self,
@@ -124,6 +235,18 @@ class Client:
         ],
         api_limiter: typing.Optional[raw_api.LimiterContextT] = None,
         page_token_serializer: typing.Optional[types.pagination.PageTokenSerializer] = None,
+        circuit_breaker: typing.Optional[breaker.CircuitBreaker] = None,
+        cache: typing.Optional[caching.ResponseCache] = None,
+        metrics: typing.Optional[fca_metrics.MetricsRecorder] = None,
+        tracer: typing.Optional[tracing.Tracer] = None,
+        hooks: typing.Optional[fca_hooks.HookRegistry] = None,
+        max_retries: int = 0,
+        retry_backoff: float = 0.5,
+        report_costs: bool = False,
+        priority: typing.Optional[str] = None,
+        call_timeout: typing.Optional[float] = None,
+        parse_offload_threshold: typing.Optional[int] = None,
+        parse_executor: typing.Optional[concurrent.futures.Executor] = None,
     ) -> None:
         """Initialize the high-level FCA API client.
 
@@ -138,6 +261,50 @@ class Client:
                 tokens returned to callers are encrypted via
                 ``serializer.serialize()``, and tokens received from callers
                 are decrypted via ``serializer.deserialize()`` before use.
+            circuit_breaker: Optional circuit breaker tracking upstream
+                failures per endpoint family. While a family's circuit is
+                open, calls to it raise ``exc.FcaCircuitOpenError`` without
+                contacting the API.
+            cache: Optional response cache. Successful API responses are
+                reused until they expire, with optional stale-while-revalidate
+                and stale-if-error serving.
+            metrics: Optional metrics recorder, e.g.
+                ``fca_api.metrics.MetricsRegistry``. Receives request,
+                rate limiter, JSON decode and status code metrics per
+                endpoint family, validation time per model type and the
+                number of pages fetched per call.
+            tracer: Optional OpenTelemetry-compatible tracer. Client calls,
+                page fetches, rate limiter acquisition, HTTP requests and
+                model validation are run in nested spans (see
+                ``fca_api.tracing``). Tracing is disabled by default.
+            hooks: Optional registry of request lifecycle hooks (see
+                ``fca_api.hooks``). If not provided, the client gets its
+                own, empty registry, available as ``raw_client.hooks``.
+            max_retries: Number of times a request failing with a transport
+                error, HTTP 429 or 5xx, or an FCA system error status is
+                retried. Retries are disabled by default.
+            retry_backoff: Delay in seconds before the first retry; doubled
+                for each further retry.
+            report_costs: Whether to attach a ``types.cost.CallCost`` to
+                every result: ``MultipageList.cost`` for paginated results,
+                and the ``cost`` property of single-object results.
+            priority: Optional priority class of the client's calls, used
+                by a ``fca_api.scheduling.PriorityLimiter`` rate limiter.
+                Defaults to the priority of the calling context.
+            call_timeout: Optional budget in seconds for each call, covering
+                all of its pages, retries and rate limiter waits (see
+                ``fca_api.deadlines``). Paginated calls running out of time
+                return the pages fetched so far, marked ``partial``.
+            parse_offload_threshold: Optional number of items from which an
+                API page is converted into typed models in a worker thread
+                instead of on the event loop, so that validating large pages
+                does not delay other requests. On free-threaded Python
+                builds running without the GIL, pages of independent
+                records are additionally split into chunks of at least this
+                many items that are validated in parallel. Disabled by
+                default.
+            parse_executor: Optional thread pool used for offloaded
+                conversions; defaults to the event loop's default executor.
 
         Example:
             With email/key tuple::
@@ -165,10 +332,27 @@ class Client:
                     page_token_serializer=MyHmacSerializer(),
                 )
         """
-        self._client = raw_api.RawClient(credentials=credentials, api_limiter=api_limiter)
+        self._client = raw_api.RawClient(
+            credentials=credentials,
+            api_limiter=api_limiter,
+            circuit_breaker=circuit_breaker,
+            cache=cache,
+            metrics=metrics,
+            tracer=tracer,
+            hooks=hooks,
+            max_retries=max_retries,
+            retry_backoff=retry_backoff,
+        )
         self._lock = threading.Lock()
         self._ctx_enter_count = 0
         self._page_token_serializer = page_token_serializer
+        self._metrics = metrics
+        self._tracer = tracing.NOOP_TRACER if tracer is None else tracer
+        self._report_costs = report_costs
+        self._priority = priority
+        self._call_timeout = call_timeout
+        self._parse_offload_threshold = parse_offload_threshold
+        self._parse_executor = parse_executor
 
     async def __aenter__(self) -> "Client":
         with self._lock:
@@ -184,7 +368,23 @@ class Client:
 
     async def aclose(self) -> None:
         """Close the underlying HTTP session."""
-        await self._client.api_session.aclose()
+        await self._client.aclose()
+
+    def with_priority(self, priority: typing.Optional[str]) -> "Client":
+        """Return a view of this client whose calls use priority class
+        ``priority`` (see `fca_api.scheduling`).
+
+        The view shares this client's HTTP session and settings; close the
+        client, not the view.
+        """
+        view = copy.copy(self)
+        view._priority = priority
+        return view
+
+    @property
+    def priority(self) -> typing.Optional[str]:
+        """The priority class of the client's calls, if set."""
+        return self._priority
 
     @property
     def raw_client(self) -> raw_api.RawClient:
@@ -218,18 +418,135 @@ class Client:
     # Core pagination helper
     # ------------------------------------------------------------------
 
+    def _observes_validation(self) -> bool:
+        """Whether validation is reported to a metrics recorder, tracer or
+        cost tracker."""
+        return self._metrics is not None or self._tracer is not tracing.NOOP_TRACER or accounting.current() is not None
+
+    def _observe_validation(self, span: tracing.Span, out: list, duration: float) -> None:
+        """Report the validation of ``out`` in ``duration`` seconds to the
+        metrics recorder, tracer and active cost tracker."""
+        tracker = accounting.current()
+        if tracker is not None:
+            tracker.validation_time += duration
+        if out:
+            model = type(out[0])
+            model_name = f"{model.__module__.rpartition('.')[2]}.{model.__name__}"
+            span.set_attribute("fca_api.model", model_name)
+            span.set_attribute("fca_api.item_count", len(out))
+            if self._metrics is not None:
+                self._metrics.observe_validation(model_name, duration, len(out))
+
+    def _parse_data(self, parse_data_fn: typing.Callable[[typing.Any], list], data: typing.Any) -> list:
+        """Run ``parse_data_fn`` on an API data payload, reporting the
+        validation time of the resulting model type to the metrics recorder,
+        tracer and active cost tracker."""
+        if not self._observes_validation():
+            return parse_data_fn(data)
+        with self._tracer.start_as_current_span("fca_api.validate") as span:
+            started = time.perf_counter()
+            out = parse_data_fn(data)
+            self._observe_validation(span, out, time.perf_counter() - started)
+        return out
+
+    async def _parse_page_data(self, parse_data_fn: typing.Callable[[typing.Any], list], data: typing.Any) -> list:
+        """Run `_parse_data` on an API page, off the event loop if the page has
+        at least ``parse_offload_threshold`` items (see `_parse_off_loop`)."""
+        threshold = self._parse_offload_threshold
+        if threshold is None or len(data) < threshold:
+            return self._parse_data(parse_data_fn, data)
+        if not self._observes_validation():
+            return await self._parse_off_loop(parse_data_fn, data, threshold)
+        # Reported from the event loop, so that observers need not be thread-safe
+        with self._tracer.start_as_current_span("fca_api.validate") as span:
+            started = time.perf_counter()
+            out = await self._parse_off_loop(parse_data_fn, data, threshold)
+            self._observe_validation(span, out, time.perf_counter() - started)
+        return out
+
+    async def _parse_off_loop(
+        self, parse_data_fn: typing.Callable[[typing.Any], list], data: typing.Any, threshold: int
+    ) -> list:
+        """Run ``parse_data_fn`` on ``data`` in the parse executor.
+
+        On free-threaded Python builds running without the GIL, list pages
+        parsed item by item are split into chunks of at least ``threshold``
+        items, at most one per CPU, that are parsed in parallel.
+        """
+        loop = asyncio.get_running_loop()
+        chunk_count = min(os.cpu_count() or 1, len(data) // max(threshold, 1))
+        parallel = isinstance(parse_data_fn, _ItemParser) and isinstance(data, list) and not _gil_enabled()
+        if not parallel or chunk_count < 2:
+            return await loop.run_in_executor(self._parse_executor, parse_data_fn, data)
+        # Parse the first item here, so that lazily built validators are
+        # built once rather than concurrently by every worker
+        out = parse_data_fn(data[:1])
+        size = -(-(len(data) - 1) // chunk_count)
+        chunks = await asyncio.gather(
+            *(
+                loop.run_in_executor(self._parse_executor, parse_data_fn, data[start : start + size])
+                for start in range(1, len(data), size)
+            )
+        )
+        for chunk in chunks:
+            out.extend(chunk)
+        return out
+
+    def _validate_one(self, model: type[BaseSubclassT], data: dict) -> BaseSubclassT:
+        """Validate a single-object API payload as ``model``."""
+        return self._parse_data(lambda item: [model.model_validate(item)], data)[0]
+
+    async def _fetch_page(
+        self,
+        fetch_page_fn: typing.Callable[[int], typing.Awaitable[raw_api.FcaApiResponse]],
+        parse_data_fn: typing.Callable[[typing.Union[list, dict]], list],
+        page: int,
+        endpoint: typing.Optional[str],
+    ) -> tuple[typing.Optional[types.pagination.PaginatedResultInfo], list]:
+        """Fetch and parse a single API page.
+
+        Returns:
+            The page's pagination info (``None`` if the response carries
+            none) and its parsed items.
+        """
+        attributes: dict[str, typing.Union[str, int]] = {"fca_api.page": page}
+        if endpoint is not None:
+            attributes["fca_api.endpoint"] = endpoint
+        with self._tracer.start_as_current_span("fca_api.page", attributes=attributes) as span:
+            response = await fetch_page_fn(page)
+
+            # Parse result_info from the response (keys may be mixed-case; some endpoints
+            # return empty strings for page/per_page when no pagination applies)
+            info = None
+            if raw_info := response.result_info:
+                normalized = {k.lower().strip(): v for k, v in raw_info.items()}
+                if normalized.get("page"):
+                    info = types.pagination.PaginatedResultInfo.model_validate(raw_info)
+
+            # Parse data items
+            items = []
+            data = response.data
+            if data is not None:
+                assert isinstance(data, (list, dict))
+                items = await self._parse_page_data(parse_data_fn, data)
+            span.set_attribute("fca_api.item_count", len(items))
+        return info, items
+
     async def _fetch_paginated(
         self,
         fetch_page_fn: typing.Callable[[int], typing.Awaitable[raw_api.FcaApiResponse]],
         parse_data_fn: typing.Callable[[typing.Union[list, dict]], list],
         next_page: typing.Optional[types.pagination.NextPageToken],
         result_count: int,
+        endpoint: typing.Optional[str] = None,
     ) -> types.pagination.MultipageList:
         """Fetch one or more API pages and return a single MultipageList.
 
         Fetches pages starting from the position encoded in ``next_page``
         (or from page 1 if ``None``) until at least ``result_count`` items
-        are collected or there are no more pages.
+        are collected or there are no more pages. If the current deadline
+        passes after the first page, the pages fetched so far are returned,
+        marked ``partial``.
 
         Args:
             fetch_page_fn: Callable that fetches a raw API response for a
@@ -240,31 +557,37 @@ class Client:
                 the beginning.
             result_count: Minimum number of items to collect. The method
                 always fetches at least one API page regardless of this value.
+            endpoint: Name of the calling client method, under which the
+                number of fetched pages is reported to the metrics recorder.
 
         Returns:
             A MultipageList with the collected items and pagination metadata.
+
+        Raises:
+            FcaDeadlineExceededError: If the deadline passes before the
+                first page is fetched.
         """
         page_state = self._decode_next_page(next_page) if next_page is not None else types.pagination._PageState.first()
         current_page = page_state.page
         items: list = []
         last_info: typing.Optional[types.pagination.PaginatedResultInfo] = None
         has_next = False
+        pages = 0
+        partial = False
 
         while True:
-            response = await fetch_page_fn(current_page)
-
-            # Parse result_info from the response (keys may be mixed-case; some endpoints
-            # return empty strings for page/per_page when no pagination applies)
-            if raw_info := response.result_info:
-                normalized = {k.lower().strip(): v for k, v in raw_info.items()}
-                if normalized.get("page"):
-                    last_info = types.pagination.PaginatedResultInfo.model_validate(raw_info)
-
-            # Parse data items
-            data = response.data
-            if data is not None:
-                assert isinstance(data, (list, dict))
-                items.extend(parse_data_fn(data))
+            try:
+                page_info, page_items = await self._fetch_page(fetch_page_fn, parse_data_fn, current_page, endpoint)
+            except exc.FcaDeadlineExceededError:
+                if not pages:
+                    raise
+                # Resume from this page on the next call
+                partial = True
+                break
+            pages += 1
+            if page_info is not None:
+                last_info = page_info
+            items.extend(page_items)
 
             # Determine whether a next page exists
             has_next = last_info is not None and last_info.next is not None and last_info.page < last_info.total_pages
@@ -275,6 +598,9 @@ class Client:
 
             current_page += 1
 
+        if endpoint is not None and self._metrics is not None:
+            self._metrics.observe_pages(endpoint, pages)
+
         next_page_out: typing.Optional[types.pagination.NextPageToken] = None
         if has_next and last_info is not None:
             next_state = types.pagination._PageState(page=last_info.page + 1)
@@ -287,18 +613,34 @@ class Client:
                 next_page=next_page_out,
                 size=last_info.total_count if last_info is not None else None,
             ),
+            partial=partial,
         )
 
     # ------------------------------------------------------------------
     # Search endpoints
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _search_parser(
+        model: type[types.base.Base],
+        compact_model: type[types.compact.CompactSearchResultT],
+        compact: bool,
+    ) -> typing.Callable[[list[dict]], list]:
+        if compact:
+            return _ItemParser(compact_model.from_raw)
+        return _ItemParser(model.model_validate)
+
+    @_instrumented
     async def search_frn(
         self,
         firm_name: str,
         next_page: typing.Optional[types.pagination.NextPageToken] = None,
         result_count: int = 1,
-    ) -> types.pagination.MultipageList[types.search.FirmSearchResult]:
+        compact: bool = False,
+    ) -> typing.Union[
+        types.pagination.MultipageList[types.search.FirmSearchResult],
+        types.pagination.MultipageList[types.compact.CompactFirmSearchResult],
+    ]:
         """Search for firms by name.
 
         Args:
@@ -307,6 +649,9 @@ class Client:
             result_count: Minimum number of results to return. The client will
                 issue multiple underlying API calls if needed. Defaults to 1
                 (one API page).
+            compact: Return memory-efficient
+                ``types.compact.CompactFirmSearchResult`` records instead of
+                full models.
 
         Returns:
             A page of firm search results with pagination metadata.
@@ -325,61 +670,85 @@ class Client:
         """
         return await self._fetch_paginated(
             fetch_page_fn=lambda p: self._client.search_frn(firm_name, p),
-            parse_data_fn=lambda data: [types.search.FirmSearchResult.model_validate(item) for item in data],
+            parse_data_fn=self._search_parser(
+                types.search.FirmSearchResult, types.compact.CompactFirmSearchResult, compact
+            ),
             next_page=next_page,
             result_count=result_count,
+            endpoint="search_frn",
         )
 
+    @_instrumented
     async def search_irn(
         self,
         individual_name: str,
         next_page: typing.Optional[types.pagination.NextPageToken] = None,
         result_count: int = 1,
-    ) -> types.pagination.MultipageList[types.search.IndividualSearchResult]:
+        compact: bool = False,
+    ) -> typing.Union[
+        types.pagination.MultipageList[types.search.IndividualSearchResult],
+        types.pagination.MultipageList[types.compact.CompactIndividualSearchResult],
+    ]:
         """Search for individuals by name.
 
         Args:
             individual_name: Individual name to search for.
             next_page: Cursor from a previous call to continue pagination.
             result_count: Minimum number of results to return.
+            compact: Return memory-efficient
+                ``types.compact.CompactIndividualSearchResult`` records instead of full models.
 
         Returns:
             A page of individual search results with pagination metadata.
         """
         return await self._fetch_paginated(
             fetch_page_fn=lambda p: self._client.search_irn(individual_name, p),
-            parse_data_fn=lambda data: [types.search.IndividualSearchResult.model_validate(item) for item in data],
+            parse_data_fn=self._search_parser(
+                types.search.IndividualSearchResult, types.compact.CompactIndividualSearchResult, compact
+            ),
             next_page=next_page,
             result_count=result_count,
+            endpoint="search_irn",
         )
 
+    @_instrumented
     async def search_prn(
         self,
         fund_name: str,
         next_page: typing.Optional[types.pagination.NextPageToken] = None,
         result_count: int = 1,
-    ) -> types.pagination.MultipageList[types.search.FundSearchResult]:
+        compact: bool = False,
+    ) -> typing.Union[
+        types.pagination.MultipageList[types.search.FundSearchResult],
+        types.pagination.MultipageList[types.compact.CompactFundSearchResult],
+    ]:
         """Search for funds by name.
 
         Args:
             fund_name: Fund name to search for.
             next_page: Cursor from a previous call to continue pagination.
             result_count: Minimum number of results to return.
+            compact: Return memory-efficient
+                ``types.compact.CompactFundSearchResult`` records instead of full models.
 
         Returns:
             A page of fund search results with pagination metadata.
         """
         return await self._fetch_paginated(
             fetch_page_fn=lambda p: self._client.search_prn(fund_name, p),
-            parse_data_fn=lambda data: [types.search.FundSearchResult.model_validate(item) for item in data],
+            parse_data_fn=self._search_parser(
+                types.search.FundSearchResult, types.compact.CompactFundSearchResult, compact
+            ),
             next_page=next_page,
             result_count=result_count,
+            endpoint="search_prn",
         )
 
     # ------------------------------------------------------------------
     # Firm detail endpoints
     # ------------------------------------------------------------------
 
+    @_instrumented
     async def get_firm(self, frn: str) -> types.firm.FirmDetails:
         """Get comprehensive firm details by FRN.
 
@@ -392,7 +761,7 @@ class Client:
         res = await self._client.get_firm(frn)
         data = res.data
         assert isinstance(data, list) and len(data) == 1, "Expected a single firm detail object in the response data."
-        return types.firm.FirmDetails.model_validate(data[0])
+        return self._validate_one(types.firm.FirmDetails, data[0])
 
     def _parse_firm_names_pg(self, data: list[dict]) -> list[types.firm.FirmNameAlias]:
         out = []
@@ -415,6 +784,7 @@ class Client:
 
         return [types.firm.FirmNameAlias.model_validate(el) for el in out]
 
+    @_instrumented
     async def get_firm_names(
         self,
         frn: str,
@@ -436,6 +806,7 @@ class Client:
             parse_data_fn=self._parse_firm_names_pg,
             next_page=next_page,
             result_count=result_count,
+            endpoint="get_firm_names",
         )
 
     def _parse_firm_addresses_pg(self, data: list[dict]) -> list[types.firm.FirmAddress]:
@@ -454,6 +825,7 @@ class Client:
             raw_row["address_lines"] = [line for _idx, line in sorted(address_lines, key=lambda x: x[0])]
         return [types.firm.FirmAddress.model_validate(item) for item in data]
 
+    @_instrumented
     async def get_firm_addresses(
         self,
         frn: str,
@@ -475,6 +847,7 @@ class Client:
             parse_data_fn=self._parse_firm_addresses_pg,
             next_page=next_page,
             result_count=result_count,
+            endpoint="get_firm_addresses",
         )
 
     def _parse_firm_controlled_functions_pg(self, data: list[dict]) -> list[types.firm.FirmControlledFunction]:
@@ -499,6 +872,7 @@ class Client:
                     out_items.append(types.firm.FirmControlledFunction.model_validate(item_data | subvalue))
         return out_items
 
+    @_instrumented
     async def get_firm_controlled_functions(
         self,
         frn: str,
@@ -520,8 +894,10 @@ class Client:
             parse_data_fn=self._parse_firm_controlled_functions_pg,
             next_page=next_page,
             result_count=result_count,
+            endpoint="get_firm_controlled_functions",
         )
 
+    @_instrumented
     async def get_firm_individuals(
         self,
         frn: str,
@@ -540,9 +916,10 @@ class Client:
         """
         return await self._fetch_paginated(
             fetch_page_fn=lambda p: self._client.get_firm_individuals(frn, page=p),
-            parse_data_fn=lambda data: [types.firm.FirmIndividual.model_validate(item) for item in data],
+            parse_data_fn=_ItemParser(types.firm.FirmIndividual.model_validate),
             next_page=next_page,
             result_count=result_count,
+            endpoint="get_firm_individuals",
         )
 
     def _parse_firm_permissions_pg(self, data: dict) -> list[types.firm.FirmPermission]:
@@ -575,6 +952,7 @@ class Client:
             out.append(types.firm.FirmPermission.model_validate(perm_record))
         return out
 
+    @_instrumented
     async def get_firm_permissions(
         self,
         frn: str,
@@ -596,8 +974,10 @@ class Client:
             parse_data_fn=self._parse_firm_permissions_pg,
             next_page=next_page,
             result_count=result_count,
+            endpoint="get_firm_permissions",
         )
 
+    @_instrumented
     async def get_firm_requirements(
         self,
         frn: str,
@@ -616,11 +996,13 @@ class Client:
         """
         return await self._fetch_paginated(
             fetch_page_fn=lambda p: self._client.get_firm_requirements(frn, page=p),
-            parse_data_fn=lambda data: [types.firm.FirmRequirement.model_validate(row) for row in data],
+            parse_data_fn=_ItemParser(types.firm.FirmRequirement.model_validate),
             next_page=next_page,
             result_count=result_count,
+            endpoint="get_firm_requirements",
         )
 
+    @_instrumented
     async def get_firm_requirement_investment_types(
         self,
         frn: str,
@@ -641,11 +1023,13 @@ class Client:
         """
         return await self._fetch_paginated(
             fetch_page_fn=lambda p: self._client.get_firm_requirement_investment_types(frn, req_ref, page=p),
-            parse_data_fn=lambda data: [types.firm.FirmRequirementInvestmentType.model_validate(row) for row in data],
+            parse_data_fn=_ItemParser(types.firm.FirmRequirementInvestmentType.model_validate),
             next_page=next_page,
             result_count=result_count,
+            endpoint="get_firm_requirement_investment_types",
         )
 
+    @_instrumented
     async def get_firm_regulators(
         self,
         frn: str,
@@ -664,9 +1048,10 @@ class Client:
         """
         return await self._fetch_paginated(
             fetch_page_fn=lambda p: self._client.get_firm_regulators(frn, page=p),
-            parse_data_fn=lambda data: [types.firm.FirmRegulator.model_validate(item) for item in data],
+            parse_data_fn=_ItemParser(types.firm.FirmRegulator.model_validate),
             next_page=next_page,
             result_count=result_count,
+            endpoint="get_firm_regulators",
         )
 
     def _parse_firm_passports_pg(self, data: list[dict]) -> list[types.firm.FirmPassport]:
@@ -685,6 +1070,7 @@ class Client:
                     logger.warning(f"Unexpected firm passport entry field: {key}={value!r}")
         return out
 
+    @_instrumented
     async def get_firm_passports(
         self,
         frn: str,
@@ -706,8 +1092,10 @@ class Client:
             parse_data_fn=self._parse_firm_passports_pg,
             next_page=next_page,
             result_count=result_count,
+            endpoint="get_firm_passports",
         )
 
+    @_instrumented
     async def get_firm_passport_permissions(
         self,
         frn: str,
@@ -728,11 +1116,13 @@ class Client:
         """
         return await self._fetch_paginated(
             fetch_page_fn=lambda p: self._client.get_firm_passport_permissions(frn, country, page=p),
-            parse_data_fn=lambda data: [types.firm.FirmPassportPermission.model_validate(item) for item in data],
+            parse_data_fn=_ItemParser(types.firm.FirmPassportPermission.model_validate),
             next_page=next_page,
             result_count=result_count,
+            endpoint="get_firm_passport_permissions",
         )
 
+    @_instrumented
     async def get_firm_waivers(
         self,
         frn: str,
@@ -751,11 +1141,13 @@ class Client:
         """
         return await self._fetch_paginated(
             fetch_page_fn=lambda p: self._client.get_firm_waivers(frn, page=p),
-            parse_data_fn=lambda data: [types.firm.FirmWaiver.model_validate(item) for item in data],
+            parse_data_fn=_ItemParser(types.firm.FirmWaiver.model_validate),
             next_page=next_page,
             result_count=result_count,
+            endpoint="get_firm_waivers",
         )
 
+    @_instrumented
     async def get_firm_exclusions(
         self,
         frn: str,
@@ -774,11 +1166,13 @@ class Client:
         """
         return await self._fetch_paginated(
             fetch_page_fn=lambda p: self._client.get_firm_exclusions(frn, page=p),
-            parse_data_fn=lambda data: [types.firm.FirmExclusion.model_validate(item) for item in data],
+            parse_data_fn=_ItemParser(types.firm.FirmExclusion.model_validate),
             next_page=next_page,
             result_count=result_count,
+            endpoint="get_firm_exclusions",
         )
 
+    @_instrumented
     async def get_firm_disciplinary_history(
         self,
         frn: str,
@@ -797,9 +1191,10 @@ class Client:
         """
         return await self._fetch_paginated(
             fetch_page_fn=lambda p: self._client.get_firm_disciplinary_history(frn, page=p),
-            parse_data_fn=lambda data: [types.firm.FirmDisciplinaryRecord.model_validate(item) for item in data],
+            parse_data_fn=_ItemParser(types.firm.FirmDisciplinaryRecord.model_validate),
             next_page=next_page,
             result_count=result_count,
+            endpoint="get_firm_disciplinary_history",
         )
 
     def _parse_firm_appointed_representatives_pg(
@@ -819,6 +1214,7 @@ class Client:
                 out.append(types.firm.FirmAppointedRepresentative.model_validate({"fca_api_lst_type": key} | item))
         return out
 
+    @_instrumented
     async def get_firm_appointed_representatives(
         self,
         frn: str,
@@ -840,12 +1236,14 @@ class Client:
             parse_data_fn=self._parse_firm_appointed_representatives_pg,
             next_page=next_page,
             result_count=result_count,
+            endpoint="get_firm_appointed_representatives",
         )
 
     # ------------------------------------------------------------------
     # Individual endpoints
     # ------------------------------------------------------------------
 
+    @_instrumented
     async def get_individual(self, irn: str) -> types.individual.Individual:
         """Get individual details by IRN.
 
@@ -860,7 +1258,7 @@ class Client:
         assert isinstance(data, list) and len(data) == 1, (
             "Expected a single individual detail object in the response data."
         )
-        return types.individual.Individual.model_validate(data[0]["Details"])
+        return self._validate_one(types.individual.Individual, data[0]["Details"])
 
     def _parse_individual_controlled_functions_pg(
         self, data: list[dict]
@@ -891,6 +1289,7 @@ class Client:
                     )
         return out
 
+    @_instrumented
     async def get_individual_controlled_functions(
         self,
         irn: str,
@@ -912,8 +1311,10 @@ class Client:
             parse_data_fn=self._parse_individual_controlled_functions_pg,
             next_page=next_page,
             result_count=result_count,
+            endpoint="get_individual_controlled_functions",
         )
 
+    @_instrumented
     async def get_individual_disciplinary_history(
         self,
         irn: str,
@@ -932,17 +1333,17 @@ class Client:
         """
         return await self._fetch_paginated(
             fetch_page_fn=lambda p: self._client.get_individual_disciplinary_history(irn, page=p),
-            parse_data_fn=lambda data: [
-                types.individual.IndividualDisciplinaryRecord.model_validate(item) for item in data
-            ],
+            parse_data_fn=_ItemParser(types.individual.IndividualDisciplinaryRecord.model_validate),
             next_page=next_page,
             result_count=result_count,
+            endpoint="get_individual_disciplinary_history",
         )
 
     # ------------------------------------------------------------------
     # Fund endpoints
     # ------------------------------------------------------------------
 
+    @_instrumented
     async def get_fund(self, prn: str) -> types.products.ProductDetails:
         """Get fund details by PRN.
 
@@ -955,8 +1356,9 @@ class Client:
         res = await self._client.get_fund(prn)
         data = res.data
         assert isinstance(data, list) and len(data) == 1, "Expected a single fund detail object in the response data."
-        return types.products.ProductDetails.model_validate(data[0])
+        return self._validate_one(types.products.ProductDetails, data[0])
 
+    @_instrumented
     async def get_fund_names(
         self,
         prn: str,
@@ -975,11 +1377,13 @@ class Client:
         """
         return await self._fetch_paginated(
             fetch_page_fn=lambda p: self._client.get_fund_names(prn, page=p),
-            parse_data_fn=lambda data: [types.products.ProductNameAlias.model_validate(item) for item in data],
+            parse_data_fn=_ItemParser(types.products.ProductNameAlias.model_validate),
             next_page=next_page,
             result_count=result_count,
+            endpoint="get_fund_names",
         )
 
+    @_instrumented
     async def get_fund_subfunds(
         self,
         prn: str,
@@ -998,15 +1402,17 @@ class Client:
         """
         return await self._fetch_paginated(
             fetch_page_fn=lambda p: self._client.get_fund_subfunds(prn, page=p),
-            parse_data_fn=lambda data: [types.products.SubFundDetails.model_validate(item) for item in data],
+            parse_data_fn=_ItemParser(types.products.SubFundDetails.model_validate),
             next_page=next_page,
             result_count=result_count,
+            endpoint="get_fund_subfunds",
         )
 
     # ------------------------------------------------------------------
     # Market endpoints
     # ------------------------------------------------------------------
 
+    @_instrumented
     async def get_regulated_markets(
         self,
         next_page: typing.Optional[types.pagination.NextPageToken] = None,
@@ -1023,7 +1429,8 @@ class Client:
         """
         return await self._fetch_paginated(
             fetch_page_fn=lambda p: self._client.get_regulated_markets(page=p),
-            parse_data_fn=lambda data: [types.markets.RegulatedMarket.model_validate(item) for item in data],
+            parse_data_fn=_ItemParser(types.markets.RegulatedMarket.model_validate),
             next_page=next_page,
             result_count=result_count,
+            endpoint="get_regulated_markets",
         )
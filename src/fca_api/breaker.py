@@ -0,0 +1,283 @@
+"""Circuit breaker for the FCA Register upstream.
+
+When the FS Register degrades, continuing to send requests only piles up
+timeouts in every caller and slows the register's recovery. The
+`CircuitBreaker` in this module tracks recent outcomes per endpoint family
+(see `fca_api.const.EndpointFamily`) and short-circuits requests to a
+family that is failing.
+
+Each family has an independent three-state machine:
+
+- **closed**: requests flow normally; outcomes are recorded in a sliding
+  time window.
+- **open**: entered when, over the window, either the failure rate or the
+  slow-call rate reaches its threshold. Requests fail fast with
+  `fca_api.exc.FcaCircuitOpenError` without touching the network.
+- **half-open**: entered once ``open_duration`` has elapsed. A limited
+  number of probe requests is let through; if they all succeed the circuit
+  closes, and any failure re-opens it.
+
+Only upstream failures count against a family: transport errors, HTTP 429
+and 5xx responses, and FCA system error status codes (``FSR-API-99-*``).
+Client-side problems such as an invalid FRN do not trip the breaker.
+
+Example:
+    Attaching a breaker to the high-level client::
+
+        import fca_api
+
+        breaker = fca_api.breaker.CircuitBreaker(
+            failure_rate_threshold=0.5,
+            slow_call_duration=5.0,
+            open_duration=30.0,
+        )
+        client = fca_api.async_api.Client(
+            credentials=("email@example.com", "api_key"),
+            circuit_breaker=breaker,
+        )
+
+        try:
+            firm = await client.get_firm("123456")
+        except fca_api.exc.FcaCircuitOpenError:
+            # The Firm endpoints are currently unhealthy
+            ...
+"""
+
+import collections
+import dataclasses
+import enum
+import logging
+import time
+import typing
+
+from . import const, exc
+
+logger = logging.getLogger(__name__)
+
+
+@enum.unique
+class CircuitState(enum.StrEnum):
+    """States of a single circuit."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Admission:
+    """A request admitted by `CircuitBreaker.before_request`.
+
+    Passing it back with the request's outcome lets the breaker ignore
+    requests admitted before the circuit last changed state.
+
+    Attributes:
+        family: The endpoint family of the request.
+        epoch: The circuit's epoch when the request was admitted.
+        probe: Whether the request is a half-open probe.
+    """
+
+    family: const.EndpointFamily
+    epoch: int
+    probe: bool = False
+
+
+@dataclasses.dataclass(slots=True)
+class _Circuit:
+    """Mutable per-family circuit state."""
+
+    state: CircuitState = CircuitState.CLOSED
+    #: Incremented whenever the circuit opens or closes
+    epoch: int = 0
+    #: ``(timestamp, failed, slow)`` outcomes within the sliding window
+    outcomes: collections.deque = dataclasses.field(default_factory=collections.deque)
+    opened_at: float = 0.0
+    half_open_in_flight: int = 0
+    half_open_successes: int = 0
+
+
+class CircuitBreaker:
+    """Per-endpoint-family circuit breaker.
+
+    The breaker is driven by `RawClient` through calls made around every
+    upstream request: `before_request`, then one of `record_success`,
+    `record_failure` or `release`, given the `Admission` returned by
+    `before_request`. It is designed for use from a single event loop and
+    performs no locking.
+
+    Args:
+        failure_rate_threshold: Fraction (0-1] of failed calls in the window
+            at which the circuit opens.
+        slow_call_rate_threshold: Fraction (0-1] of slow calls in the window
+            at which the circuit opens.
+        slow_call_duration: Latency in seconds above which a call counts as
+            slow, or ``None`` to ignore latency.
+        window: Length of the sliding window in seconds.
+        minimum_calls: Minimum number of calls in the window before the
+            rates are evaluated.
+        open_duration: Seconds the circuit stays open before allowing
+            half-open probes.
+        half_open_max_calls: Number of successful probes required to close
+            the circuit again; also the maximum number of concurrent probes.
+        clock: Monotonic time source, overridable for testing.
+    """
+
+    def __init__(
+        self,
+        failure_rate_threshold: float = 0.5,
+        slow_call_rate_threshold: float = 1.0,
+        slow_call_duration: typing.Optional[float] = 10.0,
+        window: float = 60.0,
+        minimum_calls: int = 10,
+        open_duration: float = 30.0,
+        half_open_max_calls: int = 1,
+        clock: typing.Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not 0 < failure_rate_threshold <= 1:
+            raise ValueError(f"failure_rate_threshold must be in (0, 1], got {failure_rate_threshold!r}")
+        if not 0 < slow_call_rate_threshold <= 1:
+            raise ValueError(f"slow_call_rate_threshold must be in (0, 1], got {slow_call_rate_threshold!r}")
+        if minimum_calls < 1 or half_open_max_calls < 1:
+            raise ValueError("minimum_calls and half_open_max_calls must be positive integers.")
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.slow_call_duration = slow_call_duration
+        self.window = window
+        self.minimum_calls = minimum_calls
+        self.open_duration = open_duration
+        self.half_open_max_calls = half_open_max_calls
+        self._clock = clock
+        self._circuits: dict[const.EndpointFamily, _Circuit] = {family: _Circuit() for family in const.EndpointFamily}
+
+    def state(self, family: const.EndpointFamily) -> CircuitState:
+        """Return the current state of the circuit for ``family``.
+
+        An open circuit whose ``open_duration`` has elapsed is reported as
+        half-open.
+        """
+        circuit = self._circuits[family]
+        self._maybe_half_open(circuit)
+        return circuit.state
+
+    def reset(self, family: typing.Optional[const.EndpointFamily] = None) -> None:
+        """Force the circuit for ``family`` (or all families) back to closed."""
+        families = [family] if family is not None else list(self._circuits)
+        for el in families:
+            self._circuits[el] = _Circuit(epoch=self._circuits[el].epoch + 1)
+
+    def before_request(self, family: const.EndpointFamily) -> Admission:
+        """Admit or reject a request to ``family``.
+
+        Returns:
+            The admission, to pass back with the request's outcome.
+
+        Raises:
+            FcaCircuitOpenError: If the circuit is open, or half-open with
+                all probe slots already taken.
+        """
+        circuit = self._circuits[family]
+        self._maybe_half_open(circuit)
+        if circuit.state is CircuitState.OPEN:
+            retry_after = max(0.0, circuit.opened_at + self.open_duration - self._clock())
+            raise exc.FcaCircuitOpenError(family, retry_after)
+        if circuit.state is CircuitState.HALF_OPEN:
+            if circuit.half_open_in_flight >= self.half_open_max_calls:
+                raise exc.FcaCircuitOpenError(family, 0.0)
+            circuit.half_open_in_flight += 1
+            return Admission(family, circuit.epoch, probe=True)
+        return Admission(family, circuit.epoch)
+
+    def record_success(
+        self,
+        family: const.EndpointFamily,
+        duration: float,
+        admission: typing.Optional[Admission] = None,
+    ) -> None:
+        """Record a completed upstream call that took ``duration`` seconds.
+
+        Without ``admission``, the call is attributed to the circuit's
+        current state: while half-open, it counts as a probe.
+        """
+        slow = self.slow_call_duration is not None and duration >= self.slow_call_duration
+        self._record(family, admission, failed=False, slow=slow)
+
+    def record_failure(
+        self,
+        family: const.EndpointFamily,
+        duration: float,
+        admission: typing.Optional[Admission] = None,
+    ) -> None:
+        """Record a failed upstream call that took ``duration`` seconds.
+
+        ``admission`` is used as for `record_success`.
+        """
+        self._record(family, admission, failed=True, slow=False)
+
+    def release(self, family: const.EndpointFamily, admission: typing.Optional[Admission] = None) -> None:
+        """Release an admitted request that was aborted without an outcome,
+        e.g. because the calling task was cancelled.
+
+        ``admission`` is used as for `record_success`.
+        """
+        circuit = self._circuits[family]
+        if circuit.state is CircuitState.HALF_OPEN and self._is_probe(circuit, admission):
+            circuit.half_open_in_flight = max(0, circuit.half_open_in_flight - 1)
+
+    @staticmethod
+    def _is_probe(circuit: _Circuit, admission: typing.Optional[Admission]) -> bool:
+        """Whether a request is a probe of the circuit's current half-open state."""
+        return admission is None or (admission.probe and admission.epoch == circuit.epoch)
+
+    def _record(
+        self,
+        family: const.EndpointFamily,
+        admission: typing.Optional[Admission],
+        failed: bool,
+        slow: bool,
+    ) -> None:
+        circuit = self._circuits[family]
+        if admission is not None and admission.epoch != circuit.epoch:
+            # Admitted before the circuit last opened or closed, so the
+            # outcome says nothing about its current state
+            return
+        now = self._clock()
+        if circuit.state is CircuitState.HALF_OPEN:
+            if not self._is_probe(circuit, admission):
+                return
+            circuit.half_open_in_flight = max(0, circuit.half_open_in_flight - 1)
+            if failed or slow:
+                self._open(family, circuit, now)
+            else:
+                circuit.half_open_successes += 1
+                if circuit.half_open_successes >= self.half_open_max_calls:
+                    logger.info(f"Circuit for {family} endpoints closed after successful probes")
+                    self._circuits[family] = _Circuit(epoch=circuit.epoch + 1)
+            return
+        if circuit.state is CircuitState.OPEN:
+            # A request admitted before the circuit opened has completed
+            return
+
+        circuit.outcomes.append((now, failed, slow))
+        cutoff = now - self.window
+        while circuit.outcomes and circuit.outcomes[0][0] < cutoff:
+            circuit.outcomes.popleft()
+        total = len(circuit.outcomes)
+        if total < self.minimum_calls:
+            return
+        failures = sum(1 for _ts, el_failed, _slow in circuit.outcomes if el_failed)
+        slow_calls = sum(1 for _ts, _failed, el_slow in circuit.outcomes if el_slow)
+        if failures / total >= self.failure_rate_threshold or slow_calls / total >= self.slow_call_rate_threshold:
+            self._open(family, circuit, now)
+
+    def _open(self, family: const.EndpointFamily, circuit: _Circuit, now: float) -> None:
+        logger.warning(f"Circuit for {family} endpoints opened for {self.open_duration}s")
+        circuit.state = CircuitState.OPEN
+        circuit.epoch += 1
+        circuit.opened_at = now
+        circuit.outcomes.clear()
+        circuit.half_open_in_flight = 0
+        circuit.half_open_successes = 0
+
+    def _maybe_half_open(self, circuit: _Circuit) -> None:
+        if circuit.state is CircuitState.OPEN and self._clock() - circuit.opened_at >= self.open_duration:
+            circuit.state = CircuitState.HALF_OPEN
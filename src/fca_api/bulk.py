@@ -0,0 +1,363 @@
+"""Multi-process bulk fetching with a shared, cross-process rate limit.
+
+A single asyncio process spends most of a bulk refresh decoding JSON and
+validating pydantic models, and saturates one CPU core long before it gets
+near the API quota. `run_bulk` instead shards a list of reference numbers
+across worker processes, each running its own `fca_api.async_api.Client`
+and event loop. Results stream back over a queue to the calling process,
+which acts as the single writer.
+
+To keep the *aggregate* request rate under the FCA quota, every worker's
+client is throttled by the same `SqliteTokenBucket`. This is a token bucket
+whose state lives in a local SQLite database, so any number of processes
+on the same host can share it.
+
+Example:
+    Fetching firm details with four processes::
+
+        import fca_api.bulk
+
+        with open("firms.ndjson", "w") as out:
+            summary = fca_api.bulk.run_bulk(
+                frns,
+                "get_firm",
+                credentials=("email@example.com", "api_key"),
+                write=lambda result: out.write(result.value.model_dump_json() + "\\n"),
+                processes=4,
+            )
+        print(f"{summary.succeeded} fetched, {summary.failed} failed")
+
+    The fetch may also be a module-level coroutine function taking the client
+    and a reference number, for example to gather several sub-resources::
+
+        async def fetch_firm_bundle(client, frn):
+            return (await client.get_firm(frn), await client.get_firm_permissions(frn))
+"""
+
+import asyncio
+import contextlib
+import dataclasses
+import functools
+import logging
+import multiprocessing
+import os
+import pathlib
+import queue
+import sqlite3
+import tempfile
+import threading
+import time
+import typing
+
+from . import async_api, concurrency, raw_api
+
+logger = logging.getLogger(__name__)
+
+T = typing.TypeVar("T")
+FetchT = typing.Union[str, typing.Callable[[async_api.Client, str], typing.Awaitable[typing.Any]]]
+ClientFactoryT = typing.Callable[[raw_api.LimiterContextT], async_api.Client]
+
+
+class SqliteTokenBucket:
+    """Token-bucket rate limiter shared between processes via SQLite.
+
+    Instances are usable as the ``api_limiter`` of a client: calling one
+    returns an async context manager that waits for a token. All instances
+    pointing at the same database file, in any process on the host, draw
+    from the same bucket.
+
+    The bucket holds at most ``burst`` tokens and refills at ``rate`` tokens
+    every ``per`` seconds, so at most ``rate + burst`` requests start in any
+    ``per``-second window. The defaults keep within the FCA limit of 50
+    requests per 10 seconds.
+
+    Args:
+        path: Path of the SQLite database holding the bucket state. It is
+            created if missing.
+        rate: Tokens added every ``per`` seconds.
+        per: Refill period in seconds.
+        burst: Bucket capacity.
+
+    Example::
+
+        limiter = SqliteTokenBucket("/tmp/fca-api-limiter.sqlite3")
+        client = fca_api.async_api.Client(credentials=..., api_limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        path: typing.Union[str, os.PathLike],
+        rate: float = 45,
+        per: float = 10.0,
+        burst: float = 5,
+    ) -> None:
+        if rate <= 0 or per <= 0 or burst < 1:
+            raise ValueError("rate and per must be positive, and burst at least 1.")
+        self.path = pathlib.Path(path)
+        self.rate = rate
+        self.per = per
+        self.burst = burst
+        self._lock = threading.Lock()
+        self._conn: typing.Optional[sqlite3.Connection] = None
+        self._conn_pid: typing.Optional[int] = None
+
+    def __call__(self) -> typing.AsyncContextManager[None]:
+        return self._acquire_ctx()
+
+    def close(self) -> None:
+        """Close this process's connection to the bucket database."""
+        with self._lock:
+            if self._conn is not None and self._conn_pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+            self._conn_pid = None
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["_lock"], state["_conn"], state["_conn_pid"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._conn = None
+        self._conn_pid = None
+
+    @contextlib.asynccontextmanager
+    async def _acquire_ctx(self) -> typing.AsyncIterator[None]:
+        await self.acquire()
+        yield
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        while True:
+            wait = await asyncio.to_thread(self.try_acquire)
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    def try_acquire(self) -> float:
+        """Take a token if one is available, without waiting.
+
+        Returns:
+            ``0.0`` if a token was taken, otherwise the number of seconds
+            until one is expected to become available.
+        """
+        refill_per_second = self.rate / self.per
+        with self._lock:
+            conn = self._connection()
+            now = time.time()
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                tokens, updated_at = conn.execute("SELECT tokens, updated_at FROM bucket WHERE id = 0").fetchone()
+                tokens = min(self.burst, tokens + max(0.0, now - updated_at) * refill_per_second)
+                if tokens >= 1:
+                    tokens -= 1
+                    wait = 0.0
+                else:
+                    wait = (1 - tokens) / refill_per_second
+                conn.execute("UPDATE bucket SET tokens = ?, updated_at = ? WHERE id = 0", (tokens, now))
+        return wait
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None or self._conn_pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30.0, isolation_level=None, check_same_thread=False)
+            conn.execute("CREATE TABLE IF NOT EXISTS bucket (id INTEGER PRIMARY KEY, tokens REAL, updated_at REAL)")
+            conn.execute(
+                "INSERT OR IGNORE INTO bucket (id, tokens, updated_at) VALUES (0, ?, ?)",
+                (self.burst, time.time()),
+            )
+            self._conn = conn
+            self._conn_pid = os.getpid()
+        return self._conn
+
+
+@dataclasses.dataclass(frozen=True)
+class BulkResult(typing.Generic[T]):
+    """The outcome of fetching a single reference number.
+
+    Attributes:
+        ref_number: The reference number that was fetched.
+        value: The fetched value, or ``None`` if the fetch failed.
+        error: A description of the failure, or ``None`` on success.
+    """
+
+    ref_number: str
+    value: typing.Optional[T] = None
+    error: typing.Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the fetch succeeded."""
+        return self.error is None
+
+
+@dataclasses.dataclass(frozen=True)
+class BulkSummary:
+    """Totals for a completed `run_bulk` call."""
+
+    succeeded: int
+    failed: int
+    duration: float
+
+
+def default_client_factory(
+    api_limiter: raw_api.LimiterContextT,
+    credentials: typing.Tuple[str, str],
+) -> async_api.Client:
+    """Create a worker's client from ``(email, api_key)`` credentials."""
+    return async_api.Client(credentials=credentials, api_limiter=api_limiter)
+
+
+def run_bulk(
+    ref_numbers: typing.Iterable[str],
+    fetch: FetchT,
+    write: typing.Callable[[BulkResult], None],
+    credentials: typing.Optional[typing.Tuple[str, str]] = None,
+    client_factory: typing.Optional[ClientFactoryT] = None,
+    processes: typing.Optional[int] = None,
+    concurrency: int = 4,
+    adaptive: bool = False,
+    limiter: typing.Optional[SqliteTokenBucket] = None,
+    mp_context: typing.Optional[multiprocessing.context.BaseContext] = None,
+) -> BulkSummary:
+    """Fetch ``ref_numbers`` across a pool of worker processes.
+
+    Args:
+        ref_numbers: Reference numbers to fetch.
+        fetch: Either the name of a `fca_api.async_api.Client` method taking
+            a single reference number (e.g. ``"get_firm"``), or a picklable
+            (module-level) coroutine function ``fetch(client, ref_number)``.
+        write: Called in this process with each `BulkResult`, in completion
+            order. It is the only writer, so it needs no locking.
+        credentials: ``(email, api_key)`` used to create each worker's client.
+        client_factory: Alternatively, a picklable callable creating a
+            worker's client from the shared ``api_limiter``.
+        processes: Number of worker processes. Defaults to the CPU count.
+        concurrency: Maximum concurrent fetches within each worker.
+        adaptive: Whether each worker adapts its number of concurrent
+            requests, up to ``concurrency``, to upstream latency and errors
+            with a `fca_api.concurrency.AdaptiveLimiter` wrapping ``limiter``.
+        limiter: Shared rate limiter. Defaults to a `SqliteTokenBucket` in a
+            temporary directory, removed afterwards.
+        mp_context: Multiprocessing context used to start the workers.
+
+    Returns:
+        Totals for the run.
+
+    Raises:
+        ValueError: If neither ``credentials`` nor ``client_factory`` is given.
+        RuntimeError: If a worker process dies unexpectedly.
+    """
+    if client_factory is None:
+        if credentials is None:
+            raise ValueError("Either credentials or client_factory must be provided.")
+        client_factory = functools.partial(default_client_factory, credentials=credentials)
+    ref_numbers = list(ref_numbers)
+    processes = max(1, min(processes or os.cpu_count() or 1, len(ref_numbers)))
+    mp_context = mp_context or multiprocessing.get_context()
+
+    with contextlib.ExitStack() as stack:
+        if limiter is None:
+            tmp_dir = stack.enter_context(tempfile.TemporaryDirectory(prefix="fca-api-bulk-"))
+            limiter = SqliteTokenBucket(pathlib.Path(tmp_dir) / "limiter.sqlite3")
+            stack.callback(limiter.close)
+        started = time.monotonic()
+        results = mp_context.Queue()
+        workers = [
+            mp_context.Process(
+                target=_worker,
+                args=(ref_numbers[idx::processes], fetch, client_factory, limiter, concurrency, adaptive, results),
+                name=f"fca-api-bulk-{idx}",
+                daemon=True,
+            )
+            for idx in range(processes)
+        ]
+        for worker in workers:
+            worker.start()
+        try:
+            succeeded, failed = _drain(results, workers, write)
+        finally:
+            for worker in workers:
+                if worker.is_alive():
+                    worker.terminate()
+                worker.join()
+        return BulkSummary(succeeded=succeeded, failed=failed, duration=time.monotonic() - started)
+
+
+def _drain(
+    results: multiprocessing.Queue,
+    workers: list[multiprocessing.process.BaseProcess],
+    write: typing.Callable[[BulkResult], None],
+) -> tuple[int, int]:
+    succeeded = failed = 0
+    running = {worker.name for worker in workers}
+    while running:
+        try:
+            message = results.get(timeout=0.5)
+        except queue.Empty:
+            for worker in workers:
+                if worker.name in running and worker.exitcode not in (None, 0):
+                    raise RuntimeError(f"Bulk worker {worker.name} exited with code {worker.exitcode}.") from None
+            continue
+        if isinstance(message, BulkResult):
+            if message.ok:
+                succeeded += 1
+            else:
+                failed += 1
+            write(message)
+        else:
+            running.discard(message)
+    return succeeded, failed
+
+
+def _worker(
+    ref_numbers: list[str],
+    fetch: FetchT,
+    client_factory: ClientFactoryT,
+    limiter: SqliteTokenBucket,
+    max_concurrency: int,
+    adaptive: bool,
+    results: multiprocessing.Queue,
+) -> None:
+    asyncio.run(_worker_main(ref_numbers, fetch, client_factory, limiter, max_concurrency, adaptive, results))
+    results.put(multiprocessing.current_process().name)
+
+
+async def _worker_main(
+    ref_numbers: list[str],
+    fetch: FetchT,
+    client_factory: ClientFactoryT,
+    limiter: SqliteTokenBucket,
+    max_concurrency: int,
+    adaptive: bool,
+    results: multiprocessing.Queue,
+) -> None:
+    semaphore = asyncio.Semaphore(max_concurrency)
+    api_limiter: raw_api.LimiterContextT = limiter
+    if adaptive:
+        api_limiter = concurrency.AdaptiveLimiter(
+            limiter,
+            initial_limit=min(4, max_concurrency),
+            max_limit=max_concurrency,
+            name=multiprocessing.current_process().name,
+        )
+
+    async def fetch_one(client: async_api.Client, ref_number: str) -> None:
+        async with semaphore:
+            try:
+                if isinstance(fetch, str):
+                    value = await getattr(client, fetch)(ref_number)
+                else:
+                    value = await fetch(client, ref_number)
+            except Exception as e:
+                logger.warning(f"Bulk fetch of {ref_number!r} failed: {e!r}")
+                results.put(BulkResult(ref_number=ref_number, error=repr(e)))
+            else:
+                results.put(BulkResult(ref_number=ref_number, value=value))
+
+    try:
+        async with client_factory(api_limiter) as client:
+            await asyncio.gather(*(fetch_one(client, ref_number) for ref_number in ref_numbers))
+    finally:
+        limiter.close()
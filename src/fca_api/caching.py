@@ -0,0 +1,323 @@
+"""Response caching for FCA Register lookups.
+
+Register data changes slowly, and for many callers a slightly stale
+``FirmDetails`` is far better than waiting on a live round-trip. The
+`ResponseCache` in this module sits inside `fca_api.raw_api.RawClient` and
+caches successful API responses by request URL, with HTTP-style freshness
+semantics:
+
+- **fresh** entries (younger than ``ttl``) are served directly.
+- **stale-while-revalidate**: for ``stale_while_revalidate`` seconds after
+  expiry, the stale entry is returned immediately while a single
+  background refresh is scheduled.
+- **stale-if-error**: for ``stale_if_error`` seconds after expiry, a failed
+  upstream request (including one rejected by an open circuit breaker,
+  see `fca_api.breaker`) falls back to the last good response.
+- **negative caching**: responses carrying a known "not found" status code
+  (see `fca_api.raw_status_codes.is_not_found`), such as a lookup of a
+  non-existent FRN, are kept for the separate, usually shorter,
+  ``negative_ttl``. This includes codes that the FCA API classes as errors,
+  such as an unknown product; `fca_api.raw_api.RawClient` raises for them
+  on every lookup, cached or not.
+
+Concurrent misses for the same URL are coalesced into a single upstream
+request ("single flight"), and background refreshes are deduplicated per
+key in the same way. Shared fetches run without the deadline (see
+`fca_api.deadlines`) and cost tracker (see `fca_api.accounting`) of the
+caller that happened to start them; instead, each caller waits for the
+result only until its own deadline. Proactive refreshes, e.g. by `fca_api.warmer`, are
+issued inside `ResponseCache.revalidating`.
+
+The cache is designed for use from a single event loop and performs no
+locking.
+
+Example:
+    Serving dashboards from a warm cache::
+
+        import fca_api
+
+        cache = fca_api.caching.ResponseCache(
+            ttl=600,
+            stale_while_revalidate=3600,
+            stale_if_error=86400,
+        )
+        async with fca_api.async_api.Client(
+            credentials=("email@example.com", "api_key"),
+            cache=cache,
+        ) as client:
+            firm = await client.get_firm("122702")  # network
+            firm = await client.get_firm("122702")  # cache
+"""
+
+import asyncio
+import collections
+import contextlib
+import contextvars
+import dataclasses
+import logging
+import time
+import typing
+
+import httpx
+
+from . import accounting, deadlines, exc, raw_status_codes
+
+logger = logging.getLogger(__name__)
+
+FetchFnT = typing.Callable[[], typing.Awaitable[httpx.Response]]
+
+#: Default lifetime in seconds of "not found" responses, unless ``ttl`` is shorter.
+_DEFAULT_NEGATIVE_TTL = 60.0
+
+_revalidating: contextvars.ContextVar[bool] = contextvars.ContextVar("fca_api_cache_revalidating", default=False)
+
+
+@dataclasses.dataclass(slots=True)
+class _CacheEntry:
+    response: httpx.Response
+    stored_at: float
+    fresh_until: float
+    negative: bool = False
+    hits: int = 0
+
+
+@dataclasses.dataclass(slots=True)
+class CacheStats:
+    """Counters describing cache effectiveness.
+
+    Attributes:
+        hits: Requests served from a fresh entry.
+        negative_hits: Fresh hits on "not found" responses (included in ``hits``).
+        stale_hits: Requests served from a stale entry while revalidating.
+        stale_errors: Failed upstream requests answered from a stale entry.
+        misses: Requests that had to wait for the upstream API.
+        refreshes: Background or explicit revalidations started.
+        evictions: Entries dropped to respect ``max_entries``.
+    """
+
+    hits: int = 0
+    negative_hits: int = 0
+    stale_hits: int = 0
+    stale_errors: int = 0
+    misses: int = 0
+    refreshes: int = 0
+    evictions: int = 0
+
+
+class ResponseCache:
+    """In-memory cache of successful FCA API responses keyed by URL.
+
+    Args:
+        ttl: Seconds for which a stored response is fresh.
+        negative_ttl: Seconds for which a stored "not found" response is
+            fresh, at most ``ttl``. Defaults to ``ttl`` or 60 seconds,
+            whichever is shorter.
+        stale_while_revalidate: Seconds after expiry during which the stale
+            response is served while a background refresh runs.
+        stale_if_error: Seconds after expiry during which the stale response
+            is served if the upstream request fails.
+        max_entries: Maximum number of cached responses; least recently
+            used entries are evicted first.
+        clock: Monotonic time source, overridable for testing.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 300.0,
+        negative_ttl: typing.Optional[float] = None,
+        stale_while_revalidate: float = 0.0,
+        stale_if_error: float = 0.0,
+        max_entries: int = 10_000,
+        clock: typing.Callable[[], float] = time.monotonic,
+    ) -> None:
+        if negative_ttl is None:
+            negative_ttl = min(ttl, _DEFAULT_NEGATIVE_TTL)
+        if ttl < 0 or negative_ttl < 0 or stale_while_revalidate < 0 or stale_if_error < 0:
+            raise ValueError("Cache lifetimes must be non-negative.")
+        if negative_ttl > ttl:
+            raise ValueError(f"negative_ttl must not exceed ttl, got {negative_ttl!r} > {ttl!r}")
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be a positive integer, got {max_entries!r}")
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.stale_while_revalidate = stale_while_revalidate
+        self.stale_if_error = stale_if_error
+        self.max_entries = max_entries
+        self.stats = CacheStats()
+        self._clock = clock
+        self._entries: collections.OrderedDict[str, _CacheEntry] = collections.OrderedDict()
+        self._inflight: dict[str, asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def invalidate(self, key: typing.Optional[str] = None) -> None:
+        """Drop the entry for ``key``, or all entries if ``key`` is ``None``."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    def hot_keys(self, limit: int) -> list[str]:
+        """Return up to ``limit`` cached keys, most frequently hit first.
+
+        Keys that have never been hit are not included.
+        """
+        ranked = sorted(
+            ((entry.hits, key) for key, entry in self._entries.items() if entry.hits > 0),
+            reverse=True,
+        )
+        return [key for _hits, key in ranked[:limit]]
+
+    @staticmethod
+    @contextlib.contextmanager
+    def revalidating() -> typing.Generator[None, None, None]:
+        """Context manager making cache lookups bypass stored entries.
+
+        Within the context, every lookup goes to the upstream API (still
+        coalesced with concurrent fetches of the same key) and replaces the
+        stored entry. Upstream errors are raised rather than answered from a
+        stale entry, which is left in place for regular lookups.
+
+        Example::
+
+            with cache.revalidating():
+                await raw_client.get_firm("122702")
+        """
+        token = _revalidating.set(True)
+        try:
+            yield
+        finally:
+            _revalidating.reset(token)
+
+    async def aclose(self) -> None:
+        """Cancel any in-flight fetches and background refreshes."""
+        tasks = list(self._inflight.values())
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def fetch(self, key: str, fetch_fn: FetchFnT) -> httpx.Response:
+        """Return the response for ``key``, from the cache where possible.
+
+        Args:
+            key: The cache key, usually the request URL.
+            fetch_fn: Callable performing the upstream request. It must raise
+                `fca_api.exc.FcaRequestError` on failure; only successful
+                responses are stored.
+
+        Returns:
+            The cached or freshly fetched response. Callers must not mutate it.
+
+        Raises:
+            FcaRequestError: If the upstream request failed and no usable
+                stale entry exists.
+            FcaDeadlineExceededError: If the caller's deadline passed while
+                waiting for the upstream request.
+        """
+        now = self._clock()
+        entry = self._entries.get(key)
+        revalidate = _revalidating.get()
+        if entry is not None and not revalidate:
+            if now < entry.fresh_until:
+                self.stats.hits += 1
+                if entry.negative:
+                    self.stats.negative_hits += 1
+                return self._touch(key, entry)
+            if now < entry.fresh_until + self.stale_while_revalidate:
+                self.stats.stale_hits += 1
+                if key not in self._inflight:
+                    self.stats.refreshes += 1
+                    self._start_fetch(key, fetch_fn)
+                return self._touch(key, entry)
+        if entry is not None and now >= entry.fresh_until + self.stale_if_error:
+            # Too old to be of any further use
+            self._entries.pop(key, None)
+            entry = None
+
+        if revalidate:
+            self.stats.refreshes += 1
+        else:
+            self.stats.misses += 1
+        task = self._inflight.get(key) or self._start_fetch(key, fetch_fn)
+        try:
+            return await self._wait(key, task)
+        except exc.FcaRequestError as e:
+            if entry is not None and not revalidate and self._clock() < entry.fresh_until + self.stale_if_error:
+                logger.warning(f"Serving stale response for {key!r} after upstream error: {e}")
+                self.stats.stale_errors += 1
+                return self._touch(key, entry)
+            raise
+
+    @staticmethod
+    async def _wait(key: str, task: asyncio.Task) -> httpx.Response:
+        """Wait for a shared fetch until the caller's own deadline, leaving the
+        fetch running for other callers."""
+        remaining = deadlines.remaining()
+        if remaining is None:
+            return await asyncio.shield(task)
+        if remaining <= 0:
+            raise exc.FcaDeadlineExceededError(key)
+        try:
+            async with asyncio.timeout(remaining):
+                return await asyncio.shield(task)
+        except TimeoutError:
+            raise exc.FcaDeadlineExceededError(key) from None
+
+    def _touch(self, key: str, entry: _CacheEntry) -> httpx.Response:
+        entry.hits += 1
+        if key in self._entries:
+            self._entries.move_to_end(key)
+        return entry.response
+
+    def _start_fetch(self, key: str, fetch_fn: FetchFnT) -> asyncio.Task:
+        # The fetch is shared by every caller of the key, so it must not run
+        # under the deadline or cost tracker of the one that started it
+        context = contextvars.copy_context()
+        context.run(deadlines.detach)
+        context.run(accounting.detach)
+        task = asyncio.get_running_loop().create_task(self._fetch_and_store(key, fetch_fn), context=context)
+        self._inflight[key] = task
+        task.add_done_callback(lambda t: self._on_fetch_done(key, t))
+        return task
+
+    def _on_fetch_done(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled() and (error := task.exception()) is not None:
+            # Retrieving the exception also keeps unawaited background refreshes quiet
+            logger.debug(f"Fetch for {key!r} failed: {error!r}")
+
+    async def _fetch_and_store(self, key: str, fetch_fn: FetchFnT) -> httpx.Response:
+        response = await fetch_fn()
+        if response.is_success:
+            self.store(key, response)
+        return response
+
+    def store(self, key: str, response: httpx.Response) -> None:
+        """Store ``response`` under ``key``, replacing any existing entry."""
+        now = self._clock()
+        negative = self._is_not_found(response)
+        old = self._entries.pop(key, None)
+        self._entries[key] = _CacheEntry(
+            response=response,
+            stored_at=now,
+            fresh_until=now + (self.negative_ttl if negative else self.ttl),
+            negative=negative,
+            hits=old.hits if old is not None else 0,
+        )
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    @staticmethod
+    def _is_not_found(response: httpx.Response) -> bool:
+        try:
+            payload = response.json()
+        except ValueError:
+            return False
+        return isinstance(payload, dict) and raw_status_codes.is_not_found(payload.get("Status"))
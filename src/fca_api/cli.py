@@ -0,0 +1,97 @@
+"""Command line interface, installed as ``fca-api``.
+
+Commands:
+    ``fca-api serve``: run a caching sidecar server (see `fca_api.server`).
+    The API credentials are read from the ``FCA_API_USERNAME`` and
+    ``FCA_API_KEY`` environment variables. Requests are throttled by a
+    `fca_api.bulk.SqliteTokenBucket`; give several sidecars on one host the
+    same ``--limiter-db`` to share it.
+
+Example::
+
+    FCA_API_USERNAME=email@example.com FCA_API_KEY=api_key \\
+        fca-api serve --host 0.0.0.0 --port 8080 --cache-ttl 600 --stale-if-error 86400
+"""
+
+import argparse
+import asyncio
+import contextlib
+import logging
+import os
+import pathlib
+import tempfile
+import typing
+
+from . import bulk, caching, metrics, raw_api, server
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="fca-api", description="FCA Financial Services Register API tools.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve = commands.add_parser("serve", help="Run a caching sidecar server fronting the FS Register.")
+    serve.add_argument("--host", default="127.0.0.1", help="Interface to listen on (default: %(default)s).")
+    serve.add_argument("--port", type=int, default=8080, help="Port to listen on (default: %(default)s).")
+    serve.add_argument("--cache-ttl", type=float, default=300.0, help="Seconds responses stay fresh.")
+    serve.add_argument(
+        "--negative-ttl",
+        type=float,
+        help="Seconds 'not found' responses stay fresh (default: the shorter of 60 and --cache-ttl).",
+    )
+    serve.add_argument(
+        "--stale-if-error", type=float, default=0.0, help="Seconds stale responses may answer upstream failures."
+    )
+    serve.add_argument("--max-entries", type=int, default=10_000, help="Maximum number of cached responses.")
+    serve.add_argument("--rate", type=float, default=45, help="Upstream requests allowed every --per seconds.")
+    serve.add_argument("--per", type=float, default=10.0, help="Rate limiter refill period in seconds.")
+    serve.add_argument("--burst", type=float, default=5, help="Rate limiter bucket capacity.")
+    serve.add_argument(
+        "--limiter-db", type=pathlib.Path, help="SQLite file of the rate limiter (default: a temporary file)."
+    )
+    serve.add_argument("--max-retries", type=int, default=2, help="Retries of failed upstream requests.")
+    serve.add_argument("--request-timeout", type=float, help="Time limit in seconds for answering a request.")
+    return parser
+
+
+async def _serve(args: argparse.Namespace, credentials: tuple[str, str], limiter_db: pathlib.Path) -> None:
+    client = raw_api.RawClient(
+        credentials=credentials,
+        api_limiter=bulk.SqliteTokenBucket(limiter_db, rate=args.rate, per=args.per, burst=args.burst),
+        cache=caching.ResponseCache(
+            ttl=args.cache_ttl,
+            negative_ttl=args.negative_ttl,
+            stale_if_error=args.stale_if_error,
+            max_entries=args.max_entries,
+        ),
+        metrics=metrics.MetricsRegistry(),
+        max_retries=args.max_retries,
+    )
+    async with server.SidecarServer(client, args.host, args.port, args.request_timeout) as sidecar:
+        await sidecar.serve_forever()
+
+
+def main(argv: typing.Optional[typing.Sequence[str]] = None) -> int:
+    """Run the command line interface.
+
+    Args:
+        argv: The arguments, ``sys.argv[1:]`` by default.
+
+    Returns:
+        The exit status.
+    """
+    parser = _parser()
+    args = parser.parse_args(argv)
+    username, api_key = os.environ.get("FCA_API_USERNAME"), os.environ.get("FCA_API_KEY")
+    if not username or not api_key:
+        parser.error("the FCA_API_USERNAME and FCA_API_KEY environment variables must be set")
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    with contextlib.ExitStack() as stack:
+        limiter_db = args.limiter_db
+        if limiter_db is None:
+            limiter_db = pathlib.Path(stack.enter_context(tempfile.TemporaryDirectory())) / "limiter.sqlite3"
+        with contextlib.suppress(KeyboardInterrupt):
+            asyncio.run(_serve(args, (username, api_key), limiter_db))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,254 @@
+"""Adaptive concurrency limiting for fan-out workloads.
+
+A fixed cap on concurrent requests is always wrong for some part of the
+day: too low while the FS Register is idle, too high when it slows down
+under load. The `AdaptiveLimiter` in this module instead discovers the
+concurrency the upstream can currently sustain, using additive-increase /
+multiplicative-decrease (AIMD) driven by latency and errors:
+
+- while requests succeed and latency stays flat, the limit grows by about
+  ``increase`` per round-trip (``increase / limit`` per successful request),
+  as long as the current limit is actually being used;
+- on an upstream failure (transport error, HTTP 429 or 5xx, or an FCA
+  system error status), or when the smoothed latency inflates beyond
+  ``latency_tolerance`` times the baseline latency, the limit is multiplied
+  by ``backoff_ratio``.
+
+The baseline is the lowest latency seen recently: it follows lower samples
+immediately and drifts slowly towards higher ones, so a lasting change in
+upstream latency is eventually accepted as the new normal. At most one
+decrease happens per round-trip: outcomes of requests that started before
+the last decrease are not held against the new limit.
+
+An `AdaptiveLimiter` is used as the ``api_limiter`` of a client, so it
+applies to every request the client sends, including those of
+`fca_api.warmer.CacheWarmer` and `fca_api.bulk.run_bulk` workers. It can
+wrap another rate limiter, such as `fca_api.bulk.SqliteTokenBucket`, which
+is entered once a concurrency slot is held. `fca_api.raw_api.RawClient`
+reports the outcome of every request to limiters implementing
+`FeedbackLimiter`.
+
+Example:
+    Fanning out over many firms::
+
+        import asyncio
+        import fca_api
+
+        registry = fca_api.metrics.MetricsRegistry()
+        limiter = fca_api.concurrency.AdaptiveLimiter(max_limit=32, metrics=registry)
+        async with fca_api.async_api.Client(
+            credentials=("email@example.com", "api_key"),
+            api_limiter=limiter,
+        ) as client:
+            firms = await asyncio.gather(*(client.get_firm(frn) for frn in frns))
+        print(limiter.limit)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import contextlib
+import math
+import time
+import typing
+
+if typing.TYPE_CHECKING:
+    from . import metrics as fca_metrics
+
+
+@typing.runtime_checkable
+class FeedbackLimiter(typing.Protocol):
+    """A rate limiter that learns from the outcome of the requests it admits.
+
+    Instances are callables returning an async context manager, like any
+    ``api_limiter``; `fca_api.raw_api.RawClient` additionally calls
+    `record_outcome` once per request sent through the limiter.
+    """
+
+    def __call__(self) -> typing.AsyncContextManager[typing.Any]: ...
+
+    def record_outcome(self, duration: float, failed: bool) -> None:
+        """Record the outcome of a request.
+
+        Args:
+            duration: Time in seconds from sending the request to receiving
+                the response (or the transport error).
+            failed: Whether the request failed upstream (see
+                `fca_api.breaker` for what counts as an upstream failure).
+        """
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency limiter driven by request latency and failures.
+
+    Calling the limiter returns an async context manager holding one
+    concurrency slot; callers wait in FIFO order while the limit is reached.
+    The limiter is designed for use from a single event loop and performs
+    no locking.
+
+    Args:
+        inner: Optional rate limiter (a callable returning an async context
+            manager) entered while a slot is held.
+        initial_limit: Limit before any outcome is recorded.
+        min_limit: Lower bound of the limit.
+        max_limit: Upper bound of the limit.
+        increase: Growth of the limit per round-trip while healthy.
+        backoff_ratio: Factor in (0, 1) applied to the limit on failure or
+            latency inflation.
+        latency_tolerance: Ratio of smoothed to baseline latency above which
+            latency counts as inflated.
+        smoothing: Weight (0-1] of each new sample in the smoothed latency.
+        baseline_drift: Weight (0-1] with which higher samples pull the
+            baseline latency up.
+        name: Name of the limiter in reported metrics.
+        metrics: Optional metrics recorder, told the current limit if it
+            implements `fca_api.metrics.ConcurrencyLimitRecorder`.
+        clock: Monotonic time source, overridable for testing.
+    """
+
+    def __init__(
+        self,
+        inner: typing.Optional[typing.Callable[[], typing.AsyncContextManager[typing.Any]]] = None,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 50,
+        increase: float = 1.0,
+        backoff_ratio: float = 0.5,
+        latency_tolerance: float = 2.0,
+        smoothing: float = 0.2,
+        baseline_drift: float = 0.01,
+        name: str = "default",
+        metrics: typing.Optional[fca_metrics.MetricsRecorder] = None,
+        clock: typing.Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError(
+                "Limits must satisfy 1 <= min_limit <= initial_limit <= max_limit, "
+                f"got {min_limit!r}, {initial_limit!r}, {max_limit!r}"
+            )
+        if not 0 < backoff_ratio < 1:
+            raise ValueError(f"backoff_ratio must be in (0, 1), got {backoff_ratio!r}")
+        if latency_tolerance <= 1 or increase <= 0:
+            raise ValueError("latency_tolerance must exceed 1 and increase must be positive.")
+        if not (0 < smoothing <= 1 and 0 < baseline_drift <= 1):
+            raise ValueError("smoothing and baseline_drift must be in (0, 1].")
+        self.inner = inner
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.backoff_ratio = backoff_ratio
+        self.latency_tolerance = latency_tolerance
+        self.smoothing = smoothing
+        self.baseline_drift = baseline_drift
+        self.name = name
+        self._observe_limit: typing.Optional[typing.Callable[[str, int], None]] = getattr(
+            metrics, "observe_concurrency_limit", None
+        )
+        self._clock = clock
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._waiters: collections.deque[asyncio.Future] = collections.deque()
+        self._smoothed_latency: typing.Optional[float] = None
+        self._baseline_latency: typing.Optional[float] = None
+        self._last_backoff = -math.inf
+        self._report()
+
+    @property
+    def limit(self) -> int:
+        """The current maximum number of concurrent requests."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """The number of slots currently held."""
+        return self._in_flight
+
+    @property
+    def baseline_latency(self) -> typing.Optional[float]:
+        """The baseline latency in seconds, or ``None`` before any success."""
+        return self._baseline_latency
+
+    @contextlib.asynccontextmanager
+    async def __call__(self) -> typing.AsyncIterator[None]:
+        await self._acquire()
+        try:
+            if self.inner is None:
+                yield
+            else:
+                async with self.inner():
+                    yield
+        finally:
+            self._release()
+
+    def record_outcome(self, duration: float, failed: bool) -> None:
+        """Adjust the limit for the outcome of a request.
+
+        Args:
+            duration: Time in seconds from sending the request to receiving
+                the response (or the transport error).
+            failed: Whether the request failed upstream.
+        """
+        started = self._clock() - duration
+        if failed:
+            self._back_off(started)
+            return
+        if self._baseline_latency is None or self._smoothed_latency is None:
+            self._baseline_latency = self._smoothed_latency = duration
+        else:
+            self._smoothed_latency += self.smoothing * (duration - self._smoothed_latency)
+            if duration < self._baseline_latency:
+                self._baseline_latency = duration
+            else:
+                self._baseline_latency += self.baseline_drift * (duration - self._baseline_latency)
+        if self._smoothed_latency > self._baseline_latency * self.latency_tolerance:
+            self._back_off(started)
+        elif self._waiters or self._in_flight + 1 >= self.limit:
+            # Only probe upwards while the current limit is in use
+            self._set_limit(self._limit + self.increase / self._limit)
+
+    async def _acquire(self) -> None:
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just before the cancellation
+                self._release()
+            else:
+                with contextlib.suppress(ValueError):
+                    self._waiters.remove(waiter)
+            raise
+
+    def _release(self) -> None:
+        self._in_flight -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
+
+    def _back_off(self, started: float) -> None:
+        if started < self._last_backoff:
+            # Sent under the previous limit - already accounted for
+            return
+        self._last_backoff = self._clock()
+        self._set_limit(self._limit * self.backoff_ratio)
+
+    def _set_limit(self, limit: float) -> None:
+        previous = self.limit
+        self._limit = min(float(self.max_limit), max(float(self.min_limit), limit))
+        if self.limit != previous:
+            self._report()
+            self._wake()
+
+    def _report(self) -> None:
+        if self._observe_limit is not None:
+            self._observe_limit(self.name, self.limit)
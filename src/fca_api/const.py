@@ -192,3 +192,74 @@ class ApiConstants(enum.Enum):  # noqa: N801
     API_VERSION = "V0.1"
     BASEURL = f"https://register.fca.org.uk/services/{API_VERSION}"
     DEVELOPER_PORTAL = "https://register.fca.org.uk/Developer/s/"
+
+
+@enum.unique
+class EndpointFamily(enum.StrEnum):
+    """Top-level endpoint families of the FCA Financial Services Register API.
+
+    Every API URL falls under exactly one family, given by the first path
+    segment after the versioned base URL. Families are used to scope
+    per-endpoint behaviour such as circuit breaking, so that a degraded
+    ``/Individuals`` backend does not stop ``/Firm`` lookups.
+
+    Attributes:
+        SEARCH: Name search for firms, individuals and funds (``/Search``)
+        FIRM: Firm details and sub-resources (``/Firm/{FRN}/...``)
+        INDIVIDUALS: Individual details and sub-resources (``/Individuals/{IRN}/...``)
+        CIS: Fund (collective investment scheme) details (``/CIS/{PRN}/...``)
+        COMMON_SEARCH: Common search, e.g. regulated markets (``/CommonSearch``)
+
+    Example:
+        Resolve the family of a request URL::
+
+            family = EndpointFamily.from_url(
+                "https://register.fca.org.uk/services/V0.1/Firm/123456/Names"
+            )
+            print(family)  # 'Firm'
+    """
+
+    SEARCH = "Search"
+    FIRM = "Firm"
+    INDIVIDUALS = "Individuals"
+    CIS = "CIS"
+    COMMON_SEARCH = "CommonSearch"
+
+    @classmethod
+    def from_resource_type(cls, resource_type: ResourceTypeInfo) -> "EndpointFamily":
+        """Return the endpoint family serving the given resource type.
+
+        Args:
+            resource_type: The resource type info, e.g. ``ResourceTypes.FIRM.value``.
+
+        Returns:
+            The matching `EndpointFamily` member.
+        """
+        return cls(resource_type.endpoint_base)
+
+    @classmethod
+    def from_url(cls, url: str) -> "EndpointFamily":
+        """Return the endpoint family of an API URL or path.
+
+        Both absolute URLs and paths such as ``/V0.1/Firm/123456`` are
+        accepted. Matching of the family segment is case-insensitive.
+
+        Args:
+            url: The request URL or path.
+
+        Returns:
+            The matching `EndpointFamily` member.
+
+        Raises:
+            ValueError: If the URL does not belong to any known family.
+        """
+        path = url.split("?", 1)[0]
+        marker = f"/{ApiConstants.API_VERSION.value}/".lower()
+        idx = path.lower().find(marker)
+        if idx >= 0:
+            path = path[idx + len(marker) :]
+        segment = path.strip("/").split("/", 1)[0].lower()
+        for family in cls:
+            if family.value.lower() == segment:
+                return family
+        raise ValueError(f"URL does not belong to a known endpoint family: {url!r}")
@@ -0,0 +1,75 @@
+"""Deadlines for client calls.
+
+A deadline bounds the total time spent on everything done inside it: every
+page of a paginated call, retries and their backoff delays, rate limiter
+waits and the HTTP requests themselves. Like cost trackers (see
+`fca_api.accounting`), deadlines are held in a context variable, so they
+follow the calls of the current task and of tasks it creates, e.g. the
+sub-fetches of a fan-out started with ``asyncio.gather`` or an
+``asyncio.TaskGroup``. Nested deadlines can only shorten the enclosing one.
+
+When a deadline passes, the request in progress is cancelled (releasing
+its rate limiter slot) and `fca_api.exc.FcaDeadlineExceededError` is
+raised; no retry is started that could not finish in time. Paginated calls
+of `fca_api.async_api.Client` that have already fetched some pages return
+them instead, marked ``partial``, with a ``next_page`` token resuming from
+the first page not fetched.
+
+Besides `deadline`, `fca_api.async_api.Client` accepts a ``call_timeout``
+applied to each of its calls.
+
+Example:
+    Bounding a request handler::
+
+        with fca_api.deadlines.deadline(2.0):
+            firm = await client.get_firm(frn)
+            permissions = await client.get_firm_permissions(frn, result_count=1000)
+        if permissions.partial:
+            ...  # fetch the rest later from permissions.pagination.next_page
+"""
+
+import contextlib
+import contextvars
+import time
+import typing
+
+_current_deadline: contextvars.ContextVar[typing.Optional[float]] = contextvars.ContextVar(
+    "fca_api_deadline", default=None
+)
+
+
+def current() -> typing.Optional[float]:
+    """Return the innermost deadline as a `time.monotonic` timestamp, or ``None``."""
+    return _current_deadline.get()
+
+
+def remaining() -> typing.Optional[float]:
+    """Return the seconds left until the innermost deadline (negative once it
+    has passed), or ``None`` without a deadline."""
+    when = _current_deadline.get()
+    return None if when is None else when - time.monotonic()
+
+
+def detach() -> None:
+    """Remove the deadline from the current context.
+
+    Meant for a copied context (see `contextvars.copy_context`) running work
+    shared by several callers, which must not be bound by the deadline of
+    whichever caller started it.
+    """
+    _current_deadline.set(None)
+
+
+@contextlib.contextmanager
+def deadline(timeout: float) -> typing.Iterator[None]:
+    """Bound the client calls made in the block to ``timeout`` seconds from now.
+
+    An enclosing deadline that expires earlier still applies.
+    """
+    parent = _current_deadline.get()
+    when = time.monotonic() + timeout
+    token = _current_deadline.set(when if parent is None else min(parent, when))
+    try:
+        yield
+    finally:
+        _current_deadline.reset(token)
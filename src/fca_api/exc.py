@@ -70,3 +70,79 @@ class FcaRequestError(FcaBaseError):
         This exception is primarily raised by the raw client layer.
         The high-level client may handle some of these errors internally.
     """
+
+
+class FcaCircuitOpenError(FcaRequestError):
+    """Exception raised when a request is short-circuited by a circuit breaker.
+
+    Raised by the raw client, without any network traffic, while the
+    circuit for an endpoint family is open because the FCA Register has
+    recently been failing or responding slowly for that family.
+
+    Attributes:
+        family: The endpoint family whose circuit is open.
+        retry_after: Approximate number of seconds until the circuit allows
+            probe requests again.
+
+    Example:
+        Fail fast while the register is degraded::
+
+            try:
+                firm = await client.get_firm("123456")
+            except FcaCircuitOpenError as e:
+                logger.warning(f"{e.family} endpoints unavailable, retry in {e.retry_after:.0f}s")
+    """
+
+    def __init__(self, family: str, retry_after: float) -> None:
+        super().__init__(f"Circuit for {family} endpoints is open; retry in {retry_after:.1f}s.")
+        self.family = family
+        self.retry_after = retry_after
+
+
+class FcaQueueCancelledError(FcaBaseError):
+    """Exception raised for a request cancelled while queued for a slot.
+
+    Raised by requests waiting in a `fca_api.scheduling.PriorityLimiter`
+    when their priority class is cancelled with
+    ``PriorityLimiter.cancel_queued``. The request was never sent, and is
+    not retried.
+
+    Attributes:
+        priority: The priority class of the cancelled request.
+
+    Example:
+        Abandoning a background refresh::
+
+            limiter.cancel_queued(fca_api.scheduling.BATCH)
+            results = await asyncio.gather(*refreshes, return_exceptions=True)
+    """
+
+    def __init__(self, priority: str) -> None:
+        super().__init__(f"Request queued with priority {priority!r} was cancelled.")
+        self.priority = priority
+
+
+class FcaDeadlineExceededError(FcaBaseError):
+    """Exception raised when a call's deadline passes.
+
+    Raised by the clients when the deadline set with
+    `fca_api.deadlines.deadline` (or the ``call_timeout`` of a client)
+    passes before a request completes. The request in progress, if any, is
+    cancelled, and it is not retried.
+
+    Attributes:
+        url: The URL of the request that was cut short.
+
+    Example:
+        Falling back when the register is slow::
+
+            try:
+                with fca_api.deadlines.deadline(1.0):
+                    firm = await client.get_firm("123456")
+            except FcaDeadlineExceededError:
+                firm = None
+    """
+
+    def __init__(self, url: str) -> None:
+        super().__init__(f"Deadline exceeded before completing the request to {url}.")
+        self.url = url
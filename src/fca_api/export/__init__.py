@@ -0,0 +1,27 @@
+"""Streaming export of typed API results.
+
+Modules:
+    - `stream`: Async iteration over every page or item of a paginated endpoint
+    - `ndjson`: Incremental NDJSON / JSON Lines writers with optional compression
+    - `arrow`: Arrow record batches and Parquet files, with schemas derived from
+      the models in `fca_api.types`. Requires the optional ``pyarrow``
+      dependency and is not imported by this package; use
+      ``import fca_api.export.arrow``.
+
+Results are consumed page by page and written as they arrive, so peak memory
+stays bounded by a single API page regardless of the size of the result set.
+
+Example:
+    Exporting every individual of a firm::
+
+        import fca_api
+
+        async with fca_api.async_api.Client(credentials=...) as client:
+            count = await fca_api.export.ndjson.export(
+                "individuals.ndjson.gz",
+                client.get_firm_individuals,
+                "122702",
+            )
+"""
+
+from . import ndjson, stream
@@ -0,0 +1,402 @@
+"""Columnar (Arrow / Parquet) export.
+
+Arrow schemas are derived directly from the pydantic models in
+`fca_api.types`:
+
+- ``str`` and ``Literal`` fields become ``string`` columns
+- ``datetime.datetime`` fields become ``timestamp[us]`` columns
+- URL fields (``pydantic.HttpUrl``) become ``string`` columns
+- ``list[X]`` fields become ``list<X>`` columns
+- nested models become ``struct`` columns
+- untyped ``list``, ``dict`` and ``Any`` fields become JSON ``string`` columns
+- ``Optional[X]`` fields are nullable; all others are not
+
+Rows are converted column by column straight from the raw API payloads,
+applying each field's own validators (date parsing, string normalisation,
+...) without constructing a model instance per row, and accumulated into
+record batches. `ParquetWriter` writes one Parquet row group per
+``row_group_size`` rows, so memory stays bounded regardless of the size of
+the export.
+
+This module requires the optional ``pyarrow`` dependency
+(``pip install fca-api[arrow]``).
+
+Example:
+    Exporting the appointed representatives of a firm to Parquet::
+
+        import fca_api
+        from fca_api.export import arrow
+
+        async with fca_api.async_api.Client(credentials=...) as client:
+            rows = await arrow.export_parquet(
+                "ars.parquet",
+                fca_api.types.firm.FirmAppointedRepresentative,
+                client.raw_client.get_firm_appointed_representatives,
+                "122702",
+            )
+"""
+
+import dataclasses
+import datetime
+import enum
+import functools
+import os
+import types as py_types
+import typing
+
+import pydantic
+import pydantic_core
+
+from .. import raw_api, types
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError as e:  # pragma: no cover
+    raise ImportError("fca_api.export.arrow requires pyarrow (pip install fca-api[arrow]).") from e
+
+ModelT = type[pydantic.BaseModel]
+
+_SCALAR_TYPES: dict[type, pyarrow.DataType] = {
+    str: pyarrow.string(),
+    int: pyarrow.int64(),
+    float: pyarrow.float64(),
+    bool: pyarrow.bool_(),
+    datetime.datetime: pyarrow.timestamp("us"),
+    datetime.date: pyarrow.date32(),
+}
+
+
+def _unwrap_optional(annotation: typing.Any) -> tuple[typing.Any, bool]:
+    """Return ``(annotation, nullable)`` with any ``Optional`` removed."""
+    if typing.get_origin(annotation) in (typing.Union, py_types.UnionType):
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0], len(args) != len(typing.get_args(annotation))
+    return annotation, False
+
+
+def _is_json(annotation: typing.Any) -> bool:
+    annotation = _unwrap_optional(annotation)[0]
+    return annotation in (list, dict, typing.Any) or typing.get_origin(annotation) is dict
+
+
+def _field_name(name: str, field: pydantic.fields.FieldInfo, by_alias: bool) -> str:
+    return (field.serialization_alias or field.alias or name) if by_alias else name
+
+
+def arrow_type(annotation: typing.Any, by_alias: bool = False) -> pyarrow.DataType:
+    """Return the Arrow type for a pydantic field annotation.
+
+    Untyped containers map to ``string`` and are exported as JSON; other
+    unsupported annotations map to ``string`` and are exported using ``str()``.
+    """
+    if _is_json(annotation):
+        return pyarrow.string()
+    annotation, _nullable = _unwrap_optional(annotation)
+    origin = typing.get_origin(annotation)
+    if origin is typing.Annotated:
+        return arrow_type(typing.get_args(annotation)[0], by_alias=by_alias)
+    if origin is typing.Literal:
+        return pyarrow.string()
+    if origin is list:
+        (item_type,) = typing.get_args(annotation)
+        return pyarrow.list_(arrow_type(item_type, by_alias=by_alias))
+    if isinstance(annotation, type):
+        if issubclass(annotation, pydantic.BaseModel):
+            return pyarrow.struct(schema(annotation, by_alias=by_alias))
+        if issubclass(annotation, enum.Enum):
+            return pyarrow.string()
+        # ``bool`` is checked before ``int`` by exact lookup
+        if annotation in _SCALAR_TYPES:
+            return _SCALAR_TYPES[annotation]
+    return pyarrow.string()
+
+
+@functools.cache
+def schema(model: ModelT, by_alias: bool = False) -> pyarrow.Schema:
+    """Return the Arrow schema of ``model``.
+
+    Args:
+        model: A pydantic model, e.g. `fca_api.types.firm.FirmDetails`.
+        by_alias: Name columns after the fields' serialization aliases.
+
+    Example::
+
+        >>> schema(fca_api.types.firm.FirmIndividual)
+        irn: string not null
+        name: string not null
+        status: string not null
+        url: string not null
+    """
+    return pyarrow.schema(
+        [
+            pyarrow.field(
+                _field_name(name, field, by_alias),
+                arrow_type(field.annotation, by_alias=by_alias),
+                nullable=_unwrap_optional(field.annotation)[1] or not field.is_required(),
+            )
+            for name, field in model.model_fields.items()
+        ]
+    )
+
+
+def _to_arrow_value(value: typing.Any) -> typing.Any:
+    """Convert a validated Python value to one ``pyarrow.array`` accepts."""
+    if value is None or isinstance(value, (str, int, float, datetime.date)):
+        return value
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, list):
+        return [_to_arrow_value(el) for el in value]
+    if isinstance(value, pydantic.BaseModel):
+        return {name: _to_arrow_value(getattr(value, name)) for name in type(value).model_fields}
+    return str(value)
+
+
+@dataclasses.dataclass(frozen=True)
+class _Column:
+    name: str
+    keys: tuple[str, ...]
+    adapter: typing.Optional[pydantic.TypeAdapter]
+    required: bool
+    default: typing.Any
+    as_json: bool
+
+    def to_arrow(self, value: typing.Any) -> typing.Any:
+        if self.as_json and value is not None:
+            return pydantic_core.to_json(value).decode()
+        return _to_arrow_value(value)
+
+    def convert(self, row: dict[str, typing.Any], model_name: str) -> typing.Any:
+        for key in self.keys:
+            if key in row:
+                value = row[key]
+                if self.adapter is not None:
+                    return self.to_arrow(self.adapter.validate_python(value))
+                if not isinstance(value, str):
+                    raise ValueError(f"{model_name}.{self.name}: expected a string, got {value!r}")
+                return value
+        if self.required:
+            raise ValueError(f"{model_name}.{self.name}: field required")
+        return self.to_arrow(self.default)
+
+
+def _raw_keys(name: str, field: pydantic.fields.FieldInfo) -> tuple[str, ...]:
+    alias = field.validation_alias
+    if isinstance(alias, pydantic.AliasChoices):
+        keys = [choice for choice in alias.choices if isinstance(choice, str)]
+    elif isinstance(alias, str):
+        keys = [alias]
+    else:
+        keys = [field.alias or name]
+    return tuple(key.lower().strip() for key in keys)
+
+
+def _field_adapter(field: pydantic.fields.FieldInfo) -> typing.Optional[pydantic.TypeAdapter]:
+    if not field.metadata:
+        # Plain strings need no conversion
+        return None if field.annotation is str else pydantic.TypeAdapter(field.annotation)
+    return pydantic.TypeAdapter(typing.Annotated[field.annotation, *field.metadata])
+
+
+class RecordBatchBuilder:
+    """Accumulates raw API rows into Arrow record batches.
+
+    Each raw row (a dict as found in the API response ``Data``) is converted
+    with the field validators of ``model``, matching what
+    ``model.model_validate(row)`` would produce, but without building a model
+    instance.
+
+    Args:
+        model: The model describing the rows.
+        by_alias: Name columns after the fields' serialization aliases.
+    """
+
+    def __init__(self, model: ModelT, by_alias: bool = False) -> None:
+        self.model = model
+        self.schema = schema(model, by_alias=by_alias)
+        self._columns = [
+            _Column(
+                name=_field_name(name, field, by_alias),
+                keys=_raw_keys(name, field),
+                adapter=_field_adapter(field),
+                required=field.is_required(),
+                default=None if field.is_required() else field.get_default(call_default_factory=True),
+                as_json=_is_json(field.annotation),
+            )
+            for name, field in model.model_fields.items()
+        ]
+        self._known_keys = frozenset(key for column in self._columns for key in column.keys)
+        self._extra = model.model_config.get("extra") or types.settings.model_validate_extra
+        self._data: dict[str, list] = {column.name: [] for column in self._columns}
+        self._rows = 0
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def append(self, raw: dict[str, typing.Any]) -> None:
+        """Convert and buffer one raw row.
+
+        Raises:
+            pydantic.ValidationError: If a field fails validation.
+            ValueError: If a required field is missing, or an unknown field is
+                present and the model forbids extra fields.
+        """
+        row = {}
+        for key, value in raw.items():
+            key = key.lower().strip()
+            if "[notinuse]" not in key:
+                row[key] = value
+        if self._extra == "forbid" and (unknown := row.keys() - self._known_keys):
+            raise ValueError(f"Unexpected fields for {self.model.__name__}: {sorted(unknown)}")
+
+        values = [column.convert(row, self.model.__name__) for column in self._columns]
+
+        # Only commit the row once every field converted successfully
+        for column, value in zip(self._columns, values, strict=True):
+            self._data[column.name].append(value)
+        self._rows += 1
+
+    def append_model(self, item: pydantic.BaseModel) -> None:
+        """Buffer one already validated model instance."""
+        for column, name in zip(self._columns, self.model.model_fields, strict=True):
+            self._data[column.name].append(column.to_arrow(getattr(item, name)))
+        self._rows += 1
+
+    def flush(self) -> pyarrow.RecordBatch:
+        """Return the buffered rows as a record batch and clear the buffer."""
+        batch = pyarrow.RecordBatch.from_pydict(self._data, schema=self.schema)
+        self._data = {column.name: [] for column in self._columns}
+        self._rows = 0
+        return batch
+
+
+class ParquetWriter:
+    """Streams rows of one model to a Parquet file, one row group at a time.
+
+    Args:
+        target: Output path or writable binary file object.
+        model: The model describing the rows.
+        row_group_size: Number of rows per Parquet row group; also the
+            maximum number of rows held in memory.
+        compression: Parquet compression codec.
+        by_alias: Name columns after the fields' serialization aliases.
+    """
+
+    def __init__(
+        self,
+        target: typing.Union[str, os.PathLike, typing.BinaryIO],
+        model: ModelT,
+        row_group_size: int = 64 * 1024,
+        compression: str = "zstd",
+        by_alias: bool = False,
+    ) -> None:
+        if row_group_size < 1:
+            raise ValueError(f"row_group_size must be a positive integer, got {row_group_size!r}")
+        self.row_group_size = row_group_size
+        self.count = 0
+        self._builder = RecordBatchBuilder(model, by_alias=by_alias)
+        self._writer = pyarrow.parquet.ParquetWriter(target, self._builder.schema, compression=compression)
+
+    def __enter__(self) -> "ParquetWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    @property
+    def schema(self) -> pyarrow.Schema:
+        """The Arrow schema of the file."""
+        return self._builder.schema
+
+    def write_raw(self, rows: typing.Iterable[dict[str, typing.Any]]) -> None:
+        """Write raw API rows."""
+        for raw in rows:
+            self._builder.append(raw)
+            self._after_append()
+
+    def write_models(self, items: typing.Iterable[pydantic.BaseModel]) -> None:
+        """Write validated model instances."""
+        for item in items:
+            self._builder.append_model(item)
+            self._after_append()
+
+    def close(self) -> None:
+        """Write any buffered rows and finalise the file."""
+        if self._writer is None:
+            return
+        if len(self._builder):
+            self._write_row_group()
+        self._writer.close()
+        self._writer = None
+
+    def _after_append(self) -> None:
+        self.count += 1
+        if len(self._builder) >= self.row_group_size:
+            self._write_row_group()
+
+    def _write_row_group(self) -> None:
+        self._writer.write_batch(self._builder.flush(), row_group_size=self.row_group_size)
+
+
+async def iter_raw_pages(
+    method: typing.Callable[..., typing.Awaitable[raw_api.FcaApiResponse]],
+    *args: typing.Any,
+) -> typing.AsyncIterator[list[dict[str, typing.Any]]]:
+    """Yield the ``Data`` rows of every page of a paginated raw client method.
+
+    Args:
+        method: A paginated `fca_api.raw_api.RawClient` method accepting a
+            ``page`` keyword, e.g. ``raw_client.get_firm_individuals``.
+        *args: Positional arguments for ``method``.
+
+    Raises:
+        TypeError: If the endpoint's data is not a list of rows.
+    """
+    page = 1
+    while True:
+        response = await method(*args, page=page)
+        data = response.data
+        if data:
+            if not isinstance(data, list):
+                raise TypeError(f"Expected a list of rows, got {type(data).__name__}")
+            yield data
+        raw_info = response.result_info
+        if not raw_info or not {k.lower().strip(): v for k, v in raw_info.items()}.get("page"):
+            return
+        info = types.pagination.PaginatedResultInfo.model_validate(raw_info)
+        if info.next is None or info.page >= info.total_pages:
+            return
+        page = info.page + 1
+
+
+async def export_parquet(
+    target: typing.Union[str, os.PathLike, typing.BinaryIO],
+    model: ModelT,
+    method: typing.Callable[..., typing.Awaitable[raw_api.FcaApiResponse]],
+    *args: typing.Any,
+    row_group_size: int = 64 * 1024,
+    compression: str = "zstd",
+    by_alias: bool = False,
+) -> int:
+    """Write every row of a paginated raw client method to a Parquet file.
+
+    Args:
+        target: Output path or writable binary file object.
+        model: The model describing the rows.
+        method: A paginated `fca_api.raw_api.RawClient` method.
+        *args: Positional arguments for ``method``.
+        row_group_size: As for `ParquetWriter`.
+        compression: As for `ParquetWriter`.
+        by_alias: As for `ParquetWriter`.
+
+    Returns:
+        The number of rows written.
+    """
+    with ParquetWriter(
+        target, model, row_group_size=row_group_size, compression=compression, by_alias=by_alias
+    ) as writer:
+        async for rows in iter_raw_pages(method, *args):
+            writer.write_raw(rows)
+    return writer.count
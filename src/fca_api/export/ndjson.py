@@ -0,0 +1,183 @@
+"""NDJSON / JSON Lines export.
+
+`NdjsonWriter` serialises one item per line and writes it through an
+in-memory buffer of ``buffer_size`` bytes, so the (optional) compressor and
+the file are only called once per buffer rather than once per item.
+
+Compression is chosen explicitly with ``compression="gzip"`` or
+``compression="zstd"``, or inferred from the file suffix (``.gz``,
+``.zst``) by default. gzip uses the standard library; zstd uses
+``compression.zstd`` on Python 3.14+ and otherwise needs the optional
+``zstandard`` package (``pip install fca-api[zstd]``).
+
+Example:
+    Writing search results as they are fetched::
+
+        from fca_api.export import ndjson, stream
+
+        with ndjson.NdjsonWriter("firms.ndjson.zst") as writer:
+            async for firm in stream.iter_items(client.search_frn, "Barclays"):
+                writer.write(firm)
+        print(f"{writer.count} rows written")
+"""
+
+import gzip
+import os
+import pathlib
+import typing
+
+import pydantic_core
+
+from . import stream
+
+CompressionT = typing.Optional[typing.Literal["auto", "gzip", "zstd"]]
+
+_SUFFIX_COMPRESSION = {".gz": "gzip", ".gzip": "gzip", ".zst": "zstd", ".zstd": "zstd"}
+
+
+def _zstd_writer(raw: typing.BinaryIO, level: typing.Optional[int]) -> typing.BinaryIO:
+    try:
+        from compression import zstd
+    except ImportError:
+        pass
+    else:
+        return zstd.ZstdFile(raw, "wb", level=level)
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError(
+            "zstd compression requires Python 3.14+ or the 'zstandard' package (pip install fca-api[zstd])."
+        ) from None
+    return zstandard.ZstdCompressor(level=3 if level is None else level).stream_writer(raw, closefd=False)
+
+
+class NdjsonWriter:
+    """Incremental, buffered NDJSON writer.
+
+    Items may be pydantic models (such as `fca_api.types.search.FirmSearchResult`)
+    or any JSON-serialisable value.
+
+    Args:
+        target: A file path, or a writable binary file object. File objects
+            are flushed but not closed by `close`.
+        compression: ``"gzip"``, ``"zstd"``, ``None`` for none, or ``"auto"``
+            to infer it from the suffix of a path target.
+        buffer_size: Number of bytes buffered in memory between writes.
+        compresslevel: Optional compression level.
+        by_alias: Serialise models using their serialization aliases.
+        exclude_none: Omit ``None`` valued fields.
+    """
+
+    def __init__(
+        self,
+        target: typing.Union[str, os.PathLike, typing.BinaryIO],
+        compression: CompressionT = "auto",
+        buffer_size: int = 1 << 20,
+        compresslevel: typing.Optional[int] = None,
+        by_alias: bool = False,
+        exclude_none: bool = False,
+    ) -> None:
+        is_path = isinstance(target, (str, os.PathLike))
+        if compression == "auto":
+            compression = _SUFFIX_COMPRESSION.get(pathlib.Path(target).suffix.lower()) if is_path else None
+        if compression not in (None, "gzip", "zstd"):
+            raise ValueError(f"Unsupported compression: {compression!r}")
+
+        self._raw: typing.BinaryIO = pathlib.Path(target).open("wb") if is_path else target
+        self._owns_raw = is_path
+        try:
+            if compression == "gzip":
+                level = 6 if compresslevel is None else compresslevel
+                self._out: typing.BinaryIO = gzip.GzipFile(fileobj=self._raw, mode="wb", compresslevel=level)
+            elif compression == "zstd":
+                self._out = _zstd_writer(self._raw, compresslevel)
+            else:
+                self._out = self._raw
+        except BaseException:
+            if self._owns_raw:
+                self._raw.close()
+            raise
+
+        self.compression = compression
+        self.buffer_size = buffer_size
+        self.by_alias = by_alias
+        self.exclude_none = exclude_none
+        self.count = 0
+        self._buffer = bytearray()
+        self._closed = False
+
+    def __enter__(self) -> "NdjsonWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def write(self, item: typing.Any) -> None:
+        """Serialise ``item`` as one line."""
+        self._buffer += pydantic_core.to_json(item, by_alias=self.by_alias, exclude_none=self.exclude_none)
+        self._buffer += b"\n"
+        self.count += 1
+        if len(self._buffer) >= self.buffer_size:
+            self._flush_buffer()
+
+    def write_many(self, items: typing.Iterable[typing.Any]) -> None:
+        """Serialise each of ``items`` as one line."""
+        for item in items:
+            self.write(item)
+
+    def flush(self) -> None:
+        """Write out buffered lines."""
+        self._flush_buffer()
+        self._out.flush()
+
+    def close(self) -> None:
+        """Flush buffered lines, finish compression and close owned files."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._flush_buffer()
+            if self._out is not self._raw:
+                self._out.close()
+            self._raw.flush()
+        finally:
+            if self._owns_raw:
+                self._raw.close()
+
+    def _flush_buffer(self) -> None:
+        if self._buffer:
+            self._out.write(self._buffer)
+            self._buffer.clear()
+
+
+async def export(
+    target: typing.Union[str, os.PathLike, typing.BinaryIO],
+    method: stream.PaginatedMethodT,
+    *args: typing.Any,
+    compression: CompressionT = "auto",
+    buffer_size: int = 1 << 20,
+    by_alias: bool = False,
+    **kwargs: typing.Any,
+) -> int:
+    """Write every item of a paginated client method to ``target`` as NDJSON.
+
+    Args:
+        target: A file path or writable binary file object.
+        method: A paginated `fca_api.async_api.Client` method.
+        *args: Positional arguments for ``method``.
+        compression: As for `NdjsonWriter`.
+        buffer_size: As for `NdjsonWriter`.
+        by_alias: As for `NdjsonWriter`.
+        **kwargs: Keyword arguments for ``method``.
+
+    Returns:
+        The number of items written.
+
+    Example::
+
+        count = await export("ars.ndjson.gz", client.get_firm_appointed_representatives, "122702")
+    """
+    with NdjsonWriter(target, compression=compression, buffer_size=buffer_size, by_alias=by_alias) as writer:
+        async for page in stream.iter_pages(method, *args, **kwargs):
+            writer.write_many(page.data)
+    return writer.count
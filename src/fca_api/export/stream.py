@@ -0,0 +1,64 @@
+"""Async iteration over paginated client endpoints.
+
+Every paginated `fca_api.async_api.Client` method accepts a ``next_page``
+token and returns a `fca_api.types.pagination.MultipageList`. The helpers
+here follow those tokens, yielding one page (or one item) at a time so that
+consumers never hold more than a single page in memory.
+"""
+
+import typing
+
+from .. import types
+
+PaginatedMethodT = typing.Callable[..., typing.Awaitable[types.pagination.MultipageList]]
+
+
+async def iter_pages(
+    method: PaginatedMethodT,
+    *args: typing.Any,
+    next_page: typing.Optional[types.pagination.NextPageToken] = None,
+    **kwargs: typing.Any,
+) -> typing.AsyncIterator[types.pagination.MultipageList]:
+    """Yield successive pages of a paginated client method.
+
+    Args:
+        method: A paginated `fca_api.async_api.Client` method, such as
+            ``client.search_frn`` or ``client.get_firm_individuals``.
+        *args: Positional arguments for ``method``.
+        next_page: Token to start from, or ``None`` for the first page.
+        **kwargs: Keyword arguments for ``method``, e.g. ``result_count``.
+
+    Yields:
+        Each page, until one reports ``has_next=False``.
+
+    Example::
+
+        async for page in iter_pages(client.search_frn, "Barclays"):
+            print(len(page.data), page.pagination.next_page)
+    """
+    while True:
+        page = await method(*args, next_page=next_page, **kwargs)
+        yield page
+        if not page.pagination.has_next:
+            return
+        next_page = page.pagination.next_page
+
+
+async def iter_items(
+    method: PaginatedMethodT,
+    *args: typing.Any,
+    next_page: typing.Optional[types.pagination.NextPageToken] = None,
+    **kwargs: typing.Any,
+) -> typing.AsyncIterator[typing.Any]:
+    """Yield every item of a paginated client method, page by page.
+
+    Accepts the same arguments as `iter_pages`.
+
+    Example::
+
+        async for firm in iter_items(client.search_frn, "Barclays"):
+            print(firm.name)
+    """
+    async for page in iter_pages(method, *args, next_page=next_page, **kwargs):
+        for item in page.data:
+            yield item
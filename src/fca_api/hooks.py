@@ -0,0 +1,200 @@
+"""Request lifecycle hooks.
+
+Every `fca_api.raw_api.RawClient` has a `HookRegistry` (``client.hooks``)
+whose callbacks are fired as each upstream request progresses:
+
+- ``on_limit_wait``: the rate limiter has been acquired (`LimitWaitEvent`)
+- ``on_request``: the HTTP request is about to be sent (`RequestEvent`)
+- ``on_response``: an HTTP response has been received (`ResponseEvent`),
+  before its status is checked
+- ``on_retry``: a failed attempt is about to be retried after a delay
+  (`RetryEvent`); see the ``max_retries`` option of the clients
+
+Hooks may be plain functions or coroutine functions; coroutines are
+awaited before the request proceeds, and hooks of a stage run one after
+another in registration order. Exceptions raised by a hook propagate to
+the caller of the client method. Requests answered from a response cache
+(see `fca_api.caching`) do not fire any hooks.
+
+Stages without hooks cost a single truthiness check per request: no event
+objects are created unless a hook is registered for the stage.
+
+Example:
+    Logging slow requests::
+
+        import fca_api
+
+        client = fca_api.async_api.Client(credentials=("email@example.com", "api_key"))
+
+        @client.raw_client.hooks.on_response
+        def log_slow(event: fca_api.hooks.ResponseEvent) -> None:
+            if event.duration > 2.0:
+                logger.warning(f"Slow FCA request ({event.duration:.1f}s): {event.url}")
+"""
+
+import dataclasses
+import enum
+import inspect
+import typing
+
+import httpx
+
+from . import const
+
+
+@enum.unique
+class HookStage(enum.StrEnum):
+    """Lifecycle stages at which hooks are fired."""
+
+    LIMIT_WAIT = "on_limit_wait"
+    REQUEST = "on_request"
+    RESPONSE = "on_response"
+    RETRY = "on_retry"
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class LimitWaitEvent:
+    """The rate limiter was acquired for a request.
+
+    Attributes:
+        url: The request URL.
+        family: The endpoint family of the request.
+        duration: Seconds spent waiting for the rate limiter.
+    """
+
+    url: str
+    family: const.EndpointFamily
+    duration: float
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class RequestEvent:
+    """An HTTP request is about to be sent.
+
+    Attributes:
+        url: The request URL.
+        family: The endpoint family of the request.
+        attempt: ``0`` for the first attempt, ``n`` for the n-th retry.
+    """
+
+    url: str
+    family: const.EndpointFamily
+    attempt: int
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class ResponseEvent:
+    """An HTTP response was received.
+
+    Attributes:
+        url: The request URL.
+        family: The endpoint family of the request.
+        attempt: ``0`` for the first attempt, ``n`` for the n-th retry.
+        response: The received response.
+        duration: Seconds from sending the request to receiving the
+            response.
+    """
+
+    url: str
+    family: const.EndpointFamily
+    attempt: int
+    response: httpx.Response
+    duration: float
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class RetryEvent:
+    """A failed attempt is about to be retried.
+
+    Attributes:
+        url: The request URL.
+        family: The endpoint family of the request.
+        attempt: The number of the upcoming retry (``1`` for the first).
+        delay: Seconds the client waits before retrying.
+        error: The error of the failed attempt, if it raised one.
+        response: The response of the failed attempt, if one was received.
+    """
+
+    url: str
+    family: const.EndpointFamily
+    attempt: int
+    delay: float
+    error: typing.Optional[BaseException] = None
+    response: typing.Optional[httpx.Response] = None
+
+
+EventT = typing.TypeVar("EventT", LimitWaitEvent, RequestEvent, ResponseEvent, RetryEvent)
+HookT = typing.Callable[[EventT], typing.Optional[typing.Awaitable[None]]]
+
+
+class HookRegistry:
+    """Registry of lifecycle hooks.
+
+    Hooks are added with `register` or with the decorator-style
+    `on_limit_wait`, `on_request`, `on_response` and `on_retry` methods,
+    which return the hook unchanged. A registry can be shared by several
+    clients.
+
+    Attributes:
+        limit_wait_hooks: Hooks fired once the rate limiter is acquired.
+        request_hooks: Hooks fired before each HTTP request.
+        response_hooks: Hooks fired after each HTTP response.
+        retry_hooks: Hooks fired before each retry.
+    """
+
+    __slots__ = ("limit_wait_hooks", "request_hooks", "response_hooks", "retry_hooks")
+
+    _ATTRIBUTES: typing.ClassVar[dict[HookStage, str]] = {
+        HookStage.LIMIT_WAIT: "limit_wait_hooks",
+        HookStage.REQUEST: "request_hooks",
+        HookStage.RESPONSE: "response_hooks",
+        HookStage.RETRY: "retry_hooks",
+    }
+
+    def __init__(self) -> None:
+        # Tuples, so that firing never observes a registration in progress
+        self.limit_wait_hooks: tuple[HookT[LimitWaitEvent], ...] = ()
+        self.request_hooks: tuple[HookT[RequestEvent], ...] = ()
+        self.response_hooks: tuple[HookT[ResponseEvent], ...] = ()
+        self.retry_hooks: tuple[HookT[RetryEvent], ...] = ()
+
+    def register(self, stage: typing.Union[HookStage, str], hook: HookT) -> HookT:
+        """Add ``hook`` to ``stage`` and return it."""
+        attribute = self._ATTRIBUTES[HookStage(stage)]
+        setattr(self, attribute, (*getattr(self, attribute), hook))
+        return hook
+
+    def unregister(self, stage: typing.Union[HookStage, str], hook: HookT) -> None:
+        """Remove ``hook`` from ``stage``.
+
+        Raises:
+            ValueError: If ``hook`` is not registered for ``stage``.
+        """
+        attribute = self._ATTRIBUTES[HookStage(stage)]
+        hooks = list(getattr(self, attribute))
+        hooks.remove(hook)
+        setattr(self, attribute, tuple(hooks))
+
+    def on_limit_wait(self, hook: HookT[LimitWaitEvent]) -> HookT[LimitWaitEvent]:
+        """Register a hook fired once the rate limiter has been acquired."""
+        return self.register(HookStage.LIMIT_WAIT, hook)
+
+    def on_request(self, hook: HookT[RequestEvent]) -> HookT[RequestEvent]:
+        """Register a hook fired before each HTTP request."""
+        return self.register(HookStage.REQUEST, hook)
+
+    def on_response(self, hook: HookT[ResponseEvent]) -> HookT[ResponseEvent]:
+        """Register a hook fired after each HTTP response."""
+        return self.register(HookStage.RESPONSE, hook)
+
+    def on_retry(self, hook: HookT[RetryEvent]) -> HookT[RetryEvent]:
+        """Register a hook fired before each retry."""
+        return self.register(HookStage.RETRY, hook)
+
+
+async def fire(hooks: tuple[HookT, ...], event: typing.Any) -> None:
+    """Call ``hooks`` with ``event``, awaiting any that are coroutines."""
+    for hook in hooks:
+        result = hook(event)
+        if inspect.isawaitable(result):
+            await result
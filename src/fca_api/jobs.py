@@ -0,0 +1,335 @@
+"""Checkpointed, resumable bulk jobs.
+
+Long refresh jobs lose all progress when their process is restarted. A
+`JobRunner` records the status of every item of a job (``pending``,
+``done`` or ``failed``) in a local `CheckpointStore`, together with the
+``next_page`` token of each paginated sub-resource being walked. Re-running
+the same job after a restart skips finished items and resumes each
+interrupted sub-resource from its last saved page.
+
+The saved position is an ordinary `fca_api.types.pagination.NextPageToken`,
+exactly as returned by the client (including any configured
+``page_token_serializer``), so resuming needs no extra state.
+
+Pages are checkpointed *after* their handler returns, so delivery is
+at-least-once: after a crash, the page being processed at the time is
+handled again. Page handlers should therefore be idempotent (e.g. upserts).
+
+`CheckpointStore` methods block on SQLite; `Checkpoint` and `JobRunner` run
+them in a worker thread (``asyncio.to_thread``) so that commits do not stall
+the event loop.
+
+Example:
+    Refreshing firms and their individuals::
+
+        import fca_api
+
+        async def refresh_firm(client, frn, checkpoint):
+            firm = await client.get_firm(frn)
+            await db.upsert_firm(firm)
+            await checkpoint.paginate(
+                "individuals",
+                client.get_firm_individuals,
+                frn,
+                on_page=lambda rows: db.upsert_individuals(frn, rows),
+            )
+
+        store = fca_api.jobs.CheckpointStore("/var/lib/refresh/checkpoints.sqlite3")
+        async with fca_api.async_api.Client(credentials=...) as client:
+            runner = fca_api.jobs.JobRunner(client, store, "nightly-firms")
+            report = await runner.run(frns, refresh_firm)
+"""
+
+import asyncio
+import dataclasses
+import enum
+import inspect
+import logging
+import os
+import sqlite3
+import threading
+import time
+import typing
+
+from . import async_api, types
+
+logger = logging.getLogger(__name__)
+
+T = typing.TypeVar("T")
+
+
+class ItemStatus(enum.StrEnum):
+    """Processing status of a job item."""
+
+    PENDING = "pending"
+    DONE = "done"
+    FAILED = "failed"
+
+
+@dataclasses.dataclass(frozen=True)
+class ItemState:
+    """Checkpointed state of a single job item.
+
+    Attributes:
+        item: The item key, usually a reference number.
+        status: The item's processing status.
+        attempts: Number of times processing has been started.
+        error: The last error, for failed items.
+    """
+
+    item: str
+    status: ItemStatus
+    attempts: int = 0
+    error: typing.Optional[str] = None
+
+
+class CheckpointStore:
+    """SQLite-backed store of job item states and pagination positions.
+
+    The store is safe to share between tasks and threads of one process.
+    Its methods block on SQLite I/O; call them with ``asyncio.to_thread``
+    from a running event loop.
+
+    Args:
+        path: Path of the SQLite database. It is created if missing; use
+            ``":memory:"`` for a non-persistent store.
+    """
+
+    def __init__(self, path: typing.Union[str, os.PathLike]) -> None:
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._conn.executescript(
+            """
+            PRAGMA journal_mode = WAL;
+            CREATE TABLE IF NOT EXISTS items (
+                job TEXT NOT NULL,
+                item TEXT NOT NULL,
+                status TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                error TEXT,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (job, item)
+            );
+            CREATE TABLE IF NOT EXISTS pages (
+                job TEXT NOT NULL,
+                item TEXT NOT NULL,
+                stage TEXT NOT NULL,
+                next_page TEXT,
+                complete INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (job, item, stage)
+            );
+            """
+        )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def add(self, job: str, items: typing.Iterable[str]) -> None:
+        """Register ``items`` as pending, leaving already known items untouched."""
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN")
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO items (job, item, status, updated_at) VALUES (?, ?, ?, ?)",
+                ((job, item, ItemStatus.PENDING.value, now) for item in items),
+            )
+
+    def get(self, job: str, item: str) -> typing.Optional[ItemState]:
+        """Return the state of ``item``, or ``None`` if it is unknown."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT item, status, attempts, error FROM items WHERE job = ? AND item = ?", (job, item)
+            ).fetchone()
+        return None if row is None else ItemState(row[0], ItemStatus(row[1]), row[2], row[3])
+
+    def items(self, job: str, status: typing.Optional[ItemStatus] = None) -> list[ItemState]:
+        """Return the states of the items of ``job``, optionally filtered by status."""
+        query = "SELECT item, status, attempts, error FROM items WHERE job = ?"
+        params: tuple = (job,)
+        if status is not None:
+            query += " AND status = ?"
+            params += (status.value,)
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY rowid", params).fetchall()
+        return [ItemState(row[0], ItemStatus(row[1]), row[2], row[3]) for row in rows]
+
+    def counts(self, job: str) -> dict[ItemStatus, int]:
+        """Return the number of items of ``job`` in each status."""
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM items WHERE job = ? GROUP BY status", (job,))
+            found = dict(rows.fetchall())
+        return {status: found.get(status.value, 0) for status in ItemStatus}
+
+    def mark_started(self, job: str, item: str) -> None:
+        """Record the start of an attempt at ``item``."""
+        self._update(job, item, "attempts = attempts + 1, status = ?", (ItemStatus.PENDING.value,))
+
+    def mark_done(self, job: str, item: str) -> None:
+        """Record that ``item`` was processed successfully, dropping its
+        saved page positions in the same transaction."""
+        self._update(job, item, "status = ?, error = NULL", (ItemStatus.DONE.value,), drop_pages=True)
+
+    def mark_failed(self, job: str, item: str, error: str) -> None:
+        """Record that processing ``item`` failed with ``error``."""
+        self._update(job, item, "status = ?, error = ?", (ItemStatus.FAILED.value, error))
+
+    def page_position(self, job: str, item: str, stage: str) -> tuple[typing.Optional[str], bool]:
+        """Return the saved ``(next_page, complete)`` position of a paginated stage."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT next_page, complete FROM pages WHERE job = ? AND item = ? AND stage = ?", (job, item, stage)
+            ).fetchone()
+        return (None, False) if row is None else (row[0], bool(row[1]))
+
+    def save_page_position(
+        self,
+        job: str,
+        item: str,
+        stage: str,
+        next_page: typing.Optional[str],
+        complete: bool = False,
+    ) -> None:
+        """Save the position of a paginated stage."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages (job, item, stage, next_page, complete) VALUES (?, ?, ?, ?, ?)",
+                (job, item, stage, next_page, int(complete)),
+            )
+
+    def _update(self, job: str, item: str, assignments: str, params: tuple, drop_pages: bool = False) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN")
+            self._conn.execute(
+                f"UPDATE items SET {assignments}, updated_at = ? WHERE job = ? AND item = ?",
+                params + (time.time(), job, item),
+            )
+            if drop_pages:
+                self._conn.execute("DELETE FROM pages WHERE job = ? AND item = ?", (job, item))
+
+
+class Checkpoint:
+    """Per-item handle passed to job handlers for checkpointing pagination."""
+
+    def __init__(self, store: CheckpointStore, job: str, item: str) -> None:
+        self._store = store
+        self.job = job
+        self.item = item
+
+    async def paginate(
+        self,
+        stage: str,
+        method: typing.Callable[..., typing.Awaitable[types.pagination.MultipageList[T]]],
+        *args: typing.Any,
+        on_page: typing.Callable[[list[T]], typing.Optional[typing.Awaitable[None]]],
+        **kwargs: typing.Any,
+    ) -> None:
+        """Walk every page of a paginated client method, checkpointing as it goes.
+
+        Resumes from the saved position of ``stage`` if there is one, and
+        returns immediately if the stage already completed.
+
+        Args:
+            stage: Name of the stage, unique within the item.
+            method: A paginated `fca_api.async_api.Client` method.
+            *args: Positional arguments for ``method``.
+            on_page: Called with the data of each page, before the position
+                after that page is saved. May return an awaitable.
+            **kwargs: Keyword arguments for ``method``.
+        """
+        next_page, complete = await asyncio.to_thread(self._store.page_position, self.job, self.item, stage)
+        while not complete:
+            page = await method(*args, next_page=next_page, **kwargs)
+            result = on_page(page.data)
+            if inspect.isawaitable(result):
+                await result
+            next_page = page.pagination.next_page if page.pagination.has_next else None
+            complete = next_page is None
+            await asyncio.to_thread(
+                self._store.save_page_position, self.job, self.item, stage, next_page, complete=complete
+            )
+
+
+HandlerT = typing.Callable[[async_api.Client, str, Checkpoint], typing.Awaitable[None]]
+
+
+@dataclasses.dataclass(frozen=True)
+class JobReport:
+    """Item counts of a job after a `JobRunner.run` call."""
+
+    done: int
+    failed: int
+    pending: int
+
+
+class JobRunner:
+    """Runs a handler over a job's items, resuming from the checkpoint store.
+
+    Args:
+        client: The client passed to the handler.
+        store: Where progress is checkpointed.
+        job: Name identifying the job in ``store``.
+        concurrency: Maximum number of items processed concurrently.
+        max_attempts: Failed items are retried on later runs until they
+            have been attempted this many times.
+    """
+
+    def __init__(
+        self,
+        client: async_api.Client,
+        store: CheckpointStore,
+        job: str,
+        concurrency: int = 4,
+        max_attempts: int = 3,
+    ) -> None:
+        if concurrency < 1 or max_attempts < 1:
+            raise ValueError("concurrency and max_attempts must be positive integers.")
+        self.client = client
+        self.store = store
+        self.job = job
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+
+    async def run(self, items: typing.Iterable[str], handler: HandlerT) -> JobReport:
+        """Process every unfinished item of the job with ``handler``.
+
+        Items already in the store keep their state, so calling this again
+        with the same items after an interruption resumes the job.
+
+        Args:
+            items: Item keys, usually reference numbers, to add to the job.
+            handler: Coroutine function ``handler(client, item, checkpoint)``.
+                An exception marks the item failed; cancellation leaves it
+                pending.
+
+        Returns:
+            Item counts once the run completes.
+        """
+        await asyncio.to_thread(self.store.add, self.job, list(items))
+        todo = [
+            state.item
+            for state in await asyncio.to_thread(self.store.items, self.job)
+            if state.status is ItemStatus.PENDING
+            or (state.status is ItemStatus.FAILED and state.attempts < self.max_attempts)
+        ]
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def process(item: str) -> None:
+            async with semaphore:
+                await asyncio.to_thread(self.store.mark_started, self.job, item)
+                try:
+                    await handler(self.client, item, Checkpoint(self.store, self.job, item))
+                except Exception as e:
+                    logger.warning(f"Job {self.job!r} item {item!r} failed: {e!r}")
+                    await asyncio.to_thread(self.store.mark_failed, self.job, item, repr(e))
+                else:
+                    await asyncio.to_thread(self.store.mark_done, self.job, item)
+
+        await asyncio.gather(*(process(item) for item in todo))
+        counts = await asyncio.to_thread(self.store.counts, self.job)
+        return JobReport(
+            done=counts[ItemStatus.DONE],
+            failed=counts[ItemStatus.FAILED],
+            pending=counts[ItemStatus.PENDING],
+        )
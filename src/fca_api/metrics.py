@@ -0,0 +1,385 @@
+"""Client metrics and an in-process Prometheus-text registry.
+
+The clients report what they are doing to an optional metrics recorder:
+any object implementing the `MetricsRecorder` protocol, passed as
+``metrics=`` to `fca_api.async_api.Client` (or `fca_api.raw_api.RawClient`).
+Recorders are called synchronously on the client's event loop and must not
+block. The following are reported:
+
+- per endpoint family (see `fca_api.const.EndpointFamily`): request
+  latency, response body size, JSON decode time and the time spent
+  waiting for the rate limiter
+- FCA API status codes, keyed by `fca_api.raw_status_codes.Code`
+- validation time per model type, measured around the conversion of each
+  API page into typed models
+- the number of API pages fetched per high-level call
+- the current limit of each `fca_api.concurrency.AdaptiveLimiter` created
+  with ``metrics=``, for recorders that also implement the optional
+  `ConcurrencyLimitRecorder`
+
+Requests answered from a response cache (see `fca_api.caching`) do not
+reach the network and are not reported.
+
+`MetricsRegistry` is a dependency-free recorder that keeps counters,
+gauges and histograms in memory and renders them in the Prometheus text exposition
+format. To export to another metrics system, implement `MetricsRecorder`
+on top of it instead.
+
+Example:
+    Exposing client metrics::
+
+        import fca_api
+
+        registry = fca_api.metrics.MetricsRegistry()
+        async with fca_api.async_api.Client(
+            credentials=("email@example.com", "api_key"),
+            metrics=registry,
+        ) as client:
+            await client.get_firm_permissions("122702")
+
+        print(registry.render_prometheus())
+"""
+
+import bisect
+import math
+import threading
+import typing
+
+from . import const, raw_status_codes
+
+#: Default histogram buckets (in seconds) for latencies.
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+#: Default histogram buckets for the number of pages fetched per call.
+DEFAULT_PAGE_BUCKETS: tuple[float, ...] = (1, 2, 3, 5, 10, 20, 50, 100)
+
+LabelsT = tuple[tuple[str, str], ...]
+
+
+@typing.runtime_checkable
+class MetricsRecorder(typing.Protocol):
+    """Interface of the metrics recorders accepted by the clients."""
+
+    def observe_request(self, family: const.EndpointFamily, duration: float, response_bytes: int) -> None:
+        """Record a completed upstream request.
+
+        Args:
+            family: The endpoint family of the request.
+            duration: Time in seconds from sending the request to receiving
+                the response, excluding any rate limiter wait.
+            response_bytes: Size of the (decoded) response body in bytes.
+        """
+
+    def observe_limiter_wait(self, family: const.EndpointFamily, duration: float) -> None:
+        """Record the time in seconds a request waited for the rate limiter."""
+
+    def observe_json_decode(self, family: const.EndpointFamily, duration: float) -> None:
+        """Record the time in seconds spent decoding a JSON response body."""
+
+    def observe_status_code(self, family: const.EndpointFamily, code: typing.Optional[raw_status_codes.Code]) -> None:
+        """Record the FCA API status code of a response.
+
+        Args:
+            family: The endpoint family of the request.
+            code: The known status code, or ``None`` if the response carried
+                no status code or one that is not in
+                `fca_api.raw_status_codes.ALL_KNOWN_CODES`.
+        """
+
+    def observe_validation(self, model: str, duration: float, items: int) -> None:
+        """Record the conversion of API data into typed models.
+
+        Args:
+            model: Name of the model type, e.g. ``"firm.FirmPermission"``.
+            duration: Time in seconds spent on the conversion.
+            items: Number of model instances produced.
+        """
+
+    def observe_pages(self, endpoint: str, pages: int) -> None:
+        """Record the number of API pages fetched by a high-level call.
+
+        Args:
+            endpoint: Name of the `fca_api.async_api.Client` method.
+            pages: Number of API pages fetched.
+        """
+
+
+@typing.runtime_checkable
+class ConcurrencyLimitRecorder(typing.Protocol):
+    """Optional extension of `MetricsRecorder` for recorders that also track
+    the limits of `fca_api.concurrency.AdaptiveLimiter` instances.
+
+    Recorders without this method are accepted by the limiters, which then
+    do not report their limit.
+    """
+
+    def observe_concurrency_limit(self, limiter: str, limit: int) -> None:
+        """Record the current limit of an adaptive concurrency limiter.
+
+        Args:
+            limiter: Name of the `fca_api.concurrency.AdaptiveLimiter`.
+            limit: Maximum number of requests it currently lets through
+                concurrently.
+        """
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(labels: LabelsT) -> str:
+    if not labels:
+        return ""
+    escaped = ((name, value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')) for name, value in labels)
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
+
+
+class Counter:
+    """A monotonically increasing metric, partitioned by label values."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str) -> None:
+        self.name = name
+        self.documentation = documentation
+        self._values: dict[LabelsT, float] = {}
+
+    def inc(self, labels: LabelsT = (), amount: float = 1) -> None:
+        """Increase the counter for ``labels`` by ``amount``."""
+        if amount < 0:
+            raise ValueError(f"Counters can only increase, got {amount!r}")
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, labels: LabelsT = ()) -> float:
+        """Return the current value for ``labels``."""
+        return self._values.get(labels, 0)
+
+    def render(self) -> list[str]:
+        """Return the samples in the Prometheus text format."""
+        return [
+            f"{self.name}{_format_labels(labels)} {_format_value(value)}"
+            for labels, value in sorted(self._values.items())
+        ]
+
+
+class Gauge:
+    """A metric that can go up and down, partitioned by label values."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str) -> None:
+        self.name = name
+        self.documentation = documentation
+        self._values: dict[LabelsT, float] = {}
+
+    def set(self, value: float, labels: LabelsT = ()) -> None:
+        """Set the gauge for ``labels`` to ``value``."""
+        self._values[labels] = value
+
+    def value(self, labels: LabelsT = ()) -> float:
+        """Return the current value for ``labels``."""
+        return self._values.get(labels, 0)
+
+    def render(self) -> list[str]:
+        """Return the samples in the Prometheus text format."""
+        return [
+            f"{self.name}{_format_labels(labels)} {_format_value(value)}"
+            for labels, value in sorted(self._values.items())
+        ]
+
+
+class _HistogramSeries:
+    __slots__ = ("bucket_counts", "count", "sum")
+
+    def __init__(self, size: int) -> None:
+        self.bucket_counts = [0] * size
+        self.count = 0
+        self.sum = 0.0
+
+
+class Histogram:
+    """A distribution of observations over fixed buckets, partitioned by
+    label values.
+
+    Args:
+        name: Metric name.
+        documentation: Help text.
+        buckets: Increasing upper bounds of the buckets; an implicit
+            ``+Inf`` bucket is always added.
+    """
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, buckets: typing.Sequence[float]) -> None:
+        if list(buckets) != sorted(set(buckets)):
+            raise ValueError(f"Histogram buckets must be strictly increasing, got {buckets!r}")
+        self.name = name
+        self.documentation = documentation
+        self.buckets = tuple(buckets)
+        self._series: dict[LabelsT, _HistogramSeries] = {}
+
+    def observe(self, value: float, labels: LabelsT = ()) -> None:
+        """Record ``value`` for ``labels``."""
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = _HistogramSeries(len(self.buckets) + 1)
+        series.bucket_counts[bisect.bisect_left(self.buckets, value)] += 1
+        series.count += 1
+        series.sum += value
+
+    def count(self, labels: LabelsT = ()) -> int:
+        """Return the number of observations for ``labels``."""
+        series = self._series.get(labels)
+        return 0 if series is None else series.count
+
+    def sum(self, labels: LabelsT = ()) -> float:
+        """Return the sum of the observations for ``labels``."""
+        series = self._series.get(labels)
+        return 0.0 if series is None else series.sum
+
+    def render(self) -> list[str]:
+        """Return the samples in the Prometheus text format."""
+        lines = []
+        for labels, series in sorted(self._series.items()):
+            cumulative = 0
+            for bound, bucket_count in zip((*self.buckets, math.inf), series.bucket_counts, strict=True):
+                cumulative += bucket_count
+                bucket_labels = _format_labels((*labels, ("le", _format_value(bound))))
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(series.sum)}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {series.count}")
+        return lines
+
+
+class MetricsRegistry:
+    """In-process `MetricsRecorder` keeping counters, gauges and histograms.
+
+    The registry is thread-safe, so a single instance can be shared by
+    clients running on different event loops (e.g. several
+    `fca_api.sync_api.Client` instances).
+
+    Args:
+        namespace: Prefix of all metric names.
+        latency_buckets: Histogram buckets, in seconds, for all durations.
+        page_buckets: Histogram buckets for the pages fetched per call.
+    """
+
+    def __init__(
+        self,
+        namespace: str = "fca_api",
+        latency_buckets: typing.Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+        page_buckets: typing.Sequence[float] = DEFAULT_PAGE_BUCKETS,
+    ) -> None:
+        self._lock = threading.Lock()
+        self.request_duration = Histogram(
+            f"{namespace}_request_duration_seconds",
+            "Latency of upstream API requests, excluding rate limiter waits.",
+            latency_buckets,
+        )
+        self.response_bytes = Counter(f"{namespace}_response_bytes_total", "Bytes received in API response bodies.")
+        self.json_decode_duration = Histogram(
+            f"{namespace}_json_decode_duration_seconds",
+            "Time spent decoding JSON response bodies.",
+            latency_buckets,
+        )
+        self.limiter_wait_duration = Histogram(
+            f"{namespace}_limiter_wait_duration_seconds",
+            "Time requests spent waiting for the rate limiter.",
+            latency_buckets,
+        )
+        self.status_codes = Counter(f"{namespace}_status_codes_total", "FCA API status codes received.")
+        self.validation_duration = Histogram(
+            f"{namespace}_validation_duration_seconds",
+            "Time spent converting API data into typed models, per page.",
+            latency_buckets,
+        )
+        self.validated_items = Counter(f"{namespace}_validated_items_total", "Typed model instances produced.")
+        self.pages_per_call = Histogram(
+            f"{namespace}_pages_per_call",
+            "API pages fetched per high-level client call.",
+            page_buckets,
+        )
+        self.concurrency_limit = Gauge(
+            f"{namespace}_concurrency_limit",
+            "Current limit of adaptive concurrency limiters.",
+        )
+
+    @property
+    def metrics(self) -> tuple[typing.Union[Counter, Gauge, Histogram], ...]:
+        """All metrics of the registry, in rendering order."""
+        return (
+            self.request_duration,
+            self.response_bytes,
+            self.json_decode_duration,
+            self.limiter_wait_duration,
+            self.status_codes,
+            self.validation_duration,
+            self.validated_items,
+            self.pages_per_call,
+            self.concurrency_limit,
+        )
+
+    def observe_request(self, family: const.EndpointFamily, duration: float, response_bytes: int) -> None:
+        labels = (("family", family.value),)
+        with self._lock:
+            self.request_duration.observe(duration, labels)
+            self.response_bytes.inc(labels, response_bytes)
+
+    def observe_limiter_wait(self, family: const.EndpointFamily, duration: float) -> None:
+        with self._lock:
+            self.limiter_wait_duration.observe(duration, (("family", family.value),))
+
+    def observe_json_decode(self, family: const.EndpointFamily, duration: float) -> None:
+        with self._lock:
+            self.json_decode_duration.observe(duration, (("family", family.value),))
+
+    def observe_status_code(self, family: const.EndpointFamily, code: typing.Optional[raw_status_codes.Code]) -> None:
+        if code is None:
+            labels = (("family", family.value), ("code", "unknown"), ("error", "unknown"))
+        else:
+            labels = (("family", family.value), ("code", code.value), ("error", str(code.is_error).lower()))
+        with self._lock:
+            self.status_codes.inc(labels)
+
+    def observe_validation(self, model: str, duration: float, items: int) -> None:
+        labels = (("model", model),)
+        with self._lock:
+            self.validation_duration.observe(duration, labels)
+            self.validated_items.inc(labels, items)
+
+    def observe_pages(self, endpoint: str, pages: int) -> None:
+        with self._lock:
+            self.pages_per_call.observe(pages, (("endpoint", endpoint),))
+
+    def observe_concurrency_limit(self, limiter: str, limit: int) -> None:
+        with self._lock:
+            self.concurrency_limit.set(limit, (("limiter", limiter),))
+
+    def render_prometheus(self) -> str:
+        """Return all metrics in the Prometheus text exposition format (0.0.4)."""
+        lines = []
+        with self._lock:
+            for metric in self.metrics:
+                lines.append(f"# HELP {metric.name} {metric.documentation}")
+                lines.append(f"# TYPE {metric.name} {metric.kind}")
+                lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
@@ -6,7 +6,11 @@ It provides direct access to the FS Register API endpoints with minimal
 abstraction/data validation.
 """
 
+from __future__ import annotations
+
+import asyncio
 import contextlib
+import time
 import typing
 import warnings
 from typing import Literal, Union
@@ -14,7 +18,23 @@ from urllib.parse import urlencode
 
 import httpx
 
-from . import const, exc, raw_status_codes
+from . import (
+    accounting,
+    breaker,
+    caching,
+    const,
+    deadlines,
+    exc,
+    hooks as fca_hooks,
+    raw_status_codes,
+    tracing,
+)
+
+if typing.TYPE_CHECKING:
+    from . import (
+        concurrency,
+        metrics as fca_metrics,
+    )
 
 
 @contextlib.asynccontextmanager
@@ -31,6 +51,7 @@ class FcaApiResponse(httpx.Response, typing.Generic[T]):
     """A simple :py:class:`httpx.Response`-based wrapper for the API responses."""
 
     _fca_data_override: T = UNSET
+    _fca_json: typing.Any = UNSET
 
     def __init__(self, response: httpx.Response) -> None:
         """Initialiser requiring a :py:class:`httpx.Response` object.
@@ -41,6 +62,27 @@ class FcaApiResponse(httpx.Response, typing.Generic[T]):
             The response from the original request.
         """
         self.__dict__.update(**response.__dict__)
+        # Copies decode their own body, so that callers cannot share mutable JSON
+        self.__dict__.pop("_fca_json", None)
+
+    def json(self, **kwargs: typing.Any) -> typing.Any:
+        """Decode the JSON response body.
+
+        The body is decoded once and the result reused by
+        :py:attr:`fca_api_status`, :py:attr:`result_info`,
+        :py:attr:`message` and :py:attr:`data`. Calls with keyword
+        arguments are passed through to :py:meth:`httpx.Response.json`.
+
+        Returns
+        -------
+        typing.Any
+            The decoded JSON body.
+        """
+        if kwargs:
+            return super().json(**kwargs)
+        if self._fca_json is UNSET:
+            self._fca_json = super().json()
+        return self._fca_json
 
     @property
     def fca_api_status(self) -> str:
@@ -114,6 +156,14 @@ class RawClient:
     #: All instances must have this private attribute to store API session state
     _api_session: httpx.AsyncClient
     _api_limiter: LimiterContextT
+    _limiter_feedback: typing.Optional[concurrency.FeedbackLimiter]
+    _circuit_breaker: typing.Optional[breaker.CircuitBreaker]
+    _cache: typing.Optional[caching.ResponseCache]
+    _metrics: typing.Optional[fca_metrics.MetricsRecorder]
+    _tracer: tracing.Tracer
+    _hooks: fca_hooks.HookRegistry
+    _max_retries: int
+    _retry_backoff: float
 
     def __init__(
         self,
@@ -122,6 +172,13 @@ class RawClient:
             httpx.AsyncClient,
         ],
         api_limiter: typing.Optional[LimiterContextT] = None,
+        circuit_breaker: typing.Optional[breaker.CircuitBreaker] = None,
+        cache: typing.Optional[caching.ResponseCache] = None,
+        metrics: typing.Optional[fca_metrics.MetricsRecorder] = None,
+        tracer: typing.Optional[tracing.Tracer] = None,
+        hooks: typing.Optional[fca_hooks.HookRegistry] = None,
+        max_retries: int = 0,
+        retry_backoff: float = 0.5,
     ) -> None:
         """Initialiser accepting either API credentials or a pre-configured
         session.
@@ -139,7 +196,40 @@ class RawClient:
 
                 Suggested package:
                     https://pypi.org/project/asyncio-throttle/
+
+                Limiters implementing
+                :py:class:`~fca_api.concurrency.FeedbackLimiter`, such as
+                :py:class:`~fca_api.concurrency.AdaptiveLimiter`, are
+                told the latency and outcome of every request.
+            circuit_breaker: :py:class:`~fca_api.breaker.CircuitBreaker`, optional
+                An optional circuit breaker tracking upstream failures per
+                endpoint family. While a family's circuit is open, requests
+                to it fail fast with
+                :py:class:`~fca_api.exc.FcaCircuitOpenError`.
+            cache: :py:class:`~fca_api.caching.ResponseCache`, optional
+                An optional cache for successful responses, supporting
+                stale-while-revalidate and stale-if-error serving.
+            metrics: :py:class:`~fca_api.metrics.MetricsRecorder`, optional
+                An optional recorder for request latency, response size,
+                JSON decode time, rate limiter waits and FCA status codes.
+            tracer: :py:class:`~fca_api.tracing.Tracer`, optional
+                An optional, OpenTelemetry-compatible tracer. Rate limiter
+                acquisition and HTTP requests are run in child spans of
+                the caller's current span.
+            hooks: :py:class:`~fca_api.hooks.HookRegistry`, optional
+                An optional registry of request lifecycle hooks, e.g. to
+                share hooks between clients. A new, empty registry is
+                created if not provided.
+            max_retries: int, default=0
+                Number of times a request failing with a transport error,
+                HTTP 429 or 5xx, or an FCA system error status is retried.
+                Retries are disabled by default.
+            retry_backoff: float, default=0.5
+                Delay in seconds before the first retry; doubled for each
+                further retry.
         """
+        if max_retries < 0 or retry_backoff < 0:
+            raise ValueError("max_retries and retry_backoff must not be negative.")
         if isinstance(credentials, httpx.AsyncClient):
             self._api_session = credentials
         elif isinstance(credentials, tuple | list) and len(credentials) == 2:
@@ -161,6 +251,16 @@ class RawClient:
             self._api_limiter = _noop_limiter
         else:
             self._api_limiter = api_limiter
+        # Duck-typed rather than checked against concurrency.FeedbackLimiter, so that
+        # clients without a feedback limiter need not import the module
+        self._limiter_feedback = api_limiter if callable(getattr(api_limiter, "record_outcome", None)) else None
+        self._circuit_breaker = circuit_breaker
+        self._cache = cache
+        self._metrics = metrics
+        self._tracer = tracing.NOOP_TRACER if tracer is None else tracer
+        self._hooks = fca_hooks.HookRegistry() if hooks is None else hooks
+        self._max_retries = max_retries
+        self._retry_backoff = retry_backoff
 
     @property
     def api_session(self) -> httpx.AsyncClient:
@@ -183,6 +283,440 @@ class RawClient:
         """
         return const.ApiConstants.API_VERSION.value
 
+    @property
+    def circuit_breaker(self) -> typing.Optional[breaker.CircuitBreaker]:
+        """:py:class:`~fca_api.breaker.CircuitBreaker` or ``None``:
+        The circuit breaker guarding upstream requests, if configured.
+        """
+        return self._circuit_breaker
+
+    @property
+    def cache(self) -> typing.Optional[caching.ResponseCache]:
+        """:py:class:`~fca_api.caching.ResponseCache` or ``None``:
+        The response cache, if configured.
+        """
+        return self._cache
+
+    @property
+    def metrics(self) -> typing.Optional[fca_metrics.MetricsRecorder]:
+        """:py:class:`~fca_api.metrics.MetricsRecorder` or ``None``:
+        The metrics recorder, if configured.
+        """
+        return self._metrics
+
+    @property
+    def hooks(self) -> fca_hooks.HookRegistry:
+        """:py:class:`~fca_api.hooks.HookRegistry`:
+        The request lifecycle hooks of this client.
+        """
+        return self._hooks
+
+    @property
+    def tracer(self) -> tracing.Tracer:
+        """:py:class:`~fca_api.tracing.Tracer`:
+        The tracer, :py:data:`~fca_api.tracing.NOOP_TRACER` if tracing is
+        disabled.
+        """
+        return self._tracer
+
+    async def aclose(self) -> None:
+        """Cancel pending cache refreshes and close the API session."""
+        if self._cache is not None:
+            await self._cache.aclose()
+        await self._api_session.aclose()
+
+    async def _get(
+        self,
+        url: str,
+        family: const.EndpointFamily,
+        check_status: bool = True,
+    ) -> FcaApiResponse:
+        """:py:class:`~fca_api.raw_api.FcaApiResponse`:
+        A private, base handler for ``GET`` requests to the API.
+
+        All endpoint handlers funnel through this method. It serves the
+        request from the response cache, if one is configured, and otherwise
+        delegates to :py:meth:`_send`.
+
+        .. note::
+
+           This is a private method and is **not** intended for direct use by
+           end users.
+
+        Parameters
+        ----------
+        url : str
+            The full request URL.
+
+        family : const.EndpointFamily
+            The endpoint family the URL belongs to.
+
+        check_status : bool, default=True
+            Whether to validate the HTTP and FCA API status codes of the
+            response.
+
+        Raises
+        ------
+        FcaRequestError
+            If the request failed and could not be answered from the cache.
+
+        Returns
+        -------
+        FcaApiResponse
+            Wrapper of the API response object.
+        """
+        if self._cache is None:
+            return await self._send(url, family, check_status)
+        out = await self._get_cached(url, family, check_status)
+        if check_status and self._is_not_found(out):
+            # "Not found" answers with an error status are cached, but raise on every lookup
+            self._check_response(out)
+        return out
+
+    async def _get_cached(
+        self,
+        url: str,
+        family: const.EndpointFamily,
+        check_status: bool,
+    ) -> FcaApiResponse:
+        """Like :py:meth:`_get`, for a client with a response cache, but
+        "not found" answers are returned even if their FCA API status is an
+        error."""
+        assert self._cache is not None
+        tracker = accounting.current()
+        if tracker is None:
+            response = await self._cache.fetch(url, lambda: self._send_cacheable(url, family, check_status))
+        else:
+            sent = False
+            waiting = True
+
+            async def send() -> FcaApiResponse:
+                nonlocal sent
+                sent = True
+                if not waiting:
+                    # A background refresh outliving this call is not billed to it
+                    return await self._send_cacheable(url, family, check_status)
+                # Shared fetches run without a tracker; bill the call that started this one
+                with accounting.activate(tracker):
+                    return await self._send_cacheable(url, family, check_status)
+
+            try:
+                response = await self._cache.fetch(url, send)
+            finally:
+                waiting = False
+            if not sent:
+                tracker.cache_hits += 1
+        # Hand out a private copy, as callers may override the response data
+        return FcaApiResponse(response)
+
+    async def _send_cacheable(
+        self,
+        url: str,
+        family: const.EndpointFamily,
+        check_status: bool,
+    ) -> FcaApiResponse:
+        """Send a request on behalf of the response cache.
+
+        Like :py:meth:`_send`, but "not found" answers are returned even if
+        their FCA API status is an error, so that they are negatively
+        cached; :py:meth:`_get` checks their status once they are returned
+        from the cache.
+        """
+        out = await self._send(url, family, check_status=False)
+        if check_status and not self._is_not_found(out):
+            self._check_response(out)
+        return out
+
+    @contextlib.asynccontextmanager
+    async def _limited(self, url: str, family: const.EndpointFamily) -> typing.AsyncGenerator[None, None]:
+        """Enter the rate limiter, reporting the wait to the metrics recorder,
+        tracer, ``on_limit_wait`` hooks and the active cost tracker."""
+        limit_wait_hooks = self._hooks.limit_wait_hooks
+        tracker = accounting.current()
+        if self._metrics is None and self._tracer is tracing.NOOP_TRACER and not limit_wait_hooks and tracker is None:
+            async with self._api_limiter():
+                yield
+            return
+        async with contextlib.AsyncExitStack() as stack:
+            with self._tracer.start_as_current_span(
+                "fca_api.limiter", attributes={"fca_api.endpoint_family": family.value}
+            ):
+                entered = time.monotonic()
+                await stack.enter_async_context(self._api_limiter())
+                waited = time.monotonic() - entered
+            if self._metrics is not None:
+                self._metrics.observe_limiter_wait(family, waited)
+            if tracker is not None:
+                # Every request, including retries, passes the limiter exactly once
+                tracker.requests += 1
+                tracker.limiter_wait += waited
+            if limit_wait_hooks:
+                await fca_hooks.fire(limit_wait_hooks, fca_hooks.LimitWaitEvent(url, family, waited))
+            yield
+
+    async def _send(
+        self,
+        url: str,
+        family: const.EndpointFamily,
+        check_status: bool = True,
+    ) -> FcaApiResponse:
+        """:py:class:`~fca_api.raw_api.FcaApiResponse`:
+        A private handler issuing a ``GET`` request to the API.
+
+        Retries transport errors and upstream failures up to
+        ``max_retries`` times, see :py:meth:`_send_once`. The request,
+        including its retries and rate limiter waits, is cancelled when the
+        current deadline (see :py:mod:`fca_api.deadlines`) passes.
+
+        .. note::
+
+           This is a private method and is **not** intended for direct use by
+           end users.
+
+        Parameters
+        ----------
+        url : str
+            The full request URL.
+
+        family : const.EndpointFamily
+            The endpoint family the URL belongs to.
+
+        check_status : bool, default=True
+            Whether to validate the HTTP and FCA API status codes of the
+            response.
+
+        Raises
+        ------
+        FcaRequestError
+            If there was a request exception or, when ``check_status`` is
+            set, an unsuccessful HTTP or FCA API status.
+        FcaDeadlineExceededError
+            If the current deadline passed first.
+
+        Returns
+        -------
+        FcaApiResponse
+            Wrapper of the API response object.
+        """
+        remaining = deadlines.remaining()
+        if remaining is None:
+            out = await self._send_with_retries(url, family)
+        elif remaining <= 0:
+            raise exc.FcaDeadlineExceededError(url)
+        else:
+            try:
+                async with asyncio.timeout(remaining):
+                    out = await self._send_with_retries(url, family)
+            except TimeoutError:
+                raise exc.FcaDeadlineExceededError(url) from None
+        if check_status:
+            self._check_response(out)
+        return out
+
+    async def _send_with_retries(self, url: str, family: const.EndpointFamily) -> FcaApiResponse:
+        """Send a request, retrying failures up to ``max_retries`` times.
+
+        Returns the last response, even if it is an upstream failure.
+        """
+        attempt = 0
+        while True:
+            error: typing.Optional[exc.FcaRequestError] = None
+            out: typing.Optional[FcaApiResponse] = None
+            try:
+                out = await self._send_once(url, family, attempt)
+            except exc.FcaCircuitOpenError:
+                raise
+            except exc.FcaRequestError as e:
+                if attempt >= self._max_retries:
+                    raise
+                error = e
+            else:
+                if attempt >= self._max_retries or not self._is_upstream_failure(out):
+                    return out
+            attempt += 1
+            if not await self._before_retry(url, family, attempt, error=error, response=out):
+                if error is not None:
+                    raise error
+                assert out is not None
+                return out
+
+    async def _send_once(self, url: str, family: const.EndpointFamily, attempt: int) -> FcaApiResponse:
+        """Issue a single ``GET`` request.
+
+        Applies the rate limiter and circuit breaker, reports to the metrics
+        recorder, tracer and hooks and wraps transport errors.
+        """
+        circuit_breaker = self._circuit_breaker
+        admission = None if circuit_breaker is None else circuit_breaker.before_request(family)
+        duration = 0.0
+        try:
+            async with self._limited(url, family):
+                if self._hooks.request_hooks:
+                    await fca_hooks.fire(self._hooks.request_hooks, fca_hooks.RequestEvent(url, family, attempt))
+                with self._tracer.start_as_current_span(
+                    "fca_api.http",
+                    attributes={"fca_api.endpoint_family": family.value, "url.full": url, "http.request.method": "GET"},
+                ) as span:
+                    started = time.monotonic()
+                    try:
+                        response = await self.api_session.get(url)
+                    finally:
+                        duration = time.monotonic() - started
+                    span.set_attribute("http.response.status_code", response.status_code)
+        except httpx.RequestError as e:
+            self._record_outcome(None, family, duration, admission)
+            raise exc.FcaRequestError(e) from None
+        except BaseException:
+            if circuit_breaker is not None:
+                # Cancelled or otherwise aborted - the outcome says nothing about upstream health
+                circuit_breaker.release(family, admission)
+            raise
+
+        out = FcaApiResponse(response)
+        self._observe_response(out, family, duration)
+        self._record_outcome(out, family, duration, admission)
+        if self._hooks.response_hooks:
+            await fca_hooks.fire(
+                self._hooks.response_hooks, fca_hooks.ResponseEvent(url, family, attempt, out, duration)
+            )
+        return out
+
+    async def _before_retry(
+        self,
+        url: str,
+        family: const.EndpointFamily,
+        attempt: int,
+        error: typing.Optional[BaseException] = None,
+        response: typing.Optional[FcaApiResponse] = None,
+    ) -> bool:
+        """Fire the ``on_retry`` hooks and wait before retry number ``attempt``.
+
+        The delay grows exponentially from ``retry_backoff`` seconds, and
+        honours a ``Retry-After`` header given in seconds.
+
+        Returns ``False``, without waiting, if the retry could not start
+        before the current deadline.
+        """
+        delay = self._retry_backoff * 2 ** (attempt - 1)
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after is not None and retry_after.strip().isdigit():
+            delay = max(delay, float(retry_after))
+        remaining = deadlines.remaining()
+        if remaining is not None and delay >= remaining:
+            return False
+        if self._hooks.retry_hooks:
+            await fca_hooks.fire(
+                self._hooks.retry_hooks,
+                fca_hooks.RetryEvent(url, family, attempt, delay, error=error, response=response),
+            )
+        await asyncio.sleep(delay)
+        return True
+
+    def _observe_response(self, response: FcaApiResponse, family: const.EndpointFamily, duration: float) -> None:
+        """Report a received response to the metrics recorder and the active
+        cost tracker."""
+        recorder = self._metrics
+        tracker = accounting.current()
+        if recorder is None and tracker is None:
+            return
+        response_bytes = len(response.content)
+        if recorder is not None:
+            recorder.observe_request(family, duration, response_bytes)
+        if tracker is not None:
+            tracker.response_bytes += response_bytes
+        if not response.is_success:
+            return
+        started = time.perf_counter()
+        try:
+            body = response.json()
+        except ValueError:
+            # Not a JSON body
+            return
+        decode_time = time.perf_counter() - started
+        if tracker is not None:
+            tracker.decode_time += decode_time
+        if recorder is not None:
+            recorder.observe_json_decode(family, decode_time)
+            fca_status_code = body.get("Status") if isinstance(body, dict) else None
+            code = None
+            if isinstance(fca_status_code, str):
+                code = raw_status_codes.ALL_KNOWN_CODES_DICT.get(fca_status_code.lower().strip())
+            recorder.observe_status_code(family, code)
+
+    def _record_outcome(
+        self,
+        response: typing.Optional[FcaApiResponse],
+        family: const.EndpointFamily,
+        duration: float,
+        admission: typing.Optional[breaker.Admission] = None,
+    ) -> None:
+        """Record the outcome of a request with the circuit breaker and a
+        feedback-driven rate limiter; ``response`` is ``None`` for transport
+        errors."""
+        circuit_breaker = self._circuit_breaker
+        limiter_feedback = self._limiter_feedback
+        if circuit_breaker is None and limiter_feedback is None:
+            return
+        failed = response is None or self._is_upstream_failure(response)
+        if circuit_breaker is not None:
+            if failed:
+                circuit_breaker.record_failure(family, duration, admission)
+            else:
+                circuit_breaker.record_success(family, duration, admission)
+        if limiter_feedback is not None:
+            limiter_feedback.record_outcome(duration, failed)
+
+    @staticmethod
+    def _is_upstream_failure(response: FcaApiResponse) -> bool:
+        """Whether a response indicates the upstream service, rather than the
+        request, is at fault."""
+        if response.status_code == 429 or response.status_code >= 500:
+            return True
+        if not response.is_success:
+            return False
+        try:
+            fca_status_code = response.fca_api_status
+        except ValueError:
+            # Not a JSON body
+            return True
+        return isinstance(fca_status_code, str) and fca_status_code.upper().startswith("FSR-API-99-")
+
+    @staticmethod
+    def _is_not_found(response: FcaApiResponse) -> bool:
+        """Whether a response reports that the requested resource does not
+        exist (see :py:func:`~fca_api.raw_status_codes.is_not_found`)."""
+        if not response.is_success:
+            return False
+        try:
+            payload = response.json()
+        except ValueError:
+            # Not a JSON body
+            return False
+        return isinstance(payload, dict) and raw_status_codes.is_not_found(payload.get("Status"))
+
+    @staticmethod
+    def _check_response(response: FcaApiResponse) -> None:
+        """Raise :py:class:`~fca_api.exc.FcaRequestError` if the response
+        carries an unsuccessful HTTP or FCA API status code."""
+        if not response.is_success:
+            raise exc.FcaRequestError(
+                f"API search request failed with status code {response.status_code}: "
+                f"{response.reason_phrase}. Please check the search parameters and try again."
+            )
+
+        fca_status_code = response.fca_api_status
+        fca_code_info = raw_status_codes.find_code(fca_status_code)
+        if fca_code_info is None:
+            warnings.warn(
+                f"Received unknown FCA API status code: {fca_status_code}. "
+                "Please ensure that your client is up to date.",
+                stacklevel=4,
+            )
+        elif fca_code_info.is_error:
+            raise exc.FcaRequestError(
+                f"API search request failed with FCA API status code {fca_status_code}: {response.message}"
+            )
+
     async def common_search(
         self,
         resource_name: str,
@@ -241,30 +775,7 @@ class RawClient:
             search_req["pgnp"] = page
         search_str = urlencode(search_req)
         url = f"{const.ApiConstants.BASEURL.value}/Search?{search_str}"
-        try:
-            async with self._api_limiter():
-                response = await self.api_session.get(url)
-        except httpx.RequestError as e:
-            raise exc.FcaRequestError(e) from None
-        out = FcaApiResponse(response)
-        if not out.is_success:
-            raise exc.FcaRequestError(
-                f"API search request failed with status code {out.status_code}: "
-                f"{out.reason_phrase}. Please check the search parameters and try again."
-            )
-
-        fca_status_code = out.fca_api_status
-        fca_code_info = raw_status_codes.find_code(fca_status_code)
-        if fca_code_info is None:
-            warnings.warn(
-                f"Received unknown FCA API status code: {fca_status_code}. "
-                "Please ensure that your client is up to date.",
-                stacklevel=2,
-            )
-        elif fca_code_info.is_error:
-            raise exc.FcaRequestError(
-                f"API search request failed with FCA API status code {fca_status_code}: {out.message}"
-            )
+        out = await self._get(url, const.EndpointFamily.SEARCH)
 
         if not out.data:
             # No results found - ensure that an empty list is returned (the API returns None sometimes)
@@ -385,6 +896,27 @@ class RawClient:
             Wrapper of the API response object - there may be no data in
             the response if the resource ref. number isn't found.
         """
+        url = self._resource_url(resource_ref_number, resource_type, modifiers=modifiers, page=page)
+        resource_type_info = const.ResourceTypes.from_type_name(resource_type)
+        return await self._get(url, const.EndpointFamily.from_resource_type(resource_type_info))
+
+    @staticmethod
+    def _resource_url(
+        resource_ref_number: str,
+        resource_type: str,
+        modifiers: tuple[str] = None,
+        page: int | None = None,
+    ) -> str:
+        """:py:class:`str`: Returns the request URL for a resource
+        information API endpoint.
+
+        Accepts the same parameters as :py:meth:`_get_resource_info`.
+
+        Raises
+        ------
+        ValueError
+            If the resource type is not valid.
+        """
         if resource_type not in const.ResourceTypes.all_types():
             raise ValueError('Resource type must be one of the strings ``"firm"``, ``"fund"``, or ``"individual"``')
 
@@ -406,32 +938,7 @@ class RawClient:
             search_str = urlencode(query_params)
             url += f"?{search_str}"
 
-        try:
-            async with self._api_limiter():
-                response = await self.api_session.get(url)
-        except httpx.RequestError as e:
-            raise exc.FcaRequestError(e) from None
-
-        out = FcaApiResponse(response)
-        if not out.is_success:
-            raise exc.FcaRequestError(
-                f"API search request failed with status code {out.status_code}: "
-                f"{out.reason_phrase}. Please check the search parameters and try again."
-            )
-
-        fca_status_code = out.fca_api_status
-        fca_code_info = raw_status_codes.find_code(fca_status_code)
-        if fca_code_info is None:
-            warnings.warn(
-                f"Received unknown FCA API status code: {fca_status_code}. "
-                "Please ensure that your client is up to date.",
-                stacklevel=2,
-            )
-        elif fca_code_info.is_error:
-            raise exc.FcaRequestError(
-                f"API search request failed with FCA API status code {fca_status_code}: {out.message}"
-            )
-        return out
+        return url
 
     async def get_firm(self, frn: str) -> FcaApiResponse:
         """:py:class:`~fca_api.raw_api.FcaApiResponse`:
@@ -1171,6 +1678,4 @@ class RawClient:
             raise NotImplementedError("Pagination is not supported for regulated markets at this time.")
         url = f"{const.ApiConstants.BASEURL.value}/CommonSearch?{urlencode({'q': 'RM'})}"
 
-        async with self._api_limiter():
-            response = await self.api_session.get(url)
-        return FcaApiResponse(response)
+        return await self._get(url, const.EndpointFamily.COMMON_SEARCH, check_status=False)
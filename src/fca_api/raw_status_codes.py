@@ -9,6 +9,7 @@ class Code:
     value: str
     is_error: bool  # True if an exception should be raised for this code
     description: str
+    is_not_found: bool = False  # True if the code reports that the requested resource does not exist
 
 
 ALL_KNOWN_CODES: tuple[Code, ...] = (
@@ -38,6 +39,7 @@ ALL_KNOWN_CODES: tuple[Code, ...] = (
         value="FSR-API-02-01-11",
         is_error=False,
         description="Firm not found - When SOQL returns no record",
+        is_not_found=True,
     ),
     Code(
         value="FSR-API-02-01-21",
@@ -54,6 +56,7 @@ ALL_KNOWN_CODES: tuple[Code, ...] = (
         value="FSR-API-02-04-11",
         is_error=False,
         description="Brand Name not found - When SOQL returns no record",
+        is_not_found=True,
     ),
     Code(
         value="FSR-API-02-04-21",
@@ -75,6 +78,7 @@ ALL_KNOWN_CODES: tuple[Code, ...] = (
         value="FSR-API-02-02-11",
         is_error=False,
         description="Address not found - When SOQL returns no record",
+        is_not_found=True,
     ),
     Code(
         value="FSR-API-02-02-21",
@@ -91,6 +95,7 @@ ALL_KNOWN_CODES: tuple[Code, ...] = (
         value="FSR-API-02-12-11",
         is_error=False,
         description="ERROR : Control Function not Found - When SOQL returns no record",
+        is_not_found=True,
     ),
     Code(
         value="FSR-API-02-12-21",
@@ -112,6 +117,7 @@ ALL_KNOWN_CODES: tuple[Code, ...] = (
         value="FSR-API-02-05-11",
         is_error=False,
         description="Individual not found - When SOQL returns no record",
+        is_not_found=True,
     ),
     Code(
         value="FSR-API-02-05-21",
@@ -128,6 +134,7 @@ ALL_KNOWN_CODES: tuple[Code, ...] = (
         value="FSR-API-02-03-11",
         is_error=False,
         description="Permission not found - When SOQL returns no record",
+        is_not_found=True,
     ),
     Code(
         value="FSR-API-02-03-21",
@@ -154,6 +161,7 @@ ALL_KNOWN_CODES: tuple[Code, ...] = (
         value="FSR-API-02-06-21",
         is_error=False,
         description="Firm Requirements not found - When SOQL returns no record",
+        is_not_found=True,
     ),
     # Firm Requirements Investment Types
     Code(
@@ -165,6 +173,7 @@ ALL_KNOWN_CODES: tuple[Code, ...] = (
         value="FSR-API-02-13-11",
         is_error=False,
         description="Investment Types not found - When SOQL returns no record",
+        is_not_found=True,
     ),
     Code(
         value="FSR-API-02-13-21",
@@ -181,6 +190,7 @@ ALL_KNOWN_CODES: tuple[Code, ...] = (
         value="FSR-API-02-09-11",
         is_error=False,
         description="Regulators not found - When SOQL returns no record",
+        is_not_found=True,
     ),
     Code(
         value="FSR-API-02-09-21",
@@ -197,6 +207,7 @@ ALL_KNOWN_CODES: tuple[Code, ...] = (
         value="FSR-API-02-07-11",
         is_error=False,
         description="Passport not found - When SOQL returns no record",
+        is_not_found=True,
     ),
     Code(
         value="FSR-API-02-07-21",
@@ -213,6 +224,7 @@ ALL_KNOWN_CODES: tuple[Code, ...] = (
         value="FSR-API-02-08-11",
         is_error=False,
         description="Passport permission not found - When SOQL returns no record",
+        is_not_found=True,
     ),
     Code(
         value="FSR-API-02-08-21",
@@ -229,6 +241,7 @@ ALL_KNOWN_CODES: tuple[Code, ...] = (
         value="FSR-API-02-14-11",
         is_error=False,
         description="Waiver information not found - When SOQL returns no record",
+        is_not_found=True,
     ),
     Code(
         value="FSR-API-02-14-21",
@@ -245,6 +258,7 @@ ALL_KNOWN_CODES: tuple[Code, ...] = (
         value="FSR-API-02-10-11",
         is_error=False,
         description="Exclusions information not found - When SOQL returns no record",
+        is_not_found=True,
     ),
     Code(
         value="FSR-API-02-10-21",
@@ -261,6 +275,7 @@ ALL_KNOWN_CODES: tuple[Code, ...] = (
         value="FSR-API-02-11-11",
         is_error=False,
         description="Disciplinary history information not found - When SOQL returns no record",
+        is_not_found=True,
     ),
     Code(
         value="FSR-API-02-11-21",
@@ -277,6 +292,7 @@ ALL_KNOWN_CODES: tuple[Code, ...] = (
         value="FSR-API-03-01-11",
         is_error=False,
         description="Individual not found - When SOQL returns no record",
+        is_not_found=True,
     ),
     Code(
         value="FSR-API-03-01-21",
@@ -293,6 +309,7 @@ ALL_KNOWN_CODES: tuple[Code, ...] = (
         value="FSR-API-03-02-11",
         is_error=False,
         description="Individual Control function not found - When SOQL returns no record",
+        is_not_found=True,
     ),
     Code(
         value="FSR-API-03-02-21",
@@ -309,6 +326,7 @@ ALL_KNOWN_CODES: tuple[Code, ...] = (
         value="FSR-API-03-03-11",
         is_error=False,
         description="Disciplinary history information not found - When SOQL returns no record",
+        is_not_found=True,
     ),
     Code(
         value="FSR-API-03-03-21",
@@ -330,6 +348,7 @@ ALL_KNOWN_CODES: tuple[Code, ...] = (
         value="FSR-API-04-01-11",
         is_error=False,
         description="No search result found - When SOQL returns no record",
+        is_not_found=True,
     ),
     Code(
         value="FSR-API-04-01-21",
@@ -351,6 +370,7 @@ ALL_KNOWN_CODES: tuple[Code, ...] = (
         value="FSR-API-05-04-11",
         is_error=True,
         description="Appointed Representative not found",
+        is_not_found=True,
     ),
     Code(
         value="FSR-API-02-07-22",
@@ -367,6 +387,7 @@ ALL_KNOWN_CODES: tuple[Code, ...] = (
         value="FSR-API-05-01-11",
         is_error=True,
         description="Product not found",
+        is_not_found=True,
     ),
     # Get subfund details
     Code(
@@ -384,6 +405,7 @@ ALL_KNOWN_CODES: tuple[Code, ...] = (
         value="FSR-API-05-02-11",
         is_error=True,
         description="Product Other Name not found",
+        is_not_found=True,
     ),
     # Generic Error Messages
     Code(
@@ -418,3 +440,20 @@ def find_code(value: str) -> Code | None:
     if out is None:
         warnings.warn(f"Unknown FCA API status code encountered: {value!r}", UserWarning, stacklevel=2)
     return out
+
+
+def is_not_found(value: str | None) -> bool:
+    """Check whether a status code reports a non-existent resource.
+
+    Unlike `find_code`, unknown values do not emit a warning.
+
+    Parameters:
+        value: The status code value to check.
+
+    Returns:
+        True if the value is a known "not found" status code.
+    """
+    if not isinstance(value, str):
+        return False
+    code = ALL_KNOWN_CODES_DICT.get(value.lower().strip(), None)
+    return code is not None and code.is_not_found
@@ -0,0 +1,265 @@
+"""Priority scheduling of requests sharing one rate budget.
+
+When a process serves interactive lookups and runs background work (bulk
+refreshes, cache warming) through the same client, a plain rate limiter
+serves requests in arrival order, so a burst of batch requests delays
+every user-facing call queued behind it. A `PriorityLimiter` instead
+queues requests per *priority class* and hands out a fixed number of
+concurrent slots:
+
+- between classes with queued requests, slots are shared by weighted fair
+  queuing: over time each class receives slots in proportion to its
+  ``weight``;
+- a class may hold ``reserved`` slots that other classes can never take,
+  so interactive requests do not wait for a slot behind long-running
+  batch work;
+- requests of a class still waiting for a slot can be cancelled with
+  `PriorityLimiter.cancel_queued`, e.g. to abandon a refresh on shutdown.
+
+The priority of a request is taken from the context: code run inside
+`priority` (and tasks it creates) uses the given class. Clients created
+with ``priority=`` and client views from
+`fca_api.async_api.Client.with_priority` (or
+`fca_api.sync_api.Client.with_priority`) apply it to each of their calls.
+Requests without a priority use the limiter's ``default`` class.
+
+The limiter is used as the ``api_limiter`` of a client and can wrap the
+actual rate limiter (``inner``), which is entered once a slot is held, so
+that the rate budget is consumed in priority order.
+
+Example:
+    Interactive lookups ahead of a background refresh::
+
+        import fca_api
+
+        limiter = fca_api.scheduling.PriorityLimiter(capacity=8, inner=throttler)
+        client = fca_api.async_api.Client(
+            credentials=("email@example.com", "api_key"),
+            api_limiter=limiter,
+        )
+        batch = client.with_priority(fca_api.scheduling.BATCH)
+
+        refresh = asyncio.ensure_future(asyncio.gather(*(batch.get_firm(frn) for frn in frns)))
+        firm = await client.get_firm("122702")  # not queued behind the refresh
+"""
+
+import asyncio
+import collections
+import contextlib
+import contextvars
+import dataclasses
+import math
+import typing
+
+from . import exc
+
+#: Priority class of user-facing requests.
+INTERACTIVE = "interactive"
+#: Priority class of background requests.
+BATCH = "batch"
+
+
+@dataclasses.dataclass(frozen=True)
+class PriorityClass:
+    """Scheduling parameters of a priority class.
+
+    Attributes:
+        name: Name used to select the class, e.g. with `priority`.
+        weight: Relative share of the slots the class receives while other
+            classes also have requests queued.
+        reserved: Number of slots only this class may use.
+    """
+
+    name: str
+    weight: float = 1.0
+    reserved: int = 0
+
+
+#: Interactive requests get four times the share of batch requests and one
+#: reserved slot.
+DEFAULT_CLASSES: tuple[PriorityClass, ...] = (
+    PriorityClass(INTERACTIVE, weight=4.0, reserved=1),
+    PriorityClass(BATCH, weight=1.0),
+)
+
+_current_priority: contextvars.ContextVar[typing.Optional[str]] = contextvars.ContextVar(
+    "fca_api_priority", default=None
+)
+
+
+def current_priority() -> typing.Optional[str]:
+    """Return the priority class set by the innermost `priority`, or ``None``."""
+    return _current_priority.get()
+
+
+@contextlib.contextmanager
+def priority(name: str) -> typing.Iterator[None]:
+    """Send the requests made in the block with priority class ``name``."""
+    token = _current_priority.set(name)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+@dataclasses.dataclass(slots=True)
+class _ClassState:
+    """Mutable per-class scheduler state."""
+
+    spec: PriorityClass
+    queue: collections.deque = dataclasses.field(default_factory=collections.deque)
+    in_flight: int = 0
+    #: Virtual finish time of the last slot granted to the class, or the
+    #: virtual start time of its next slot when it becomes backlogged
+    finish: float = 0.0
+
+
+class PriorityLimiter:
+    """Concurrency limiter with weighted fair queuing between priority classes.
+
+    Calling the limiter returns an async context manager holding one slot
+    for the current priority class (see `priority`). The limiter is designed
+    for use from a single event loop and performs no locking.
+
+    Args:
+        capacity: Total number of concurrent slots.
+        classes: The priority classes.
+        default: Class of requests made without a priority.
+        inner: Optional rate limiter (a callable returning an async context
+            manager) entered while a slot is held.
+
+    Raises:
+        ValueError: If the classes are empty, have duplicate names,
+            non-positive weights or more reserved slots than ``capacity``,
+            or ``default`` is not one of them.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 4,
+        classes: typing.Sequence[PriorityClass] = DEFAULT_CLASSES,
+        default: str = INTERACTIVE,
+        inner: typing.Optional[typing.Callable[[], typing.AsyncContextManager[typing.Any]]] = None,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError(f"capacity must be a positive integer, got {capacity!r}")
+        names = [spec.name for spec in classes]
+        if not names or len(set(names)) != len(names):
+            raise ValueError(f"Priority classes must be non-empty with unique names, got {names!r}")
+        if any(spec.weight <= 0 or spec.reserved < 0 for spec in classes):
+            raise ValueError("Priority class weights must be positive and reservations not negative.")
+        if sum(spec.reserved for spec in classes) > capacity:
+            raise ValueError(f"Priority classes reserve more than the capacity of {capacity} slots.")
+        if default not in names:
+            raise ValueError(f"Default priority {default!r} is not one of {names!r}")
+        self.capacity = capacity
+        self.default = default
+        self.inner = inner
+        self._states = {spec.name: _ClassState(spec) for spec in classes}
+        self._in_flight = 0
+        self._virtual_time = 0.0
+
+    @property
+    def classes(self) -> tuple[PriorityClass, ...]:
+        """The priority classes."""
+        return tuple(state.spec for state in self._states.values())
+
+    def in_flight(self, name: typing.Optional[str] = None) -> int:
+        """Return the number of slots held, in total or by class ``name``."""
+        return self._in_flight if name is None else self._state(name).in_flight
+
+    def queued(self, name: typing.Optional[str] = None) -> int:
+        """Return the number of requests waiting for a slot, in total or in
+        class ``name``."""
+        states = self._states.values() if name is None else (self._state(name),)
+        return sum(1 for state in states for waiter in state.queue if not waiter.done())
+
+    def cancel_queued(self, name: str) -> int:
+        """Cancel the requests of class ``name`` still waiting for a slot.
+
+        The cancelled requests raise `fca_api.exc.FcaQueueCancelledError`;
+        requests already holding a slot are not affected.
+
+        Returns:
+            The number of cancelled requests.
+        """
+        state = self._state(name)
+        cancelled = 0
+        while state.queue:
+            waiter = state.queue.popleft()
+            if not waiter.done():
+                waiter.set_exception(exc.FcaQueueCancelledError(name))
+                cancelled += 1
+        return cancelled
+
+    @contextlib.asynccontextmanager
+    async def __call__(self) -> typing.AsyncIterator[None]:
+        state = self._state(current_priority() or self.default)
+        await self._acquire(state)
+        try:
+            if self.inner is None:
+                yield
+            else:
+                async with self.inner():
+                    yield
+        finally:
+            self._release(state)
+
+    def _state(self, name: str) -> _ClassState:
+        try:
+            return self._states[name]
+        except KeyError:
+            raise ValueError(f"Unknown priority class {name!r}, expected one of {list(self._states)!r}") from None
+
+    async def _acquire(self, state: _ClassState) -> None:
+        if all(waiter.done() for waiter in state.queue):
+            # Newly backlogged: idle time earns no credit over other classes
+            state.finish = max(state.finish, self._virtual_time)
+        waiter = asyncio.get_running_loop().create_future()
+        state.queue.append(waiter)
+        self._dispatch()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled() and waiter.exception() is None:
+                # The slot was granted just before the cancellation
+                self._release(state)
+            else:
+                with contextlib.suppress(ValueError):
+                    state.queue.remove(waiter)
+            raise
+
+    def _release(self, state: _ClassState) -> None:
+        state.in_flight -= 1
+        self._in_flight -= 1
+        self._dispatch()
+
+    def _admissible(self, state: _ClassState) -> bool:
+        """Whether ``state`` may take a slot without using slots reserved by
+        other classes."""
+        free = self.capacity - self._in_flight
+        unused_reservations = sum(
+            max(0, other.spec.reserved - other.in_flight) for other in self._states.values() if other is not state
+        )
+        return free > unused_reservations
+
+    def _dispatch(self) -> None:
+        """Grant free slots to queued requests, in weighted fair order."""
+        while self._in_flight < self.capacity:
+            chosen: typing.Optional[_ClassState] = None
+            chosen_finish = math.inf
+            for state in self._states.values():
+                while state.queue and state.queue[0].done():
+                    state.queue.popleft()
+                if not state.queue or not self._admissible(state):
+                    continue
+                finish = state.finish + 1.0 / state.spec.weight
+                if finish < chosen_finish:
+                    chosen, chosen_finish = state, finish
+            if chosen is None:
+                return
+            self._virtual_time = max(self._virtual_time, chosen.finish)
+            chosen.finish = chosen_finish
+            chosen.in_flight += 1
+            self._in_flight += 1
+            chosen.queue.popleft().set_result(None)
@@ -0,0 +1,377 @@
+"""Caching sidecar server fronting the FS Register.
+
+When many processes or pods each run their own client, each keeps its own
+response cache and rate limiter: the same lookup goes upstream once per
+process, and no limiter sees the total request rate of the fleet.
+`SidecarServer` is a small HTTP server built on
+`fca_api.raw_api.RawClient` that these processes send their requests to
+instead. It answers:
+
+- ``GET /V0.1/...`` and ``GET /services/V0.1/...``: the FS Register
+  resource at the same path, fetched with the sidecar's credentials; the
+  upstream status and body are returned as received;
+- ``GET /metrics``: the client's metrics (when they are recorded by a
+  `fca_api.metrics.MetricsRegistry`), the requests answered by the
+  sidecar and the response cache statistics, in the Prometheus text
+  format;
+- ``GET /healthz``: ``ok``.
+
+Everything the raw client is configured with is shared by all callers: the
+response cache (see `fca_api.caching`), which also coalesces concurrent
+requests for the same URL into one upstream request, the rate limiter
+(e.g. a `fca_api.bulk.SqliteTokenBucket`, which also covers several
+sidecar processes on one host), the circuit breaker and retries. Error
+responses (any non-2xx HTTP status, or an FCA system error status) are
+never cached; they are answered from a stale cache entry where the cache's
+``stale_if_error`` allows and passed through otherwise. Transport errors
+are answered with HTTP 502, requests rejected by an open circuit with 503
+and requests exceeding ``request_timeout`` with 504.
+
+The server speaks plain HTTP/1.1 and is meant for a trusted internal
+network, not for exposure to the internet.
+
+Clients use a `sidecar_session` as their session. It sends requests for
+the FS Register to the sidecar, so no API credentials are needed, and
+resolves relative paths such as ``/V0.1/Firm/122702`` against it.
+
+Example:
+    Running a sidecar, usually done with ``fca-api serve`` (see
+    `fca_api.cli`)::
+
+        import fca_api
+
+        client = fca_api.raw_api.RawClient(
+            credentials=("email@example.com", "api_key"),
+            api_limiter=fca_api.bulk.SqliteTokenBucket("/tmp/fca-api-limiter.sqlite3"),
+            cache=fca_api.caching.ResponseCache(ttl=600, stale_if_error=86400),
+            metrics=fca_api.metrics.MetricsRegistry(),
+        )
+        async with fca_api.server.SidecarServer(client, host="0.0.0.0", port=8080) as server:
+            await server.serve_forever()
+
+    Using it from a pod::
+
+        async with fca_api.async_api.Client(
+            credentials=fca_api.server.sidecar_session("http://fca-sidecar:8080"),
+        ) as client:
+            firm = await client.get_firm("122702")
+"""
+
+import asyncio
+import contextlib
+import dataclasses
+import http
+import json
+import logging
+import math
+import typing
+
+import httpx
+
+from . import const, deadlines, exc, metrics, raw_api
+
+logger = logging.getLogger(__name__)
+
+_API_PREFIXES = (
+    f"/services/{const.ApiConstants.API_VERSION.value}/",
+    f"/{const.ApiConstants.API_VERSION.value}/",
+)
+_PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+_MAX_HEADERS = 100
+
+
+class _UpstreamFailureError(exc.FcaRequestError):
+    """An upstream error response, raised so that the cache neither stores
+    it nor prefers it over a stale entry."""
+
+    def __init__(self, response: httpx.Response) -> None:
+        super().__init__(f"Upstream error response with HTTP status {response.status_code}.")
+        self.response = response
+
+
+@dataclasses.dataclass(slots=True)
+class _Reply:
+    status: int
+    body: bytes
+    content_type: str = "application/json"
+    headers: dict[str, str] = dataclasses.field(default_factory=dict)
+
+    @classmethod
+    def error(cls, status: int, message: str, **headers: str) -> "_Reply":
+        return cls(status, json.dumps({"Message": message}).encode(), headers=headers)
+
+    def encode(self, keep_alive: bool) -> bytes:
+        try:
+            reason = http.HTTPStatus(self.status).phrase
+        except ValueError:
+            reason = ""
+        lines = [
+            f"HTTP/1.1 {self.status} {reason}",
+            f"Content-Type: {self.content_type}",
+            f"Content-Length: {len(self.body)}",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}",
+        ]
+        lines.extend(f"{name}: {value}" for name, value in self.headers.items())
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + self.body
+
+
+def _upstream_url(path: str, query: str) -> typing.Optional[str]:
+    """Return the FS Register URL for a request path, or ``None`` if the path
+    is not an API path."""
+    for prefix in _API_PREFIXES:
+        if path.startswith(prefix):
+            resource = path[len(prefix) :]
+            break
+    else:
+        return None
+    if any(segment in {"", ".", ".."} for segment in resource.split("/")):
+        return None
+    url = f"{const.ApiConstants.BASEURL.value}/{resource}"
+    return f"{url}?{query}" if query else url
+
+
+async def _read_request(reader: asyncio.StreamReader) -> typing.Optional[tuple[str, str, str, dict[str, str]]]:
+    """Read a request line and headers, returning ``None`` at end of stream.
+
+    Raises:
+        ValueError: If the request is malformed or too large.
+    """
+    line = await reader.readline()
+    if not line:
+        return None
+    parts = line.decode("latin-1").split()
+    if len(parts) != 3:
+        raise ValueError(f"Malformed request line: {line!r}")
+    method, target, version = parts
+    headers: dict[str, str] = {}
+    while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+        name, sep, value = line.decode("latin-1").partition(":")
+        if not sep or len(headers) >= _MAX_HEADERS:
+            raise ValueError("Malformed or too many request headers.")
+        headers[name.strip().lower()] = value.strip()
+    return method, target, version, headers
+
+
+class SidecarServer:
+    """HTTP server answering FS Register requests through a shared client.
+
+    Use the server as an async context manager, or call `start` and
+    `aclose`.
+
+    Args:
+        client: The raw client sending upstream requests. Configure it with
+            a response cache, a rate limiter and a metrics registry to share
+            them between all callers.
+        host: Interface to listen on.
+        port: Port to listen on; ``0`` picks a free port (see `port`).
+        request_timeout: Optional time limit in seconds for answering an API
+            request, including rate limiter waits and retries (see
+            `fca_api.deadlines`).
+    """
+
+    def __init__(
+        self,
+        client: raw_api.RawClient,
+        host: str = "127.0.0.1",
+        port: int = 8080,
+        request_timeout: typing.Optional[float] = None,
+    ) -> None:
+        if request_timeout is not None and request_timeout <= 0:
+            raise ValueError(f"request_timeout must be positive, got {request_timeout!r}")
+        self.client = client
+        self.host = host
+        self.request_timeout = request_timeout
+        self.requests = metrics.Counter("fca_api_sidecar_requests_total", "Requests answered by the sidecar.")
+        self._port = port
+        self._server: typing.Optional[asyncio.Server] = None
+        self._connections: set[asyncio.Task] = set()
+
+    @property
+    def port(self) -> int:
+        """The port listened on, once started."""
+        if self._server is not None and self._server.sockets:
+            return self._server.sockets[0].getsockname()[1]
+        return self._port
+
+    @property
+    def url(self) -> str:
+        """The base URL of the server."""
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self) -> None:
+        """Start listening for connections."""
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self._port)
+        logger.info(f"Serving the FS Register API on {self.url}")
+
+    async def serve_forever(self) -> None:
+        """Serve until cancelled."""
+        if self._server is None:
+            await self.start()
+        assert self._server is not None
+        await self._server.serve_forever()
+
+    async def aclose(self) -> None:
+        """Stop listening, close open connections and close the client."""
+        if self._server is not None:
+            self._server.close()
+            for task in list(self._connections):
+                task.cancel()
+            await asyncio.gather(*self._connections, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+        await self.client.aclose()
+
+    async def __aenter__(self) -> "SidecarServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: typing.Any) -> None:
+        await self.aclose()
+
+    def render_metrics(self) -> str:
+        """Return the metrics served at ``/metrics``."""
+        parts = []
+        recorder = self.client.metrics
+        if isinstance(recorder, metrics.MetricsRegistry):
+            parts.append(recorder.render_prometheus())
+        own: list[metrics.Counter] = [self.requests]
+        cache = self.client.cache
+        if cache is not None:
+            events = metrics.Counter("fca_api_sidecar_cache_events_total", "Response cache events by kind.")
+            for field in dataclasses.fields(cache.stats):
+                events.inc((("event", field.name),), getattr(cache.stats, field.name))
+            own.append(events)
+        for metric in own:
+            lines = [f"# HELP {metric.name} {metric.documentation}", f"# TYPE {metric.name} {metric.kind}"]
+            parts.append("\n".join(lines + metric.render()) + "\n")
+        return "".join(parts)
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        assert task is not None
+        self._connections.add(task)
+        try:
+            keep_alive = True
+            while keep_alive:
+                try:
+                    request = await _read_request(reader)
+                except ValueError as e:
+                    reply, keep_alive = _Reply.error(400, str(e)), False
+                else:
+                    if request is None:
+                        return
+                    method, target, version, headers = request
+                    keep_alive = (
+                        version == "HTTP/1.1"
+                        and headers.get("connection", "").lower() != "close"
+                        # Request bodies are not read, so the connection cannot be reused
+                        and "content-length" not in headers
+                        and "transfer-encoding" not in headers
+                    )
+                    reply = await self._respond(method, target)
+                self.requests.inc((("status", str(reply.status)),))
+                writer.write(reply.encode(keep_alive))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._connections.discard(task)
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def _respond(self, method: str, target: str) -> _Reply:
+        path, _, query = target.partition("?")
+        if method != "GET":
+            return _Reply.error(405, "Only GET requests are supported.", Allow="GET")
+        if path == "/healthz":
+            return _Reply(200, b"ok\n", "text/plain; charset=utf-8")
+        if path == "/metrics":
+            return _Reply(200, self.render_metrics().encode(), _PROMETHEUS_CONTENT_TYPE)
+        url = _upstream_url(path, query)
+        if url is None:
+            return _Reply.error(404, f"Not an FS Register API path: {path}")
+        try:
+            family = const.EndpointFamily.from_url(url)
+        except ValueError as e:
+            return _Reply.error(404, str(e))
+        try:
+            return await self._forward(url, family)
+        except Exception:
+            logger.exception(f"Failed to answer the request for {url}")
+            return _Reply.error(500, "Internal sidecar error.")
+
+    async def _forward(self, url: str, family: const.EndpointFamily) -> _Reply:
+        try:
+            if self.request_timeout is None:
+                response = await self._fetch(url, family)
+            else:
+                with deadlines.deadline(self.request_timeout):
+                    response = await self._fetch(url, family)
+        except _UpstreamFailureError as e:
+            response = e.response
+        except exc.FcaCircuitOpenError as e:
+            return _Reply.error(503, str(e), **{"Retry-After": str(math.ceil(e.retry_after))})
+        except exc.FcaRequestError as e:
+            return _Reply.error(502, str(e))
+        except exc.FcaDeadlineExceededError as e:
+            return _Reply.error(504, str(e))
+        return _Reply(response.status_code, response.content, response.headers.get("content-type", "application/json"))
+
+    async def _fetch(self, url: str, family: const.EndpointFamily) -> httpx.Response:
+        cache = self.client.cache
+        if cache is None:
+            return await self._fetch_upstream(url, family)
+        return await cache.fetch(url, lambda: self._fetch_upstream(url, family))
+
+    async def _fetch_upstream(self, url: str, family: const.EndpointFamily) -> httpx.Response:
+        response = await self.client._send(url, family, check_status=False)
+        if not response.is_success or self.client._is_upstream_failure(response):
+            raise _UpstreamFailureError(response)
+        return response
+
+
+class SidecarTransport(httpx.AsyncBaseTransport):
+    """HTTP transport sending requests for the FS Register to a sidecar.
+
+    Requests to other hosts are sent unchanged.
+
+    Args:
+        url: Base URL of the sidecar, e.g. ``http://fca-sidecar:8080``.
+        inner: Transport used to send the requests; a new
+            `httpx.AsyncHTTPTransport` by default.
+    """
+
+    def __init__(self, url: str, inner: typing.Optional[httpx.AsyncBaseTransport] = None) -> None:
+        self.url = httpx.URL(url)
+        self._inner = httpx.AsyncHTTPTransport() if inner is None else inner
+        self._upstream_host = httpx.URL(const.ApiConstants.BASEURL.value).host
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if request.url.host == self._upstream_host:
+            request.url = request.url.copy_with(scheme=self.url.scheme, host=self.url.host, port=self.url.port)
+            request.headers["Host"] = self.url.netloc.decode("ascii")
+        return await self._inner.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+
+def sidecar_session(
+    url: str,
+    transport: typing.Optional[httpx.AsyncBaseTransport] = None,
+    **kwargs: typing.Any,
+) -> httpx.AsyncClient:
+    """Return a session sending FS Register requests to the sidecar at ``url``.
+
+    Pass the session as the ``credentials`` of a client. The FS Register
+    URLs built by the clients are redirected to the sidecar (see
+    `SidecarTransport`), and relative paths are resolved against ``url``.
+
+    Args:
+        url: Base URL of the sidecar.
+        transport: Transport used to reach the sidecar.
+        **kwargs: Further arguments of `httpx.AsyncClient`.
+    """
+    kwargs.setdefault("headers", {"ACCEPT": "application/json"})
+    return httpx.AsyncClient(base_url=url, transport=SidecarTransport(url, inner=transport), **kwargs)
@@ -0,0 +1,316 @@
+"""Synchronous Financial Services Register API client.
+
+This module provides a blocking `Client` with the same method surface as
+`fca_api.async_api.Client`, for use from synchronous code such as Django
+views or Celery tasks.
+
+Calling ``asyncio.run`` around each async call creates a fresh event loop,
+and with it a fresh HTTP connection pool, every time - losing keep-alive and
+TLS session reuse. Instead, every sync client in a process shares a single
+persistent event loop running in a daemon thread. Each `Client` owns one
+underlying async client (and connection pool) that lives on that loop, and
+its methods submit coroutines to the loop and block until they complete.
+
+The facade is thread-safe: any number of threads may share one `Client`, and
+their requests are multiplexed over the same connection pool. Create one
+client per process (e.g. at module level) rather than one per request.
+
+After ``os.fork()`` (e.g. in pre-forking worker pools) the loop thread is
+recreated in the child on first use, and clients created from
+``(email, api_key)`` credentials transparently open a new connection pool.
+
+Example:
+    Basic usage::
+
+        import fca_api.sync_api
+
+        client = fca_api.sync_api.Client(
+            credentials=("email@example.com", "api_key")
+        )
+
+        def firm_view(request, frn):
+            firm = client.get_firm(frn)
+            return render(request, "firm.html", {"firm": firm})
+
+    As a context manager::
+
+        with fca_api.sync_api.Client(
+            credentials=("email@example.com", "api_key")
+        ) as client:
+            page = client.search_frn("revolution")
+            for firm in page.data:
+                print(f"{firm.name} (FRN: {firm.frn})")
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import logging
+import os
+import threading
+import typing
+
+import httpx
+
+from . import async_api, raw_api, tracing, types
+
+if typing.TYPE_CHECKING:
+    import concurrent.futures
+
+    from . import (
+        breaker,
+        caching,
+        hooks as fca_hooks,
+        metrics as fca_metrics,
+    )
+
+logger = logging.getLogger(__name__)
+
+T = typing.TypeVar("T")
+
+
+class _LoopThread:
+    """An event loop running forever in a daemon thread."""
+
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self._run, name="fca-api-event-loop", daemon=True)
+        self.thread.start()
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def run(self, coro: typing.Coroutine[typing.Any, typing.Any, T]) -> T:
+        if threading.current_thread() is self.thread:
+            coro.close()
+            raise RuntimeError("Synchronous FCA API calls cannot be made from the client's own event loop.")
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+
+_loop_thread: typing.Optional[_LoopThread] = None
+_loop_thread_lock = threading.Lock()
+
+
+def _get_loop_thread() -> _LoopThread:
+    global _loop_thread
+    with _loop_thread_lock:
+        if _loop_thread is None:
+            _loop_thread = _LoopThread()
+        return _loop_thread
+
+
+def _reset_after_fork() -> None:
+    # The loop thread does not survive a fork; the child starts its own on first use
+    global _loop_thread, _loop_thread_lock
+    _loop_thread = None
+    _loop_thread_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def _sync_method(name: str) -> typing.Callable:
+    async_method = getattr(async_api.Client, name)
+
+    @functools.wraps(async_method)
+    def method(self: "Client", *args, **kwargs):
+        client = self._get_async_client()
+        return _get_loop_thread().run(getattr(client, name)(*args, **kwargs))
+
+    method.__module__ = __name__
+    method.__qualname__ = f"Client.{name}"
+    return method
+
+
+class Client:
+    """Synchronous Financial Services Register API client.
+
+    Accepts the same arguments as `fca_api.async_api.Client`, and exposes
+    each of its public API methods (``search_frn``, ``get_firm``, ...) as a
+    blocking method with the same signature and return type.
+
+    Attributes:
+        api_version: The API version being used.
+
+    Example:
+        Fetching all pages of a search::
+
+            client = Client(credentials=("email@example.com", "api_key"))
+            page = client.search_frn("Barclays")
+            while page.pagination.has_next:
+                page = client.search_frn(
+                    "Barclays",
+                    next_page=page.pagination.next_page,
+                )
+            client.close()
+    """
+
+    _async_client: typing.Optional[async_api.Client]
+    _pid: int
+
+    def __init__(
+        self,
+        credentials: typing.Union[
+            typing.Tuple[str, str],
+            httpx.AsyncClient,
+        ],
+        api_limiter: typing.Optional[raw_api.LimiterContextT] = None,
+        page_token_serializer: typing.Optional[types.pagination.PageTokenSerializer] = None,
+        circuit_breaker: typing.Optional[breaker.CircuitBreaker] = None,
+        cache: typing.Optional[caching.ResponseCache] = None,
+        metrics: typing.Optional[fca_metrics.MetricsRecorder] = None,
+        tracer: typing.Optional[tracing.Tracer] = None,
+        hooks: typing.Optional[fca_hooks.HookRegistry] = None,
+        max_retries: int = 0,
+        retry_backoff: float = 0.5,
+        report_costs: bool = False,
+        priority: typing.Optional[str] = None,
+        call_timeout: typing.Optional[float] = None,
+        parse_offload_threshold: typing.Optional[int] = None,
+        parse_executor: typing.Optional[concurrent.futures.Executor] = None,
+    ) -> None:
+        """Initialize the synchronous FCA API client.
+
+        Args:
+            credentials: Authentication credentials, as for
+                `fca_api.async_api.Client`. A pre-configured
+                ``httpx.AsyncClient`` is bound to this process and cannot
+                be reused after a fork.
+            api_limiter: Optional async context manager for rate limiting.
+                It is entered on the shared background event loop.
+            page_token_serializer: Optional serializer for pagination tokens.
+            circuit_breaker: Optional circuit breaker.
+            cache: Optional response cache.
+            metrics: Optional metrics recorder. It is called on the shared
+                background event loop, so it must be thread-safe.
+            tracer: Optional OpenTelemetry-compatible tracer. Spans are
+                opened on the shared background event loop.
+            hooks: Optional registry of request lifecycle hooks. Hooks are
+                called on the shared background event loop.
+            max_retries: Number of retries of failed requests (default: 0).
+            retry_backoff: Delay in seconds before the first retry.
+            report_costs: Whether to attach a cost report to every result.
+            priority: Optional priority class of the client's calls (see
+                `fca_api.scheduling`).
+            call_timeout: Optional budget in seconds for each call (see
+                `fca_api.deadlines`).
+            parse_offload_threshold: Optional number of items from which an
+                API page is validated in a worker thread.
+            parse_executor: Optional thread pool for offloaded validation.
+        """
+        self._init_kwargs = {
+            "credentials": credentials,
+            "api_limiter": api_limiter,
+            "page_token_serializer": page_token_serializer,
+            "circuit_breaker": circuit_breaker,
+            "cache": cache,
+            "metrics": metrics,
+            "tracer": tracer,
+            "hooks": hooks,
+            "max_retries": max_retries,
+            "retry_backoff": retry_backoff,
+            "report_costs": report_costs,
+            "priority": priority,
+            "call_timeout": call_timeout,
+            "parse_offload_threshold": parse_offload_threshold,
+            "parse_executor": parse_executor,
+        }
+        self._lock = threading.Lock()
+        self._async_client = None
+        self._pid = os.getpid()
+        self._get_async_client()
+
+    def __enter__(self) -> Client:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying HTTP session."""
+        with self._lock:
+            client, self._async_client = self._async_client, None
+        if client is not None and self._pid == os.getpid():
+            _get_loop_thread().run(client.aclose())
+
+    def with_priority(self, priority: typing.Optional[str]) -> Client:
+        """Return a view of this client whose calls use priority class
+        ``priority`` (see `fca_api.scheduling`).
+
+        The view shares this client's underlying async client and event
+        loop; close the client, not the view.
+        """
+        return _PriorityView(self, priority)
+
+    @property
+    def priority(self) -> typing.Optional[str]:
+        """The priority class of the client's calls, if set."""
+        return self._get_async_client().priority
+
+    @property
+    def async_client(self) -> async_api.Client:
+        """The underlying async client, bound to the background event loop.
+
+        Its coroutines must only be awaited on that loop.
+        """
+        return self._get_async_client()
+
+    @property
+    def api_version(self) -> str:
+        """The API version string."""
+        return self._get_async_client().api_version
+
+    def _get_async_client(self) -> async_api.Client:
+        with self._lock:
+            if self._pid != os.getpid():
+                if isinstance(self._init_kwargs["credentials"], httpx.AsyncClient):
+                    raise RuntimeError(
+                        "A sync Client created with an httpx.AsyncClient cannot be used after a fork; "
+                        "create the client in the child process instead."
+                    )
+                logger.debug("Process forked: opening a new HTTP session")
+                self._async_client = None
+                self._pid = os.getpid()
+            if self._async_client is None:
+                self._async_client = _get_loop_thread().run(self._create_async_client())
+            return self._async_client
+
+    async def _create_async_client(self) -> async_api.Client:
+        # Created on the loop thread so that any loop-bound state lives there
+        return async_api.Client(**self._init_kwargs)
+
+
+class _PriorityView(Client):
+    """A `Client` view returned by `Client.with_priority`."""
+
+    _view: typing.Optional[tuple[async_api.Client, async_api.Client]]
+
+    def __init__(self, parent: Client, priority: typing.Optional[str]) -> None:
+        self._parent = parent
+        self._view_priority = priority
+        self._lock = threading.Lock()
+        self._view = None
+
+    def close(self) -> None:
+        """Do nothing: the HTTP session belongs to the parent client."""
+
+    def with_priority(self, priority: typing.Optional[str]) -> Client:
+        return self._parent.with_priority(priority)
+
+    def _get_async_client(self) -> async_api.Client:
+        client = self._parent._get_async_client()
+        with self._lock:
+            # The parent opens a new async client after a fork or close
+            if self._view is None or self._view[0] is not client:
+                self._view = (client, client.with_priority(self._view_priority))
+            return self._view[1]
+
+
+for _name, _member in inspect.getmembers(async_api.Client, inspect.iscoroutinefunction):
+    if not _name.startswith("_") and _name != "aclose":
+        setattr(Client, _name, _sync_method(_name))
+del _name, _member
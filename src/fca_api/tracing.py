@@ -0,0 +1,104 @@
+"""Optional tracing of client calls.
+
+The clients can open tracing spans for every stage of a call, so that the
+latency of a workflow fanning out into many API calls can be attributed:
+
+- ``fca_api.Client.<method>``: a public `fca_api.async_api.Client` call,
+  with the ``fca_api.endpoint`` (method name), the reference number
+  (``fca_api.frn``, ``fca_api.irn`` or ``fca_api.prn``, where applicable)
+  and the ``fca_api.item_count`` of the result
+- ``fca_api.page``: one iteration of the pagination loop, with
+  ``fca_api.endpoint``, ``fca_api.page`` and ``fca_api.item_count``
+- ``fca_api.limiter``: acquisition of the rate limiter, with
+  ``fca_api.endpoint_family``
+- ``fca_api.http``: the HTTP request, with ``fca_api.endpoint_family``,
+  ``url.full``, ``http.request.method`` and ``http.response.status_code``
+- ``fca_api.validate``: conversion of an API page into typed models, with
+  ``fca_api.model`` and ``fca_api.item_count``
+
+The `Tracer` interface is the subset of the OpenTelemetry tracing API used
+by the clients, so an OpenTelemetry tracer can be passed as ``tracer=``
+directly. Spans are opened with ``start_as_current_span`` and therefore
+nest under the caller's current span.
+
+Tracing is disabled by default (`NOOP_TRACER`). When disabled, the clients
+skip the span bookkeeping altogether where it matters, and otherwise only
+enter a shared no-op context manager.
+
+Example:
+    Tracing with OpenTelemetry::
+
+        from opentelemetry import trace
+
+        import fca_api
+
+        client = fca_api.async_api.Client(
+            credentials=("email@example.com", "api_key"),
+            tracer=trace.get_tracer("fca_api"),
+        )
+"""
+
+import typing
+
+AttributeValueT = typing.Union[str, bool, int, float]
+
+
+class Span(typing.Protocol):
+    """A tracing span, as returned by `Tracer.start_as_current_span`."""
+
+    def set_attribute(self, key: str, value: AttributeValueT) -> None:
+        """Set a single attribute on the span."""
+
+
+class Tracer(typing.Protocol):
+    """Interface of the tracers accepted by the clients.
+
+    Compatible with ``opentelemetry.trace.Tracer``.
+    """
+
+    def start_as_current_span(
+        self,
+        name: str,
+        attributes: typing.Optional[typing.Mapping[str, AttributeValueT]] = None,
+    ) -> typing.ContextManager[Span]:
+        """Return a context manager running its body in a new child span.
+
+        The span is ended, and any exception raised by the body recorded on
+        it, when the context manager exits.
+        """
+
+
+class _NoOpSpan:
+    __slots__ = ()
+
+    def set_attribute(self, key: str, value: AttributeValueT) -> None:
+        pass
+
+    def __enter__(self) -> "_NoOpSpan":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        return None
+
+
+class NoOpTracer:
+    """A `Tracer` that records nothing.
+
+    Every call returns the same stateless span object, which doubles as its
+    own context manager, so no objects are allocated per span.
+    """
+
+    __slots__ = ()
+
+    def start_as_current_span(
+        self,
+        name: str,
+        attributes: typing.Optional[typing.Mapping[str, AttributeValueT]] = None,
+    ) -> _NoOpSpan:
+        return _NOOP_SPAN
+
+
+_NOOP_SPAN = _NoOpSpan()
+
+#: The default, disabled tracer.
+NOOP_TRACER = NoOpTracer()
@@ -6,6 +6,8 @@ automatic validation, serialization, and IDE support.
 
 Modules:
     - `base`: Base classes with common validation logic
+    - `compact`: Memory-efficient tuple-backed search result records
+    - `cost`: Cost reports of client calls
     - `field_parsers`: Custom field parsing and validation functions
     - `firm`: Types for firm-related API responses
     - `individual`: Types for individual-related API responses
@@ -40,4 +42,51 @@ See Also:
     - `Pydantic Documentation <https://docs.pydantic.dev/>`_
 """
 
-from . import annotations, base, field_parsers, firm, individual, markets, pagination, products, search, settings
+import typing
+
+if typing.TYPE_CHECKING:
+    from . import (
+        annotations,
+        base,
+        compact,
+        cost,
+        field_parsers,
+        firm,
+        individual,
+        markets,
+        pagination,
+        products,
+        search,
+        settings,
+    )
+
+# Type modules are imported on first attribute access; see `fca_api.__getattr__`.
+_SUBMODULES = frozenset(
+    {
+        "annotations",
+        "base",
+        "compact",
+        "cost",
+        "field_parsers",
+        "firm",
+        "individual",
+        "markets",
+        "pagination",
+        "products",
+        "search",
+        "settings",
+    }
+)
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name in _SUBMODULES:
+        # ``__import__`` rather than ``importlib.import_module`` so that lazily
+        # imported submodules are still reported by ``python -X importtime``.
+        __import__(f"{__name__}.{name}")
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _SUBMODULES)
@@ -68,6 +68,8 @@ class Base(pydantic.BaseModel):
         - Filtering of "[notinuse]" fields from API responses
         - Standardized validation configuration
         - Support for both strict and flexible validation modes
+        - Deferred schema build: validators are compiled on first use rather
+          than at import time
 
     Example:
         Define a custom API model::
@@ -98,6 +100,8 @@ class Base(pydantic.BaseModel):
         constructor when working with raw API data.
     """
 
+    model_config = pydantic.ConfigDict(defer_build=True)
+
     @classmethod
     def model_validate(cls, data: typing.Any) -> "Base":
         """Validate and create model instance from API response data.
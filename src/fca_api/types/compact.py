@@ -0,0 +1,106 @@
+"""Compact, tuple-backed representations of search results.
+
+Full pydantic search result models carry a per-instance ``__dict__``,
+``__pydantic_fields_set__`` and further bookkeeping, and a validated
+``pydantic.HttpUrl`` object per URL. For workloads that hold millions of
+search results in memory (e.g. deduplicating a register snapshot) that
+overhead dominates.
+
+The records in this module are ``typing.NamedTuple`` classes: immutable,
+hashable, without a per-instance ``__dict__``, and storing URLs as plain
+strings. Low-cardinality values (``status`` and ``type``) are interned by
+the models themselves (see `fca_api.types.field_parsers.Interned`), so every
+record shares the same string objects. Each record can be
+converted back to the corresponding full model on demand with
+``to_model()``.
+
+Records are produced by the search methods of `fca_api.async_api.Client`
+when called with ``compact=True``, or from an existing model with
+``from_model()``.
+
+Example:
+    Deduplicating a large search::
+
+        seen = set()
+        page = await client.search_frn("limited", compact=True)
+        seen.update(page.data)
+
+        firm = next(iter(seen))
+        print(firm.frn, firm.status)
+        full = firm.to_model()  # types.search.FirmSearchResult
+"""
+
+import typing
+
+from . import base, search
+
+CompactSearchResultT = typing.TypeVar("CompactSearchResultT", bound="_CompactSearchResultMixin")
+
+
+class _CompactSearchResultMixin:
+    """Conversions shared by the compact search result records."""
+
+    __slots__ = ()
+
+    model: typing.ClassVar[type[base.Base]]
+
+    @classmethod
+    def from_model(cls: type[CompactSearchResultT], item: base.Base) -> CompactSearchResultT:
+        """Create a compact record from a validated full model."""
+        values = {name: getattr(item, name) for name in cls._fields}
+        values["url"] = None if values["url"] is None else str(values["url"])
+        return cls(**values)
+
+    @classmethod
+    def from_raw(cls: type[CompactSearchResultT], data: dict) -> CompactSearchResultT:
+        """Validate a raw API search result and return its compact record."""
+        return cls.from_model(cls.model.model_validate(data))
+
+    def to_model(self) -> base.Base:
+        """Return the equivalent full pydantic model."""
+        return self.model.model_validate(self._asdict())
+
+
+class _FirmSearchRow(typing.NamedTuple):
+    url: typing.Optional[str]
+    frn: str
+    status: str
+    type: str
+    name: str
+
+
+class _IndividualSearchRow(typing.NamedTuple):
+    url: typing.Optional[str]
+    irn: str
+    name: str
+    status: str
+    type: str
+
+
+class _FundSearchRow(typing.NamedTuple):
+    url: typing.Optional[str]
+    prn: str
+    status: str
+    type: str
+    name: str
+
+
+class CompactFirmSearchResult(_CompactSearchResultMixin, _FirmSearchRow):
+    """Compact form of `fca_api.types.search.FirmSearchResult`."""
+
+    __slots__ = ()
+    model = search.FirmSearchResult
+
+
+class CompactIndividualSearchResult(_CompactSearchResultMixin, _IndividualSearchRow):
+    """Compact form of `fca_api.types.search.IndividualSearchResult`."""
+
+    __slots__ = ()
+    model = search.IndividualSearchResult
+
+
+class CompactFundSearchResult(_CompactSearchResultMixin, _FundSearchRow):
+    """Compact form of `fca_api.types.search.FundSearchResult`."""
+
+    __slots__ = ()
+    model = search.FundSearchResult
@@ -0,0 +1,68 @@
+"""Cost reports of client calls.
+
+When cost reporting is enabled on `fca_api.async_api.Client`
+(``report_costs=True``), every result carries a `CallCost` describing what
+producing it took: ``MultipageList.cost`` for paginated results and the
+``cost`` property of single-object results (`CostReported` models such as
+``FirmDetails``).
+
+Costs can also be aggregated over any block of code, such as a whole
+request handler, with `fca_api.accounting.track`.
+
+Example:
+    Inspecting the cost of a large search::
+
+        client = fca_api.async_api.Client(credentials=..., report_costs=True)
+        page = await client.search_frn("limited", result_count=500)
+        print(page.cost.requests, page.cost.response_bytes, page.cost.wall_time)
+"""
+
+import dataclasses
+import typing
+
+import pydantic
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class CallCost:
+    """Resources used by a client call.
+
+    Times are in seconds. ``decode_time`` and ``validation_time`` are CPU
+    bound and together approximate the CPU cost of the call; the remainder
+    of ``wall_time`` is mostly spent waiting on the network and the rate
+    limiter.
+
+    Attributes:
+        requests: HTTP requests issued to the FCA API, including retries.
+        cache_hits: Responses served from the response cache.
+        response_bytes: Bytes received in response bodies.
+        wall_time: Elapsed time of the call.
+        limiter_wait: Time spent waiting for the rate limiter.
+        decode_time: Time spent decoding JSON response bodies.
+        validation_time: Time spent converting API data into typed models.
+    """
+
+    requests: int = 0
+    cache_hits: int = 0
+    response_bytes: int = 0
+    wall_time: float = 0.0
+    limiter_wait: float = 0.0
+    decode_time: float = 0.0
+    validation_time: float = 0.0
+
+
+class CostReported(pydantic.BaseModel):
+    """Mixin for single-object results that can carry a `CallCost`.
+
+    The cost is private state: it is not a model field, so it is not
+    validated, serialised or exported.
+    """
+
+    model_config = pydantic.ConfigDict(defer_build=True)
+
+    _cost: typing.Optional[CallCost] = pydantic.PrivateAttr(default=None)
+
+    @property
+    def cost(self) -> typing.Optional[CallCost]:
+        """The cost of the call that returned this object, if reported."""
+        return self._cost
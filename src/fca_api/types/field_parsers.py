@@ -1,6 +1,7 @@
 """Custom field parsers and field types for FCA API models."""
 
 import datetime
+import sys
 
 import pydantic
 
@@ -81,3 +82,21 @@ def FixIncompleteUrl(value: str) -> str | None:
     else:
         assert value.startswith(("http://", "https://")), "URL must start with http:// or https://"
     return value
+
+
+@pydantic.AfterValidator
+def Interned(value: str | list[str] | None) -> str | list[str] | None:
+    """Intern low-cardinality string values.
+
+    Fields such as statuses, types, countries and permission names take a
+    small set of distinct values across the register. Interning them means
+    every parsed record shares a single string object per distinct value,
+    which keeps large result sets compact and lets equality checks succeed
+    on identity. Lists of strings are interned element-wise; ``None`` is
+    passed through.
+    """
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, list):
+        return [sys.intern(item) if isinstance(item, str) else item for item in value]
+    return value
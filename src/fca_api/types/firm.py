@@ -3,10 +3,10 @@ from typing import Annotated, Literal, Optional
 
 import pydantic
 
-from . import annotations, base, field_parsers
+from . import annotations, base, cost, field_parsers
 
 
-class FirmDetails(base.Base):
+class FirmDetails(base.Base, cost.CostReported):
     """Core details for a firm on the FCA register.
 
     This model represents the main firm details returned by the register,
@@ -36,6 +36,7 @@ class FirmDetails(base.Base):
         pydantic.Field(
             description="The firm's status.",
         ),
+        field_parsers.Interned,
     ]
     type: Annotated[
         str,
@@ -48,6 +49,7 @@ class FirmDetails(base.Base):
             validation_alias=pydantic.AliasChoices("business type", "type"),
             serialization_alias="type",
         ),
+        field_parsers.Interned,
     ]
     companies_house_number: Annotated[
         str,
@@ -68,6 +70,7 @@ class FirmDetails(base.Base):
             validation_alias=pydantic.AliasChoices("client money permission", "client_money_permission"),
             serialization_alias="client_money_permission",
         ),
+        field_parsers.Interned,
     ]
     timestamp: Annotated[
         datetime.datetime,
@@ -98,6 +101,7 @@ class FirmDetails(base.Base):
             validation_alias=pydantic.AliasChoices("sub-status", "sub_status"),
             serialization_alias="sub_status",
         ),
+        field_parsers.Interned,
     ]
     sub_status_effective_from: Annotated[
         Optional[datetime.datetime],
@@ -127,6 +131,7 @@ class FirmDetails(base.Base):
             validation_alias=pydantic.AliasChoices("mlrs status", "mlrs_status"),
             serialization_alias="mlrs_status",
         ),
+        field_parsers.Interned,
     ]
     mlrs_status_effective_date: Annotated[
         Optional[datetime.datetime],
@@ -148,6 +153,7 @@ class FirmDetails(base.Base):
             validation_alias=pydantic.AliasChoices("e-money agent status", "e_money_agent_status"),
             serialization_alias="e_money_agent_status",
         ),
+        field_parsers.Interned,
     ]
     e_money_agent_effective_date: Annotated[
         Optional[datetime.datetime],
@@ -169,6 +175,7 @@ class FirmDetails(base.Base):
             validation_alias=pydantic.AliasChoices("psd / emd status", "psd_emd_status"),
             serialization_alias="psd_emd_status",
         ),
+        field_parsers.Interned,
     ]
     psd_emd_effective_date: Annotated[
         Optional[datetime.datetime],
@@ -190,6 +197,7 @@ class FirmDetails(base.Base):
             validation_alias=pydantic.AliasChoices("psd agent status", "psd_agent_status"),
             serialization_alias="psd_agent_status",
         ),
+        field_parsers.Interned,
     ]
     psd_agent_effective_date: Annotated[
         Optional[datetime.datetime],
@@ -329,6 +337,7 @@ class FirmNameAlias(base.Base):
             validation_alias=pydantic.AliasChoices("fca_api_address_type", "type"),
             serialization_alias="type",
         ),
+        field_parsers.Interned,
     ]
     status: Annotated[
         str,
@@ -339,6 +348,7 @@ class FirmNameAlias(base.Base):
         pydantic.Field(
             description="The status of the name (e.g., trading, registered).",
         ),
+        field_parsers.Interned,
     ]
     effective_from: Annotated[
         datetime.datetime,
@@ -380,6 +390,7 @@ class FirmAddress(base.Base):
             validation_alias=pydantic.AliasChoices("address type", "type"),
             serialization_alias="type",
         ),
+        field_parsers.Interned,
     ]
     phone_number: Annotated[
         Optional[str],
@@ -435,6 +446,7 @@ class FirmAddress(base.Base):
         pydantic.Field(
             description="The country of the address.",
         ),
+        field_parsers.Interned,
     ]
 
     website: Annotated[
@@ -485,6 +497,7 @@ class FirmControlledFunction(base.Base):
             validation_alias=pydantic.AliasChoices("fca_api_lst_type", "type"),
             serialization_alias="type",
         ),
+        field_parsers.Interned,
     ]
     name: Annotated[
         str,
@@ -494,6 +507,7 @@ class FirmControlledFunction(base.Base):
         pydantic.Field(
             description="The name of the controlled function.",
         ),
+        field_parsers.Interned,
     ]
     effective_date: Annotated[
         datetime.datetime,
@@ -591,6 +605,7 @@ class FirmIndividual(base.Base):
         pydantic.Field(
             description="The status of the individual.",
         ),
+        field_parsers.Interned,
     ]
 
     url: Annotated[
@@ -612,6 +627,7 @@ class FirmPermission(base.Base):
             validation_alias=pydantic.AliasChoices("fca_api_permission_name", "name"),
             serialization_alias="name",
         ),
+        field_parsers.Interned,
     ]
     customer_type: Annotated[
         Optional[list[str]],
@@ -621,6 +637,7 @@ class FirmPermission(base.Base):
             serialization_alias="customer_type",
             default=None,
         ),
+        field_parsers.Interned,
     ]
     limitation: Annotated[
         Optional[list[str]],
@@ -628,6 +645,7 @@ class FirmPermission(base.Base):
             description="Any limitations associated with the permission.",
             default=None,
         ),
+        field_parsers.Interned,
     ]
     limitation_not_found: Annotated[
         Optional[list[str]],
@@ -646,6 +664,7 @@ class FirmPermission(base.Base):
             serialization_alias="investment_type",
             default=None,
         ),
+        field_parsers.Interned,
     ]
     acting_as_cbtl_advisor: Annotated[
         Optional[bool],
@@ -701,6 +720,7 @@ class FirmPermission(base.Base):
             serialization_alias="cbtl_status",
             default=None,
         ),
+        field_parsers.Interned,
     ]
 
 
@@ -768,6 +788,7 @@ class FirmRequirementInvestmentType(base.Base):
             strip_whitespace=True,
             to_lower=True,
         ),
+        field_parsers.Interned,
     ]
 
 
@@ -784,6 +805,7 @@ class FirmRegulator(base.Base):
         pydantic.StringConstraints(
             strip_whitespace=True,
         ),
+        field_parsers.Interned,
     ]
     effective_date: Annotated[
         datetime.datetime,
@@ -818,6 +840,7 @@ class FirmPassport(base.Base):
             strip_whitespace=True,
             to_upper=True,
         ),
+        field_parsers.Interned,
     ]
     permissions: Annotated[
         str,
@@ -828,6 +851,7 @@ class FirmPassport(base.Base):
             strip_whitespace=True,
             to_lower=True,
         ),
+        field_parsers.Interned,
     ]
     direction: Annotated[
         Literal["in", "out"],
@@ -859,6 +883,7 @@ class PassportPermission(base.Base):
             strip_whitespace=True,
             to_lower=True,
         ),
+        field_parsers.Interned,
     ]
     investment_types: Annotated[
         list[str],
@@ -867,6 +892,7 @@ class PassportPermission(base.Base):
             validation_alias=pydantic.AliasChoices("InvestmentTypes", "investment_types"),
             serialization_alias="investment_types",
         ),
+        field_parsers.Interned,
     ]
 
 
@@ -882,6 +908,7 @@ class FirmPassportPermission(FirmPassport):
             strip_whitespace=True,
             to_lower=True,
         ),
+        field_parsers.Interned,
     ]
     type: Annotated[
         str,
@@ -894,6 +921,7 @@ class FirmPassportPermission(FirmPassport):
             strip_whitespace=True,
             to_lower=True,
         ),
+        field_parsers.Interned,
     ]
     permissions: Annotated[
         list[PassportPermission],
@@ -947,6 +975,7 @@ class FirmExclusion(base.Base):
             strip_whitespace=True,
             to_lower=True,
         ),
+        field_parsers.Interned,
     ]
     description_of_services: Annotated[
         str,
@@ -988,6 +1017,7 @@ class FirmDisciplinaryRecord(base.Base):
             strip_whitespace=True,
             to_lower=True,
         ),
+        field_parsers.Interned,
     ]
 
     enforcement_type: Annotated[
@@ -1001,6 +1031,7 @@ class FirmDisciplinaryRecord(base.Base):
             strip_whitespace=True,
             to_upper=True,
         ),
+        field_parsers.Interned,
     ]
 
     effective_from: Annotated[
@@ -1024,6 +1055,7 @@ class FirmAppointedRepresentative(base.Base):
             validation_alias=pydantic.AliasChoices("fca_api_lst_type", "type"),
             serialization_alias="type",
         ),
+        field_parsers.Interned,
     ]
     subtype: Annotated[
         str,
@@ -1035,6 +1067,7 @@ class FirmAppointedRepresentative(base.Base):
             validation_alias=pydantic.AliasChoices("recordsubtype", "subtype"),
             serialization_alias="subtype",
         ),
+        field_parsers.Interned,
     ]
     name: Annotated[
         str,
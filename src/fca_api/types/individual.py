@@ -3,10 +3,10 @@ from typing import Annotated, Literal, Optional
 
 import pydantic
 
-from . import annotations, base, field_parsers
+from . import annotations, base, cost, field_parsers
 
 
-class Individual(base.Base):
+class Individual(base.Base, cost.CostReported):
     """Individual (physical person) details."""
 
     irn: Annotated[
@@ -55,6 +55,7 @@ class Individual(base.Base):
             to_lower=True,
             strip_whitespace=True,
         ),
+        field_parsers.Interned,
     ]
     current_roles_and_activities: Annotated[
         Optional[pydantic.HttpUrl],
@@ -77,12 +78,14 @@ class IndividualControlledFunction(base.Base):
             validation_alias=pydantic.AliasChoices("fca_api_lst_type", "type"),
             serialization_alias="type",
         ),
+        field_parsers.Interned,
     ]
     name: Annotated[
         str,
         pydantic.Field(
             description="Name of the controlled function.",
         ),
+        field_parsers.Interned,
     ]
     restriction: Annotated[
         Optional[str],
@@ -120,6 +123,7 @@ class IndividualControlledFunction(base.Base):
             to_lower=True,
             strip_whitespace=True,
         ),
+        field_parsers.Interned,
     ]
     effective_date: Annotated[
         datetime.datetime,
@@ -172,6 +176,7 @@ class IndividualDisciplinaryRecord(base.Base):
             to_lower=True,
             strip_whitespace=True,
         ),
+        field_parsers.Interned,
     ]
     enforcement_type: Annotated[
         str,
@@ -184,6 +189,7 @@ class IndividualDisciplinaryRecord(base.Base):
             to_lower=True,
             strip_whitespace=True,
         ),
+        field_parsers.Interned,
     ]
     type_of_description: Annotated[
         str,
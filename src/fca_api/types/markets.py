@@ -35,6 +35,7 @@ class RegulatedMarket(base.Base):
             validation_alias=pydantic.AliasChoices("type of business or individual", "type"),
             serialization_alias="type",
         ),
+        field_parsers.Interned,
     ]
     status: Annotated[
         str,
@@ -45,6 +46,7 @@ class RegulatedMarket(base.Base):
             to_upper=True,
             strip_whitespace=True,
         ),
+        field_parsers.Interned,
     ]
     reference_number: Annotated[
         Optional[str],
@@ -17,9 +17,11 @@ import typing
 
 import pydantic
 
-from . import settings
+from . import cost, settings
 
 T = typing.TypeVar("T")
+# Aliased, as the ``MultipageList.cost`` field shadows the module in the class body
+CallCost = cost.CallCost
 
 
 # ---------------------------------------------------------------------------
@@ -41,6 +43,8 @@ class PaginatedResultInfo(pydantic.BaseModel):
         total_count: Total items across all pages (may be approximate).
     """
 
+    model_config = pydantic.ConfigDict(defer_build=True)
+
     next: typing.Optional[pydantic.HttpUrl] = None
     previous: typing.Optional[pydantic.HttpUrl] = None
     page: int
@@ -184,7 +188,7 @@ class PaginationInfo(pydantic.BaseModel):
             )
     """
 
-    model_config = pydantic.ConfigDict(frozen=True)
+    model_config = pydantic.ConfigDict(frozen=True, defer_build=True)
 
     has_next: bool = pydantic.Field(description="True if more results are available beyond this page.")
     next_page: typing.Optional[NextPageToken] = pydantic.Field(
@@ -236,9 +240,20 @@ class MultipageList(pydantic.BaseModel, typing.Generic[T]):
         # page.data has >= 100 items (or all available items if fewer exist)
     """
 
-    model_config = pydantic.ConfigDict(frozen=True, arbitrary_types_allowed=True)
+    model_config = pydantic.ConfigDict(frozen=True, arbitrary_types_allowed=True, defer_build=True)
 
     data: typing.List[T] = pydantic.Field(description="The result items for this page.")
     pagination: PaginationInfo = pydantic.Field(
         description=("Pagination state, including whether more results exist and how to fetch them.")
     )
+    cost: typing.Optional[CallCost] = pydantic.Field(
+        default=None,
+        description="The cost of the call that returned this page, if cost reporting is enabled.",
+    )
+    partial: bool = pydantic.Field(
+        default=False,
+        description=(
+            "Whether fetching stopped early because the call's deadline passed; "
+            "``pagination.next_page`` then resumes from the first page not fetched."
+        ),
+    )
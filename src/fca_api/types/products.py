@@ -3,10 +3,10 @@ from typing import Annotated, Optional
 
 import pydantic
 
-from . import annotations, base, field_parsers
+from . import annotations, base, cost, field_parsers
 
 
-class ProductDetails(base.Base):
+class ProductDetails(base.Base, cost.CostReported):
     """Core details for a financial product (for example a fund).
 
     Captures key attributes of a product as presented in the FCA register,
@@ -21,6 +21,7 @@ class ProductDetails(base.Base):
             validation_alias=pydantic.AliasChoices("product type", "product_type"),
             serialization_alias="product_type",
         ),
+        field_parsers.Interned,
     ]
     status: Annotated[
         str,
@@ -31,6 +32,7 @@ class ProductDetails(base.Base):
             to_lower=True,
             strip_whitespace=True,
         ),
+        field_parsers.Interned,
     ]
     cis_depositary_name: Annotated[
         Optional[str],
@@ -79,6 +81,7 @@ class ProductDetails(base.Base):
             serialization_alias="mmf_nav_type",
         ),
         field_parsers.StrOrNone,
+        field_parsers.Interned,
     ]
     scheme_type: Annotated[
         str,
@@ -91,6 +94,7 @@ class ProductDetails(base.Base):
             to_upper=True,
             strip_whitespace=True,
         ),
+        field_parsers.Interned,
     ]
     mmf_term_type: Annotated[
         Optional[str],
@@ -100,6 +104,7 @@ class ProductDetails(base.Base):
             serialization_alias="mmf_term_type",
         ),
         field_parsers.StrOrNone,
+        field_parsers.Interned,
     ]
 
     # URLs
@@ -201,6 +206,7 @@ class SubFundDetails(base.Base):
             to_upper=True,
             strip_whitespace=True,
         ),
+        field_parsers.Interned,
     ]
 
     url: Annotated[
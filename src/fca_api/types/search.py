@@ -54,7 +54,7 @@ from typing import Annotated
 
 import pydantic
 
-from . import annotations, base
+from . import annotations, base, field_parsers
 
 
 class FirmSearchResult(base.Base):
@@ -119,6 +119,7 @@ class FirmSearchResult(base.Base):
             to_lower=True,
             trim_whitespace=True,
         ),
+        field_parsers.Interned,
     ]
     type: Annotated[
         str,
@@ -129,6 +130,7 @@ class FirmSearchResult(base.Base):
             to_lower=True,
             trim_whitespace=True,
         ),
+        field_parsers.Interned,
     ]
     name: Annotated[
         str,
@@ -205,6 +207,7 @@ class IndividualSearchResult(base.Base):
             to_lower=True,
             strip_whitespace=True,
         ),
+        field_parsers.Interned,
     ]
     type: Annotated[
         str,
@@ -217,6 +220,7 @@ class IndividualSearchResult(base.Base):
             to_lower=True,
             strip_whitespace=True,
         ),
+        field_parsers.Interned,
     ]
 
 
@@ -279,6 +283,7 @@ class FundSearchResult(base.Base):
             to_lower=True,
             strip_whitespace=True,
         ),
+        field_parsers.Interned,
     ]
     type: Annotated[
         str,
@@ -291,6 +296,7 @@ class FundSearchResult(base.Base):
             to_lower=True,
             strip_whitespace=True,
         ),
+        field_parsers.Interned,
     ]
     name: Annotated[
         str,
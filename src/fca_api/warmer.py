@@ -0,0 +1,263 @@
+"""Background cache warming for frequently requested register records.
+
+A `CacheWarmer` keeps the `fca_api.caching.ResponseCache` of a client warm
+for a watch-list of reference numbers, so that user-facing calls such as
+``Client.get_firm`` are answered from cache rather than paying the live
+round-trip. The watch-list can be given explicitly (FRNs, IRNs and PRNs)
+and/or learned from the cache's own hit statistics.
+
+Each refresh cycle re-fetches the detail endpoint and, optionally, the
+first page of every sub-resource of each watched record. Requests are
+spread evenly over the cycle (and never faster than ``max_rate``) instead of
+being sent in a burst, so warming stays well inside the API rate limit of
+50 requests per 10 seconds. By default a cycle is 80% of the cache ``ttl``,
+so entries are refreshed before they expire.
+
+Refreshes go through the client's ``api_limiter``; with a
+`fca_api.concurrency.AdaptiveLimiter`, warming backs off as soon as the
+register slows down or starts failing. With a
+`fca_api.scheduling.PriorityLimiter`, refreshes are sent with the
+``batch`` priority, behind user-facing requests.
+
+Example:
+    Keeping a set of firms warm::
+
+        import asyncio
+        import fca_api
+
+        cache = fca_api.caching.ResponseCache(ttl=900)
+        async with fca_api.async_api.Client(
+            credentials=("email@example.com", "api_key"),
+            cache=cache,
+        ) as client:
+            warmer = fca_api.warmer.CacheWarmer(
+                client,
+                firms=["122702", "552016"],
+                learn_hot_keys=50,
+                max_rate=2.0,
+            )
+            warmer.start()
+            try:
+                firm = await client.get_firm("122702")  # served from cache
+                ...
+            finally:
+                await warmer.stop()
+"""
+
+import asyncio
+import contextlib
+import dataclasses
+import logging
+import time
+import typing
+
+from . import async_api, const, exc, raw_api, scheduling
+
+logger = logging.getLogger(__name__)
+
+#: Sub-resource modifiers refreshed for each watched record, by resource type
+SUB_RESOURCES: dict[str, tuple[tuple[str, ...], ...]] = {
+    const.ResourceTypes.FIRM.value.type_name: (
+        ("Names",),
+        ("Address",),
+        ("CF",),
+        ("Individuals",),
+        ("Permissions",),
+        ("Requirements",),
+        ("Regulators",),
+        ("Passports",),
+        ("Waivers",),
+        ("Exclusions",),
+        ("DisciplinaryHistory",),
+        ("AR",),
+    ),
+    const.ResourceTypes.INDIVIDUAL.value.type_name: (
+        ("CF",),
+        ("DisciplinaryHistory",),
+    ),
+    const.ResourceTypes.FUND.value.type_name: (
+        ("Names",),
+        ("Subfund",),
+    ),
+}
+
+
+@dataclasses.dataclass(frozen=True)
+class WarmupResult:
+    """Outcome of a single warming cycle.
+
+    Attributes:
+        refreshed: Number of responses successfully refreshed.
+        failed: Number of refreshes that failed.
+        duration: Wall-clock duration of the cycle in seconds.
+    """
+
+    refreshed: int
+    failed: int
+    duration: float
+
+
+class CacheWarmer:
+    """Periodically refreshes cached responses for watched records.
+
+    Args:
+        client: The client whose cache is warmed. Must have been created
+            with a ``cache``.
+        firms: FRNs to keep warm.
+        individuals: IRNs to keep warm.
+        funds: PRNs to keep warm.
+        sub_resources: Whether to refresh the first page of every
+            sub-resource as well as the detail endpoint.
+        learn_hot_keys: Additionally refresh up to this many of the most
+            frequently hit cache entries.
+        max_rate: Maximum number of refresh requests per second.
+        refresh_interval: Seconds between the starts of consecutive cycles.
+            Defaults to 80% of the cache ``ttl``.
+        priority: Priority class of refresh requests (see
+            `fca_api.scheduling`), or ``None`` for the priority of the
+            context the warmer runs in.
+
+    Raises:
+        ValueError: If the client has no response cache.
+    """
+
+    def __init__(
+        self,
+        client: typing.Union[async_api.Client, raw_api.RawClient],
+        firms: typing.Iterable[str] = (),
+        individuals: typing.Iterable[str] = (),
+        funds: typing.Iterable[str] = (),
+        sub_resources: bool = True,
+        learn_hot_keys: int = 0,
+        max_rate: float = 2.0,
+        refresh_interval: typing.Optional[float] = None,
+        priority: typing.Optional[str] = scheduling.BATCH,
+    ) -> None:
+        raw_client = client.raw_client if isinstance(client, async_api.Client) else client
+        if raw_client.cache is None:
+            raise ValueError("CacheWarmer requires a client configured with a response cache.")
+        if max_rate <= 0:
+            raise ValueError(f"max_rate must be positive, got {max_rate!r}")
+        self._raw_client = raw_client
+        self._watched: dict[str, set[str]] = {type_name: set() for type_name in SUB_RESOURCES}
+        self.sub_resources = sub_resources
+        self.learn_hot_keys = learn_hot_keys
+        self.max_rate = max_rate
+        self.refresh_interval = refresh_interval if refresh_interval is not None else raw_client.cache.ttl * 0.8
+        self.priority = priority
+        self._task: typing.Optional[asyncio.Task] = None
+        self.watch(firms=firms, individuals=individuals, funds=funds)
+
+    def watch(
+        self,
+        firms: typing.Iterable[str] = (),
+        individuals: typing.Iterable[str] = (),
+        funds: typing.Iterable[str] = (),
+    ) -> None:
+        """Add reference numbers to the watch-list."""
+        self._watched[const.ResourceTypes.FIRM.value.type_name].update(firms)
+        self._watched[const.ResourceTypes.INDIVIDUAL.value.type_name].update(individuals)
+        self._watched[const.ResourceTypes.FUND.value.type_name].update(funds)
+
+    def unwatch(
+        self,
+        firms: typing.Iterable[str] = (),
+        individuals: typing.Iterable[str] = (),
+        funds: typing.Iterable[str] = (),
+    ) -> None:
+        """Remove reference numbers from the watch-list."""
+        self._watched[const.ResourceTypes.FIRM.value.type_name].difference_update(firms)
+        self._watched[const.ResourceTypes.INDIVIDUAL.value.type_name].difference_update(individuals)
+        self._watched[const.ResourceTypes.FUND.value.type_name].difference_update(funds)
+
+    def targets(self) -> list[str]:
+        """Return the URLs refreshed by the next cycle, without duplicates."""
+        out: dict[str, None] = {}
+        for type_name, ref_numbers in self._watched.items():
+            for ref_number in sorted(ref_numbers):
+                out[self._raw_client._resource_url(ref_number, type_name)] = None
+                if not self.sub_resources:
+                    continue
+                for modifiers in SUB_RESOURCES[type_name]:
+                    # Page 1 is requested explicitly by the high-level client
+                    out[self._raw_client._resource_url(ref_number, type_name, modifiers=modifiers, page=1)] = None
+        if self.learn_hot_keys > 0:
+            for key in self._raw_client.cache.hot_keys(self.learn_hot_keys):
+                out[key] = None
+        return list(out)
+
+    async def run_once(self, duration: typing.Optional[float] = None) -> WarmupResult:
+        """Refresh every target once, spreading requests over ``duration``.
+
+        Args:
+            duration: Seconds over which to spread the refreshes. Defaults to
+                ``refresh_interval``. Requests are never issued faster than
+                ``max_rate`` per second.
+
+        Returns:
+            A summary of the cycle.
+        """
+        targets = self.targets()
+        started = time.monotonic()
+        if not targets:
+            return WarmupResult(refreshed=0, failed=0, duration=0.0)
+        duration = self.refresh_interval if duration is None else duration
+        spacing = max(duration / len(targets), 1.0 / self.max_rate)
+
+        # A task group, so that cancelling the cycle cancels refreshes in flight
+        pending = []
+        async with asyncio.TaskGroup() as group:
+            for idx, url in enumerate(targets):
+                delay = started + idx * spacing - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                pending.append(group.create_task(self._refresh(url)))
+        refreshed = sum(task.result() for task in pending)
+        return WarmupResult(
+            refreshed=refreshed,
+            failed=len(pending) - refreshed,
+            duration=time.monotonic() - started,
+        )
+
+    async def run(self) -> None:
+        """Run warming cycles until cancelled."""
+        while True:
+            cycle_started = time.monotonic()
+            result = await self.run_once()
+            logger.debug(f"Cache warming cycle: {result}")
+            await asyncio.sleep(max(0.0, cycle_started + self.refresh_interval - time.monotonic()))
+
+    def start(self) -> asyncio.Task:
+        """Start warming in a background task on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self.run())
+        return self._task
+
+    async def stop(self) -> None:
+        """Stop the background task started by `start`."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def _priority(self) -> typing.ContextManager[None]:
+        if self.priority is None:
+            return contextlib.nullcontext()
+        return scheduling.priority(self.priority)
+
+    async def _refresh(self, url: str) -> bool:
+        family = const.EndpointFamily.from_url(url)
+        try:
+            with self._raw_client.cache.revalidating(), self._priority():
+                # Negatively cached "not found" answers are refreshed like any other
+                await self._raw_client._get_cached(
+                    url, family, check_status=family is not const.EndpointFamily.COMMON_SEARCH
+                )
+        except (exc.FcaRequestError, exc.FcaQueueCancelledError, exc.FcaDeadlineExceededError) as e:
+            logger.warning(f"Failed to refresh {url!r}: {e}")
+            return False
+        return True
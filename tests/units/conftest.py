@@ -0,0 +1,93 @@
+import asyncio
+import threading
+import typing
+
+import httpx
+import pytest
+
+from fca_api import scheduling
+
+
+class FakeClock:
+    """A time source that only moves when ``now`` is changed."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeUpstream:
+    """A mock FS Register recording the requests it answers.
+
+    The n-th request is answered with a successful payload whose data is
+    ``[{"Call": n}]``, unless one of the following is set:
+
+    - ``recorded``: recordings by URL, answered with their recorded status
+      (404 for other URLs);
+    - ``body``: a payload answered to every request instead;
+    - ``status``: an HTTP error status answered to every request;
+    - ``mode``: ``"down"`` for a transport error or ``"missing"`` for a
+      ``missing_status`` "not found" answer, for every request or, through
+      ``modes``, for the request paths given.
+
+    ``delay`` and ``release`` hold the answers back.
+    """
+
+    def __init__(self):
+        self.requests: list[str] = []
+        self.threads: set[str] = set()
+        self.priorities: list[typing.Optional[str]] = []
+        self.recorded: typing.Optional[dict[str, dict]] = None
+        self.body: typing.Optional[dict] = None
+        self.status: typing.Optional[int] = None
+        self.mode = "ok"
+        self.modes: dict[str, str] = {}
+        self.missing_status = "FSR-API-02-01-11"
+        self.delay = 0.0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    @property
+    def calls(self) -> int:
+        return len(self.requests)
+
+    def session(self) -> httpx.AsyncClient:
+        """An API session answered by this upstream."""
+        return httpx.AsyncClient(transport=httpx.MockTransport(self.handler))
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(str(request.url))
+        self.threads.add(threading.current_thread().name)
+        self.priorities.append(scheduling.current_priority())
+        await asyncio.sleep(self.delay)
+        await self.release.wait()
+        mode = self.modes.get(request.url.path, self.mode)
+        if mode == "down":
+            raise httpx.ConnectError("upstream down", request=request)
+        if self.status is not None:
+            return httpx.Response(self.status, json={"Message": "unavailable"})
+        if mode == "missing":
+            return httpx.Response(200, json={"Status": self.missing_status, "Message": "Not found", "Data": None})
+        if self.recorded is not None:
+            recording = self.recorded.get(str(request.url))
+            if recording is None:
+                return httpx.Response(404, json={"Message": "not recorded"})
+            return httpx.Response(recording["status_code"], json=recording["content"]["json"])
+        if self.body is not None:
+            return httpx.Response(200, json=self.body)
+        return httpx.Response(
+            200,
+            json={"Status": "FSR-API-02-01-00", "Message": "Ok", "Data": [{"Call": self.calls}]},
+        )
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def upstream():
+    return FakeUpstream()
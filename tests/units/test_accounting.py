@@ -0,0 +1,107 @@
+import contextvars
+import json
+import pathlib
+
+import httpx
+import pytest
+
+import fca_api
+from fca_api.accounting import track
+from fca_api.types.cost import CallCost
+
+RESOURCES_DIR = pathlib.Path(__file__).parent / "test_client" / "resources"
+FIRM_RESPONSE = json.loads(
+    next(
+        (RESOURCES_DIR / "test_get_firm_resource.py" / "TestNutmegFirmDetails" / "test_get_firm").glob("*.json")
+    ).read_text()
+)["content"]["json"]
+
+
+def _regulators_handler(request: httpx.Request) -> httpx.Response:
+    if "/Regulators" not in request.url.path:
+        return httpx.Response(200, json=FIRM_RESPONSE)
+    page = int(request.url.params.get("pgnp", 1))
+    return httpx.Response(
+        200,
+        json={
+            "Status": "FSR-API-02-07-00",
+            "ResultInfo": {
+                "page": str(page),
+                "per_page": "1",
+                "total_count": "2",
+                "Next": "https://example.com/?pgnp=2" if page == 1 else None,
+                "Previous": None,
+            },
+            "Data": [{"Regulator Name": f"Regulator {page}", "Effective Date": "01/01/2020"}],
+        },
+    )
+
+
+def _client(**kwargs):
+    return fca_api.async_api.Client(
+        credentials=httpx.AsyncClient(transport=httpx.MockTransport(_regulators_handler)),
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_disabled_by_default():
+    client = _client()
+    page = await client.get_firm_regulators("123456")
+    assert page.cost is None
+    firm = await client.get_firm("552016")
+    assert firm.cost is None
+
+
+@pytest.mark.asyncio
+async def test_paginated_cost():
+    page = await _client(report_costs=True).get_firm_regulators("123456", result_count=2)
+    cost = page.cost
+    assert isinstance(cost, CallCost)
+    assert cost.requests == 2
+    assert cost.cache_hits == 0
+    assert cost.response_bytes > 0
+    assert cost.wall_time >= cost.decode_time + cost.validation_time
+    assert cost.decode_time > 0
+    assert cost.validation_time > 0
+
+
+@pytest.mark.asyncio
+async def test_single_object_cost_and_cache_hits():
+    client = _client(report_costs=True, cache=fca_api.caching.ResponseCache(ttl=60))
+    first = await client.get_firm("552016")
+    second = await client.get_firm("552016")
+    assert (first.cost.requests, first.cost.cache_hits) == (1, 0)
+    assert (second.cost.requests, second.cost.cache_hits) == (0, 1)
+    assert second.cost.response_bytes == 0
+    # The cost is not part of the model
+    assert "cost" not in first.model_dump()
+
+
+@pytest.mark.asyncio
+async def test_track_aggregates_nested_calls():
+    client = _client(report_costs=True)
+    with track() as tracker:
+        await client.get_firm_regulators("123456", result_count=2)
+        await client.get_firm("552016")
+        assert fca_api.accounting.current() is tracker
+    assert fca_api.accounting.current() is None
+    cost = tracker.cost()
+    assert cost.requests == 3
+    assert tracker.cost() == cost
+
+
+@pytest.mark.asyncio
+async def test_track_without_cost_reports():
+    with track() as tracker:
+        page = await _client().get_firm_regulators("123456", result_count=2)
+    assert page.cost is None
+    assert tracker.requests == 2
+
+
+def test_detach_clears_a_copied_context():
+    with track() as tracker:
+        context = contextvars.copy_context()
+        context.run(fca_api.accounting.detach)
+        assert context.run(fca_api.accounting.current) is None
+        assert fca_api.accounting.current() is tracker
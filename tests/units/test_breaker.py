@@ -0,0 +1,209 @@
+import httpx
+import pytest
+
+import fca_api
+from fca_api.breaker import CircuitBreaker, CircuitState
+from fca_api.const import EndpointFamily
+
+
+@pytest.fixture
+def breaker(clock):
+    return CircuitBreaker(
+        failure_rate_threshold=0.5,
+        slow_call_duration=2.0,
+        window=60.0,
+        minimum_calls=4,
+        open_duration=30.0,
+        half_open_max_calls=2,
+        clock=clock,
+    )
+
+
+class TestCircuitBreakerStates:
+    def test_invalid_settings(self):
+        with pytest.raises(ValueError):
+            CircuitBreaker(failure_rate_threshold=0)
+        with pytest.raises(ValueError):
+            CircuitBreaker(slow_call_rate_threshold=1.5)
+        with pytest.raises(ValueError):
+            CircuitBreaker(minimum_calls=0)
+
+    def test_opens_on_failure_rate(self, breaker):
+        for _ in range(2):
+            breaker.before_request(EndpointFamily.FIRM)
+            breaker.record_success(EndpointFamily.FIRM, 0.1)
+        breaker.before_request(EndpointFamily.FIRM)
+        breaker.record_failure(EndpointFamily.FIRM, 0.1)
+        assert breaker.state(EndpointFamily.FIRM) is CircuitState.CLOSED
+        breaker.before_request(EndpointFamily.FIRM)
+        breaker.record_failure(EndpointFamily.FIRM, 0.1)
+        assert breaker.state(EndpointFamily.FIRM) is CircuitState.OPEN
+
+        with pytest.raises(fca_api.exc.FcaCircuitOpenError) as exc_info:
+            breaker.before_request(EndpointFamily.FIRM)
+        assert exc_info.value.family == EndpointFamily.FIRM
+        assert exc_info.value.retry_after == pytest.approx(30.0)
+        assert isinstance(exc_info.value, fca_api.exc.FcaRequestError)
+
+        # Other families are unaffected
+        assert breaker.state(EndpointFamily.INDIVIDUALS) is CircuitState.CLOSED
+        breaker.before_request(EndpointFamily.INDIVIDUALS)
+
+    def test_opens_on_slow_calls(self, clock):
+        breaker = CircuitBreaker(
+            slow_call_rate_threshold=0.5,
+            slow_call_duration=2.0,
+            minimum_calls=2,
+            clock=clock,
+        )
+        breaker.record_success(EndpointFamily.SEARCH, 5.0)
+        breaker.record_success(EndpointFamily.SEARCH, 3.0)
+        assert breaker.state(EndpointFamily.SEARCH) is CircuitState.OPEN
+
+    def test_window_expires_old_outcomes(self, breaker, clock):
+        for _ in range(3):
+            breaker.record_failure(EndpointFamily.CIS, 0.1)
+        clock.now += 61
+        breaker.record_failure(EndpointFamily.CIS, 0.1)
+        assert breaker.state(EndpointFamily.CIS) is CircuitState.CLOSED
+
+    def test_half_open_recovery(self, breaker, clock):
+        for _ in range(4):
+            breaker.record_failure(EndpointFamily.FIRM, 0.1)
+        assert breaker.state(EndpointFamily.FIRM) is CircuitState.OPEN
+        clock.now += 30
+        assert breaker.state(EndpointFamily.FIRM) is CircuitState.HALF_OPEN
+
+        breaker.before_request(EndpointFamily.FIRM)
+        breaker.before_request(EndpointFamily.FIRM)
+        with pytest.raises(fca_api.exc.FcaCircuitOpenError):
+            # All probe slots are taken
+            breaker.before_request(EndpointFamily.FIRM)
+        breaker.record_success(EndpointFamily.FIRM, 0.1)
+        assert breaker.state(EndpointFamily.FIRM) is CircuitState.HALF_OPEN
+        breaker.record_success(EndpointFamily.FIRM, 0.1)
+        assert breaker.state(EndpointFamily.FIRM) is CircuitState.CLOSED
+
+    def test_half_open_failure_reopens(self, breaker, clock):
+        for _ in range(4):
+            breaker.record_failure(EndpointFamily.FIRM, 0.1)
+        clock.now += 30
+        breaker.before_request(EndpointFamily.FIRM)
+        breaker.record_failure(EndpointFamily.FIRM, 0.1)
+        assert breaker.state(EndpointFamily.FIRM) is CircuitState.OPEN
+
+    def test_release_frees_probe_slot(self, breaker, clock):
+        for _ in range(4):
+            breaker.record_failure(EndpointFamily.FIRM, 0.1)
+        clock.now += 30
+        breaker.before_request(EndpointFamily.FIRM)
+        breaker.before_request(EndpointFamily.FIRM)
+        breaker.release(EndpointFamily.FIRM)
+        breaker.before_request(EndpointFamily.FIRM)
+
+    def test_requests_admitted_before_opening_are_not_probes(self, breaker, clock):
+        slow = breaker.before_request(EndpointFamily.FIRM)
+        aborted = breaker.before_request(EndpointFamily.FIRM)
+        for _ in range(4):
+            breaker.record_failure(EndpointFamily.FIRM, 0.1)
+        clock.now += 30
+        probes = [breaker.before_request(EndpointFamily.FIRM) for _ in range(2)]
+        assert [el.probe for el in probes] == [True, True]
+
+        # Finishing after the circuit went half-open neither closes it nor frees a probe slot
+        breaker.record_success(EndpointFamily.FIRM, 0.1, slow)
+        breaker.release(EndpointFamily.FIRM, aborted)
+        assert breaker.state(EndpointFamily.FIRM) is CircuitState.HALF_OPEN
+        with pytest.raises(fca_api.exc.FcaCircuitOpenError):
+            breaker.before_request(EndpointFamily.FIRM)
+
+        for probe in probes:
+            breaker.record_success(EndpointFamily.FIRM, 0.1, probe)
+        assert breaker.state(EndpointFamily.FIRM) is CircuitState.CLOSED
+
+    def test_probes_of_an_earlier_half_open_state_are_ignored(self, breaker, clock):
+        for _ in range(4):
+            breaker.record_failure(EndpointFamily.FIRM, 0.1)
+        clock.now += 30
+        first, second = (breaker.before_request(EndpointFamily.FIRM) for _ in range(2))
+        breaker.record_failure(EndpointFamily.FIRM, 0.1, first)
+        assert breaker.state(EndpointFamily.FIRM) is CircuitState.OPEN
+        clock.now += 30
+        probe = breaker.before_request(EndpointFamily.FIRM)
+        breaker.record_success(EndpointFamily.FIRM, 0.1, second)
+        breaker.record_success(EndpointFamily.FIRM, 0.1, probe)
+        assert breaker.state(EndpointFamily.FIRM) is CircuitState.HALF_OPEN
+
+    def test_reset(self, breaker):
+        for _ in range(4):
+            breaker.record_failure(EndpointFamily.FIRM, 0.1)
+        breaker.reset()
+        assert breaker.state(EndpointFamily.FIRM) is CircuitState.CLOSED
+
+
+class TestRawClientCircuitBreaker:
+    @pytest.fixture
+    def responses(self):
+        return []
+
+    @pytest.fixture
+    def raw_client(self, breaker, responses):
+        def handler(request: httpx.Request) -> httpx.Response:
+            responses.append(request.url)
+            if "Firm" in request.url.path:
+                return httpx.Response(503, json={})
+            return httpx.Response(
+                200,
+                json={"Status": "FSR-API-01-01-00", "Message": "Ok", "Data": [{"Name": "x"}]},
+            )
+
+        return fca_api.raw_api.RawClient(
+            credentials=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            circuit_breaker=breaker,
+        )
+
+    @pytest.mark.asyncio
+    async def test_fails_fast_when_open(self, raw_client, breaker, responses):
+        assert raw_client.circuit_breaker is breaker
+        for _ in range(4):
+            with pytest.raises(fca_api.exc.FcaRequestError):
+                await raw_client.get_firm("123456")
+        assert len(responses) == 4
+        assert breaker.state(EndpointFamily.FIRM) is CircuitState.OPEN
+
+        with pytest.raises(fca_api.exc.FcaCircuitOpenError):
+            await raw_client.get_firm("123456")
+        assert len(responses) == 4
+
+        # Other endpoint families keep working
+        out = await raw_client.get_individual("ABC01234")
+        assert out.data == [{"Name": "x"}]
+        assert len(responses) == 5
+
+    @pytest.mark.asyncio
+    async def test_transport_errors_count_as_failures(self, breaker):
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("boom", request=request)
+
+        raw_client = fca_api.raw_api.RawClient(
+            credentials=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            circuit_breaker=breaker,
+        )
+        for _ in range(4):
+            with pytest.raises(fca_api.exc.FcaRequestError):
+                await raw_client.search_frn("test")
+        assert breaker.state(EndpointFamily.SEARCH) is CircuitState.OPEN
+
+    @pytest.mark.asyncio
+    async def test_client_errors_do_not_trip(self, breaker):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"Status": "FSR-API-02-01-21", "Message": "Bad request", "Data": None})
+
+        raw_client = fca_api.raw_api.RawClient(
+            credentials=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            circuit_breaker=breaker,
+        )
+        for _ in range(6):
+            with pytest.raises(fca_api.exc.FcaRequestError):
+                await raw_client.get_firm("invalid")
+        assert breaker.state(EndpointFamily.FIRM) is CircuitState.CLOSED
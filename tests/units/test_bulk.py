@@ -0,0 +1,121 @@
+import multiprocessing
+import time
+
+import httpx
+import pytest
+
+import fca_api
+from fca_api.bulk import BulkResult, SqliteTokenBucket, run_bulk
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    frn = request.url.path.rsplit("/", 1)[-1]
+    if frn == "000000":
+        return httpx.Response(200, json={"Status": "FSR-API-02-01-11", "Message": "Firm not found", "Data": None})
+    return httpx.Response(200, json={"Status": "FSR-API-02-01-00", "Message": "Ok", "Data": [{"FRN": frn}]})
+
+
+def client_factory(api_limiter):
+    return fca_api.async_api.Client(
+        credentials=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        api_limiter=api_limiter,
+    )
+
+
+async def fetch_raw(client, frn):
+    response = await client.raw_client.get_firm(frn)
+    if not response.data:
+        raise LookupError(frn)
+    return response.data[0]["FRN"]
+
+
+@pytest.fixture
+def make_bucket(tmp_path):
+    buckets = []
+
+    def make(**kwargs):
+        buckets.append(SqliteTokenBucket(tmp_path / "bucket", **kwargs))
+        return buckets[-1]
+
+    yield make
+    for bucket in buckets:
+        bucket.close()
+
+
+class TestSqliteTokenBucket:
+    def test_invalid_settings(self, tmp_path):
+        with pytest.raises(ValueError):
+            SqliteTokenBucket(tmp_path / "bucket", rate=0)
+        with pytest.raises(ValueError):
+            SqliteTokenBucket(tmp_path / "bucket", burst=0)
+
+    def test_burst_then_wait(self, make_bucket):
+        bucket = make_bucket(rate=10, per=1.0, burst=3)
+        assert [bucket.try_acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert 0 < bucket.try_acquire() <= 0.1
+
+    def test_shared_between_instances(self, make_bucket):
+        first = make_bucket(rate=1, per=60.0, burst=2)
+        second = make_bucket(rate=1, per=60.0, burst=2)
+        assert first.try_acquire() == 0.0
+        assert second.try_acquire() == 0.0
+        assert first.try_acquire() > 0
+        assert second.try_acquire() > 0
+
+    @pytest.mark.asyncio
+    async def test_as_api_limiter(self, make_bucket):
+        bucket = make_bucket(rate=20, per=1.0, burst=1)
+        started = time.monotonic()
+        for _ in range(5):
+            async with bucket():
+                pass
+        assert time.monotonic() - started >= 0.15
+
+
+class TestRunBulk:
+    def test_requires_client(self):
+        with pytest.raises(ValueError):
+            run_bulk(["122702"], "get_firm", write=print)
+
+    def test_fetch_across_processes(self, make_bucket):
+        frns = [f"{idx:06d}" for idx in range(1, 21)] + ["000000"]
+        written: list[BulkResult] = []
+        summary = run_bulk(
+            frns,
+            fetch_raw,
+            write=written.append,
+            client_factory=client_factory,
+            processes=3,
+            limiter=make_bucket(rate=1000, per=1.0, burst=1000),
+            mp_context=multiprocessing.get_context("fork"),
+        )
+        assert (summary.succeeded, summary.failed) == (20, 1)
+        assert sorted(el.value for el in written if el.ok) == frns[:-1]
+        [failure] = [el for el in written if not el.ok]
+        assert failure.ref_number == "000000"
+        assert "LookupError" in failure.error
+
+    def test_adaptive_concurrency(self, make_bucket):
+        frns = [f"{idx:06d}" for idx in range(1, 11)]
+        written: list[BulkResult] = []
+        summary = run_bulk(
+            frns,
+            fetch_raw,
+            write=written.append,
+            client_factory=client_factory,
+            processes=2,
+            concurrency=8,
+            adaptive=True,
+            limiter=make_bucket(rate=1000, per=1.0, burst=1000),
+            mp_context=multiprocessing.get_context("fork"),
+        )
+        assert (summary.succeeded, summary.failed) == (10, 0)
+        assert sorted(el.value for el in written) == frns
+
+
+def test_worker_shares_limiter_with_parent(make_bucket):
+    bucket = make_bucket(rate=1, per=60.0, burst=1)
+    assert bucket.try_acquire() == 0.0
+    ctx = multiprocessing.get_context("fork")
+    with ctx.Pool(1) as pool:
+        assert pool.apply(bucket.try_acquire) > 0
@@ -0,0 +1,220 @@
+import asyncio
+
+import pytest
+
+import fca_api
+from fca_api.caching import ResponseCache
+
+
+@pytest.fixture
+def cache(clock):
+    return ResponseCache(ttl=60, stale_while_revalidate=30, stale_if_error=300, clock=clock)
+
+
+@pytest.fixture
+def raw_client(upstream, cache):
+    return fca_api.raw_api.RawClient(
+        credentials=upstream.session(),
+        cache=cache,
+    )
+
+
+class TestResponseCache:
+    def test_invalid_settings(self):
+        with pytest.raises(ValueError):
+            ResponseCache(ttl=-1)
+        with pytest.raises(ValueError):
+            ResponseCache(max_entries=0)
+
+    @pytest.mark.asyncio
+    async def test_fresh_hit(self, raw_client, upstream, cache):
+        first = await raw_client.get_firm("122702")
+        second = await raw_client.get_firm("122702")
+        assert upstream.calls == 1
+        assert first.data == second.data == [{"Call": 1}]
+        assert first is not second
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+
+    @pytest.mark.asyncio
+    async def test_overridden_data_does_not_leak(self, raw_client):
+        first = await raw_client.get_firm("122702")
+        first.override_data([])
+        second = await raw_client.get_firm("122702")
+        assert second.data == [{"Call": 1}]
+
+    @pytest.mark.asyncio
+    async def test_stale_while_revalidate(self, raw_client, upstream, cache, clock):
+        await raw_client.get_firm("122702")
+        clock.now += 70
+
+        upstream.release.clear()
+        stale = await asyncio.gather(*(raw_client.get_firm("122702") for _ in range(5)))
+        assert [el.data for el in stale] == [[{"Call": 1}]] * 5
+        # A single deduplicated background refresh was started
+        await asyncio.sleep(0)
+        assert upstream.calls == 2
+        assert cache.stats.refreshes == 1
+
+        upstream.release.set()
+        await asyncio.sleep(0.01)
+        refreshed = await raw_client.get_firm("122702")
+        assert refreshed.data == [{"Call": 2}]
+        assert upstream.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_single_flight_on_miss(self, raw_client, upstream):
+        upstream.release.clear()
+        pending = [asyncio.ensure_future(raw_client.get_firm("122702")) for _ in range(5)]
+        await asyncio.sleep(0.01)
+        upstream.release.set()
+        results = await asyncio.gather(*pending)
+        assert upstream.calls == 1
+        assert all(el.data == [{"Call": 1}] for el in results)
+
+    @pytest.mark.asyncio
+    async def test_coalesced_callers_keep_their_own_deadlines(self, raw_client, upstream):
+        async def get_firm(timeout):
+            if timeout is None:
+                return await raw_client.get_firm("122702")
+            with fca_api.deadlines.deadline(timeout):
+                return await raw_client.get_firm("122702")
+
+        upstream.release.clear()
+        # The caller with the short deadline starts the shared fetch
+        short = asyncio.ensure_future(get_firm(0.02))
+        await asyncio.sleep(0)
+        unbounded = asyncio.ensure_future(get_firm(None))
+        with pytest.raises(fca_api.exc.FcaDeadlineExceededError):
+            await short
+        assert not unbounded.done()
+
+        upstream.release.set()
+        assert (await unbounded).data == [{"Call": 1}]
+        assert upstream.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_shared_fetch_is_billed_to_its_starter_only(self, raw_client, upstream, cache, clock):
+        with fca_api.accounting.track() as tracker:
+            await raw_client.get_firm("122702")
+            clock.now += 70
+            # Stale: served at once, refreshed in the background
+            await raw_client.get_firm("122702")
+        await asyncio.sleep(0.01)
+        assert upstream.calls == 2
+        assert (tracker.requests, tracker.cache_hits) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_stale_if_error(self, raw_client, upstream, cache, clock):
+        await raw_client.get_firm("122702")
+        clock.now += 200
+        upstream.mode = "down"
+        out = await raw_client.get_firm("122702")
+        assert out.data == [{"Call": 1}]
+        assert cache.stats.stale_errors == 1
+
+        upstream.status = 503
+        out = await raw_client.get_firm("122702")
+        assert out.data == [{"Call": 1}]
+
+        clock.now += 200
+        with pytest.raises(fca_api.exc.FcaRequestError):
+            await raw_client.get_firm("122702")
+        assert "122702" not in "".join(cache._entries)
+
+    @pytest.mark.asyncio
+    async def test_miss_propagates_errors(self, raw_client, upstream):
+        upstream.mode = "down"
+        with pytest.raises(fca_api.exc.FcaRequestError):
+            await raw_client.get_firm("122702")
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_served_from_stale_entry(self, upstream, cache, clock):
+        breaker = fca_api.breaker.CircuitBreaker(minimum_calls=1, open_duration=600, clock=clock)
+        raw_client = fca_api.raw_api.RawClient(
+            credentials=upstream.session(),
+            cache=cache,
+            circuit_breaker=breaker,
+        )
+        await raw_client.get_firm("122702")
+        upstream.status = 503
+        with pytest.raises(fca_api.exc.FcaRequestError):
+            await raw_client.get_firm("999999")
+        assert breaker.state(fca_api.const.EndpointFamily.FIRM) is fca_api.breaker.CircuitState.OPEN
+
+        clock.now += 120
+        calls = upstream.calls
+        out = await raw_client.get_firm("122702")
+        assert out.data == [{"Call": 1}]
+        assert upstream.calls == calls
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self, upstream, clock):
+        cache = ResponseCache(ttl=60, max_entries=2, clock=clock)
+        raw_client = fca_api.raw_api.RawClient(
+            credentials=upstream.session(),
+            cache=cache,
+        )
+        await raw_client.get_firm("1")
+        await raw_client.get_firm("2")
+        await raw_client.get_firm("1")
+        await raw_client.get_firm("3")
+        assert len(cache) == 2
+        assert cache.stats.evictions == 1
+        await raw_client.get_firm("1")
+        assert upstream.calls == 3
+
+        cache.invalidate()
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_aclose_cancels_refreshes(self, raw_client, upstream, cache, clock):
+        await raw_client.get_firm("122702")
+        clock.now += 70
+        upstream.release.clear()
+        await raw_client.get_firm("122702")
+        assert cache._inflight
+        await raw_client.aclose()
+        assert not cache._inflight
+
+
+class TestNegativeCaching:
+    @pytest.mark.asyncio
+    async def test_not_found_uses_negative_ttl(self, upstream, clock):
+        cache = ResponseCache(ttl=600, negative_ttl=30, clock=clock)
+        raw_client = fca_api.raw_api.RawClient(
+            credentials=upstream.session(),
+            cache=cache,
+        )
+        upstream.mode = "missing"
+        for _ in range(3):
+            out = await raw_client.get_firm("1234567890")
+            assert out.fca_api_status == "FSR-API-02-01-11"
+            assert not out.data
+        assert upstream.calls == 1
+        assert cache.stats.negative_hits == 2
+
+        upstream.mode = "ok"
+        await raw_client.get_firm("122702")
+        clock.now += 31
+        await raw_client.get_firm("1234567890")
+        await raw_client.get_firm("122702")
+        # Only the negative entry expired
+        assert upstream.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_not_found_error_status_is_cached(self, raw_client, upstream, cache):
+        upstream.mode = "missing"
+        upstream.missing_status = "FSR-API-05-01-11"
+        for _ in range(3):
+            with pytest.raises(fca_api.exc.FcaRequestError, match="FSR-API-05-01-11"):
+                await raw_client.get_fund("123456")
+        assert upstream.calls == 1
+        assert cache.stats.negative_hits == 2
+
+    @pytest.mark.asyncio
+    async def test_negative_ttl_default(self, clock):
+        assert ResponseCache(ttl=600, clock=clock).negative_ttl == 60
+        assert ResponseCache(ttl=5, clock=clock).negative_ttl == 5
+        with pytest.raises(ValueError):
+            ResponseCache(ttl=5, negative_ttl=30)
@@ -0,0 +1,84 @@
+import concurrent.futures
+import threading
+
+import httpx
+import pytest
+
+import fca_api
+
+
+class RecordingExecutor(concurrent.futures.ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.submitted = 0
+
+    def submit(self, fn, /, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(fn, *args, **kwargs)
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    size = int(request.url.path.rsplit("/", 2)[-2][-1])
+    return httpx.Response(
+        200,
+        json={
+            "Status": "FSR-API-02-07-00",
+            "Data": [{"Regulator Name": f"Regulator {idx}", "Effective Date": "01/01/2020"} for idx in range(size)],
+        },
+    )
+
+
+@pytest.fixture
+def executor():
+    with RecordingExecutor() as executor:
+        yield executor
+
+
+@pytest.mark.asyncio
+async def test_large_pages_are_validated_off_the_loop(executor, mocker):
+    threads = []
+    validate = fca_api.types.firm.FirmRegulator.model_validate
+
+    def recording_validate(*args, **kwargs):
+        threads.append(threading.get_ident())
+        return validate(*args, **kwargs)
+
+    mocker.patch.object(fca_api.types.firm.FirmRegulator, "model_validate", side_effect=recording_validate)
+    registry = fca_api.metrics.MetricsRegistry()
+    client = fca_api.async_api.Client(
+        credentials=httpx.AsyncClient(transport=httpx.MockTransport(_handler)),
+        parse_offload_threshold=3,
+        parse_executor=executor,
+        metrics=registry,
+    )
+
+    small = await client.get_firm_regulators("100002")
+    assert executor.submitted == 0
+    assert set(threads) == {threading.get_ident()}
+
+    threads.clear()
+    large = await client.get_firm_regulators("100005")
+    assert executor.submitted == 1
+    assert len(set(threads)) == 1 and threading.get_ident() not in threads
+    assert [len(small.data), len(large.data)] == [2, 5]
+    assert registry.validated_items.value((("model", "firm.FirmRegulator"),)) == 7
+
+
+@pytest.mark.asyncio
+async def test_parallel_chunks_without_gil(executor, mocker):
+    mocker.patch.object(fca_api.async_api, "_gil_enabled", return_value=False)
+    mocker.patch.object(fca_api.async_api.os, "cpu_count", return_value=4)
+    client = fca_api.async_api.Client(
+        credentials=httpx.AsyncClient(transport=httpx.MockTransport(_handler)),
+        parse_offload_threshold=2,
+        parse_executor=executor,
+    )
+    page = await client.get_firm_regulators("100009")
+    # The first item is parsed on the loop, the other 8 in 4 chunks
+    assert executor.submitted == 4
+    assert [el.name for el in page.data] == [f"Regulator {idx}" for idx in range(9)]
+
+    # Parsers of whole payloads are never split
+    executor.submitted = 0
+    await client.get_firm_names("100009")
+    assert executor.submitted == 1
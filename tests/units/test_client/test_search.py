@@ -10,6 +10,11 @@ class TestFirmSearch:
         assert response.pagination.size == 2
         assert len(response.data) == 2
 
+        compact = await test_client.search_frn("revolution brokers", compact=True)
+        assert all(isinstance(item, fca_api.types.compact.CompactFirmSearchResult) for item in compact.data)
+        assert [item.to_model() for item in compact.data] == response.data
+        assert compact.pagination == response.pagination
+
     @pytest.mark.asyncio
     async def test_search_firm_no_results(self, test_client: fca_api.async_api.Client):
         response = await test_client.search_frn("nonexistent firm xyz")
@@ -45,6 +50,12 @@ class TestIndividualSearch:
         page2 = await test_client.search_irn("bob", next_page=page1.pagination.next_page)
         assert len(page2.data) > 0
 
+        compact = await test_client.search_irn("bob", compact=True)
+        assert [item.to_model() for item in compact.data] == page1.data
+        # Repeated status strings are shared between records
+        statuses = {item.status: item.status for item in compact.data}
+        assert all(item.status is statuses[item.status] for item in compact.data)
+
     @pytest.mark.asyncio
     async def test_empty_search_individual(self, test_client: fca_api.async_api.Client):
         response = await test_client.search_irn("f9eed039-4da8-4f21-8b02-424a6ec9d9e5")
@@ -61,6 +72,10 @@ class TestFundSearch:
             assert item.name
         assert page1.pagination.has_next
 
+        compact = await test_client.search_prn("global equity fund", compact=True)
+        assert [item.to_model() for item in compact.data] == page1.data
+        assert len(set(compact.data)) == len({item.prn for item in page1.data})
+
     @pytest.mark.asyncio
     async def test_search_fund_no_results(self, test_client: fca_api.async_api.Client):
         response = await test_client.search_prn("nonexistent fund xyz")
@@ -0,0 +1,171 @@
+import asyncio
+import contextlib
+
+import httpx
+import pytest
+
+import fca_api
+from fca_api.concurrency import AdaptiveLimiter, FeedbackLimiter
+from fca_api.metrics import ConcurrencyLimitRecorder, MetricsRecorder, MetricsRegistry
+
+_OK = {"Status": "FSR-API-02-01-00", "Message": "ok", "Data": [{}]}
+
+
+class TestAdaptiveLimiter:
+    def test_invalid_settings(self):
+        with pytest.raises(ValueError):
+            AdaptiveLimiter(initial_limit=10, max_limit=5)
+        with pytest.raises(ValueError):
+            AdaptiveLimiter(backoff_ratio=1.0)
+        with pytest.raises(ValueError):
+            AdaptiveLimiter(latency_tolerance=1.0)
+        with pytest.raises(ValueError):
+            AdaptiveLimiter(smoothing=0)
+
+    def test_is_a_feedback_limiter(self):
+        assert isinstance(AdaptiveLimiter(), FeedbackLimiter)
+        assert not isinstance(contextlib.nullcontext, FeedbackLimiter)
+
+    @pytest.mark.asyncio
+    async def test_caps_concurrency(self):
+        limiter = AdaptiveLimiter(initial_limit=2)
+        peak = 0
+
+        async def task():
+            nonlocal peak
+            async with limiter():
+                peak = max(peak, limiter.in_flight)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(task() for _ in range(6)))
+        assert peak == 2
+        assert limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak_slot(self):
+        limiter = AdaptiveLimiter(initial_limit=1)
+        async with limiter():
+            waiter = asyncio.ensure_future(limiter().__aenter__())
+            await asyncio.sleep(0)
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+        assert limiter.in_flight == 0
+        async with limiter():
+            assert limiter.in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_additive_increase_while_saturated(self):
+        limiter = AdaptiveLimiter(initial_limit=2, max_limit=3)
+        async with limiter(), limiter():
+            # 2 -> 2.5 -> 2.9 -> 3
+            for _ in range(3):
+                limiter.record_outcome(0.1, failed=False)
+            assert limiter.limit == 3
+            for _ in range(10):
+                limiter.record_outcome(0.1, failed=False)
+            assert limiter.limit == 3
+
+    def test_no_increase_while_idle(self):
+        limiter = AdaptiveLimiter(initial_limit=4)
+        for _ in range(20):
+            limiter.record_outcome(0.1, failed=False)
+        assert limiter.limit == 4
+
+    def test_multiplicative_decrease_once_per_round_trip(self, clock):
+        limiter = AdaptiveLimiter(initial_limit=16, clock=clock)
+        limiter.record_outcome(1.0, failed=True)
+        assert limiter.limit == 8
+        # Sent before the decrease
+        limiter.record_outcome(1.0, failed=True)
+        assert limiter.limit == 8
+        clock.now += 2.0
+        limiter.record_outcome(1.0, failed=True)
+        assert limiter.limit == 4
+        for _ in range(5):
+            clock.now += 2.0
+            limiter.record_outcome(1.0, failed=True)
+        assert limiter.limit == 1
+
+    def test_latency_inflation(self, clock):
+        limiter = AdaptiveLimiter(initial_limit=10, smoothing=1.0, clock=clock)
+        limiter.record_outcome(0.1, failed=False)
+        limiter.record_outcome(0.15, failed=False)
+        assert limiter.limit == 10
+        assert limiter.baseline_latency == pytest.approx(0.1005)
+        limiter.record_outcome(0.5, failed=False)
+        assert limiter.limit == 5
+
+    @pytest.mark.asyncio
+    async def test_wraps_inner_limiter(self):
+        entered = []
+
+        @contextlib.asynccontextmanager
+        async def inner():
+            entered.append(limiter.in_flight)
+            yield
+
+        limiter = AdaptiveLimiter(inner)
+        async with limiter():
+            pass
+        assert entered == [1]
+
+    def test_limit_metric(self, clock):
+        registry = MetricsRegistry()
+        limiter = AdaptiveLimiter(initial_limit=8, name="bulk", metrics=registry, clock=clock)
+        assert registry.concurrency_limit.value((("limiter", "bulk"),)) == 8
+        limiter.record_outcome(0.1, failed=True)
+        assert registry.concurrency_limit.value((("limiter", "bulk"),)) == 4
+        assert 'fca_api_concurrency_limit{limiter="bulk"} 4' in registry.render_prometheus()
+
+    def test_recorder_without_limit_metric(self):
+        class RequestsOnly:
+            def __init__(self):
+                self.requests = []
+
+            def observe_request(self, family, duration, response_bytes):
+                self.requests.append(family)
+
+            def observe_limiter_wait(self, family, duration): ...
+
+            def observe_json_decode(self, family, duration): ...
+
+            def observe_status_code(self, family, code): ...
+
+            def observe_validation(self, model, duration, items): ...
+
+            def observe_pages(self, endpoint, pages): ...
+
+        recorder = RequestsOnly()
+        assert isinstance(recorder, MetricsRecorder)
+        assert not isinstance(recorder, ConcurrencyLimitRecorder)
+        limiter = AdaptiveLimiter(initial_limit=8, metrics=recorder)
+        limiter.record_outcome(0.1, failed=True)
+        assert limiter.limit == 4
+
+
+class TestRawClientFeedback:
+    @pytest.mark.asyncio
+    async def test_outcomes_are_reported(self):
+        statuses = iter([200, 503])
+        limiter = AdaptiveLimiter(initial_limit=4)
+        outcomes = []
+        record_outcome = limiter.record_outcome
+
+        def record(duration, failed):
+            outcomes.append(failed)
+            record_outcome(duration, failed)
+
+        limiter.record_outcome = record
+        client = fca_api.raw_api.RawClient(
+            credentials=httpx.AsyncClient(
+                transport=httpx.MockTransport(lambda request: httpx.Response(next(statuses), json=_OK))
+            ),
+            api_limiter=limiter,
+        )
+        await client.get_firm("123456")
+        with pytest.raises(fca_api.exc.FcaRequestError):
+            await client.get_firm("123456")
+        assert outcomes == [False, True]
+        assert limiter.limit == 2
+        assert limiter.in_flight == 0
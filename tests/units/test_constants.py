@@ -1,6 +1,6 @@
 import pytest
 
-from fca_api.const import ApiConstants, ResourceTypes
+from fca_api.const import ApiConstants, EndpointFamily, ResourceTypes
 
 
 def test_fsr_api_constants():
@@ -36,3 +36,27 @@ class TestResourceTypes:
     def test_from_type_name_invalid(self):
         with pytest.raises(ValueError):
             ResourceTypes.from_type_name("unknown")
+
+
+class TestEndpointFamily:
+    def test_from_resource_type(self):
+        assert EndpointFamily.from_resource_type(ResourceTypes.FIRM.value) is EndpointFamily.FIRM
+        assert EndpointFamily.from_resource_type(ResourceTypes.FUND.value) is EndpointFamily.CIS
+        assert EndpointFamily.from_resource_type(ResourceTypes.INDIVIDUAL.value) is EndpointFamily.INDIVIDUALS
+
+    @pytest.mark.parametrize(
+        "url, expected",
+        [
+            ("https://register.fca.org.uk/services/V0.1/Firm/123456/Names?pgnp=1", EndpointFamily.FIRM),
+            ("https://register.fca.org.uk/services/V0.1/Search?q=abc&type=firm", EndpointFamily.SEARCH),
+            ("/V0.1/Individuals/ABC01234", EndpointFamily.INDIVIDUALS),
+            ("/v0.1/cis/123456/Subfund", EndpointFamily.CIS),
+            ("CommonSearch?q=RM", EndpointFamily.COMMON_SEARCH),
+        ],
+    )
+    def test_from_url(self, url, expected):
+        assert EndpointFamily.from_url(url) is expected
+
+    def test_from_url_invalid(self):
+        with pytest.raises(ValueError):
+            EndpointFamily.from_url("https://register.fca.org.uk/services/V0.1/Unknown/1")
@@ -0,0 +1,115 @@
+import asyncio
+import contextvars
+import time
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+import fca_api
+from fca_api.deadlines import deadline, remaining
+
+
+def _regulators(page: int) -> dict:
+    return {
+        "Status": "FSR-API-02-07-00",
+        "ResultInfo": {
+            "page": str(page),
+            "per_page": "1",
+            "total_count": "3",
+            "Next": f"https://example.com/?pgnp={page + 1}" if page < 3 else None,
+            "Previous": None,
+        },
+        "Data": [{"Regulator Name": f"Regulator {page}", "Effective Date": "01/01/2020"}],
+    }
+
+
+class SlowUpstream:
+    """Answers page 1 immediately and later pages after ``delay`` seconds."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.cancelled = 0
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params.get("pgnp", 1))
+        if page > 1:
+            try:
+                await asyncio.sleep(self.delay)
+            except asyncio.CancelledError:
+                self.cancelled += 1
+                raise
+        return httpx.Response(200, json=_regulators(page))
+
+    def client(self, **kwargs) -> fca_api.async_api.Client:
+        return fca_api.async_api.Client(
+            credentials=httpx.AsyncClient(transport=httpx.MockTransport(self.handler)),
+            **kwargs,
+        )
+
+
+def test_nested_deadlines_only_shorten():
+    assert remaining() is None
+    with deadline(10):
+        with deadline(60):
+            assert remaining() <= 10
+        with deadline(1):
+            assert remaining() <= 1
+    assert fca_api.deadlines.current() is None
+
+
+def test_detach_clears_a_copied_context():
+    with deadline(10):
+        context = contextvars.copy_context()
+        context.run(fca_api.deadlines.detach)
+        assert context.run(remaining) is None
+        assert remaining() <= 10
+
+
+@pytest.mark.asyncio
+async def test_partial_results():
+    upstream = SlowUpstream(delay=5)
+    client = upstream.client()
+    started = time.monotonic()
+    with deadline(0.2):
+        page = await client.get_firm_regulators("122702", result_count=3)
+    assert time.monotonic() - started < 2
+    assert upstream.cancelled == 1
+    assert page.partial
+    assert [el.name for el in page.data] == ["Regulator 1"]
+    assert page.pagination.has_next
+
+    upstream.delay = 0
+    rest = await client.get_firm_regulators("122702", next_page=page.pagination.next_page, result_count=3)
+    assert not rest.partial
+    assert [el.name for el in rest.data] == ["Regulator 2", "Regulator 3"]
+
+
+@pytest.mark.asyncio
+async def test_call_timeout_on_first_request():
+    upstream = SlowUpstream(delay=5)
+    client = upstream.client(call_timeout=0.1)
+    # The client's call timeout applies to high-level calls only
+    with pytest.raises(fca_api.exc.FcaDeadlineExceededError):
+        with deadline(0.1):
+            await client.raw_client.get_firm_regulators("122702", page=2)
+    page = await client.get_firm_regulators("122702", result_count=3)
+    assert page.partial
+    with deadline(0):
+        with pytest.raises(fca_api.exc.FcaDeadlineExceededError):
+            await client.get_firm_regulators("122702")
+
+
+@pytest.mark.asyncio
+async def test_no_retry_past_deadline(mocker):
+    sleep = mocker.patch.object(fca_api.raw_api.asyncio, "sleep", AsyncMock())
+    client = fca_api.raw_api.RawClient(
+        credentials=httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(503, headers={"Retry-After": "30"}))
+        ),
+        max_retries=3,
+    )
+    with deadline(5):
+        with pytest.raises(fca_api.exc.FcaRequestError):
+            await client.get_firm("122702")
+    sleep.assert_not_awaited()
@@ -0,0 +1,107 @@
+import gzip
+import importlib.util
+import io
+import json
+
+import pytest
+
+from fca_api import types
+from fca_api.export import ndjson, stream
+
+HAS_ZSTD = importlib.util.find_spec("compression") is not None or importlib.util.find_spec("zstandard") is not None
+
+
+def make_firm(idx: int) -> types.search.FirmSearchResult:
+    return types.search.FirmSearchResult.model_validate(
+        {
+            "Name": f"Firm {idx} (Postcode: E1 1AA)",
+            "Reference Number": str(100000 + idx),
+            "Status": "Authorised",
+            "Type of business or Individual": "Firm",
+            "URL": f"https://register.fca.org.uk/services/V0.1/Firm/{100000 + idx}",
+        }
+    )
+
+
+class FakeSearch:
+    """Three pages of firms, recording the calls made."""
+
+    def __init__(self, pages: int = 3, per_page: int = 4):
+        self.pages = pages
+        self.per_page = per_page
+        self.calls: list[tuple[str, int]] = []
+
+    async def __call__(self, query, next_page=None):
+        page = types.pagination._PageState.decode(next_page).page if next_page else 1
+        self.calls.append((query, page))
+        has_next = page < self.pages
+        return types.pagination.MultipageList(
+            data=[make_firm((page - 1) * self.per_page + idx) for idx in range(self.per_page)],
+            pagination=types.pagination.PaginationInfo(
+                has_next=has_next,
+                next_page=types.pagination._PageState(page=page + 1).encode() if has_next else None,
+                size=self.pages * self.per_page,
+            ),
+        )
+
+
+@pytest.mark.asyncio
+async def test_iter_pages_and_items():
+    search = FakeSearch()
+    pages = [page async for page in stream.iter_pages(search, "firm")]
+    assert len(pages) == 3
+    assert search.calls == [("firm", 1), ("firm", 2), ("firm", 3)]
+
+    items = [item async for item in stream.iter_items(search, "firm", next_page=pages[0].pagination.next_page)]
+    assert [item.frn for item in items] == [str(100000 + idx) for idx in range(4, 12)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("filename", "open_fn"),
+    [
+        ("firms.ndjson", open),
+        ("firms.ndjson.gz", gzip.open),
+    ],
+)
+async def test_export(tmp_path, filename, open_fn):
+    path = tmp_path / filename
+    count = await ndjson.export(path, FakeSearch(), "firm", buffer_size=64)
+    assert count == 12
+    with open_fn(path, "rb") as fh:
+        lines = fh.read().splitlines()
+    assert len(lines) == 12
+    assert json.loads(lines[0]) == make_firm(0).model_dump(mode="json")
+
+
+@pytest.mark.skipif(not HAS_ZSTD, reason="no zstd implementation available")
+def test_zstd(tmp_path):
+    path = tmp_path / "firms.ndjson.zst"
+    with ndjson.NdjsonWriter(path) as writer:
+        writer.write_many(make_firm(idx) for idx in range(10))
+    assert writer.compression == "zstd"
+    assert path.read_bytes()[:4] == b"\x28\xb5\x2f\xfd"
+
+
+def test_writer_buffers_and_keeps_file_objects_open():
+    out = io.BytesIO()
+    writer = ndjson.NdjsonWriter(out, buffer_size=1 << 16)
+    writer.write({"a": 1})
+    writer.write(make_firm(0))
+    assert out.getvalue() == b""
+    writer.close()
+    assert not out.closed
+    assert out.getvalue().count(b"\n") == 2
+    assert writer.count == 2
+
+
+def test_invalid_compression(tmp_path):
+    with pytest.raises(ValueError):
+        ndjson.NdjsonWriter(tmp_path / "out.ndjson", compression="bz2")
+    assert not (tmp_path / "out.ndjson").exists()
+
+
+@pytest.mark.skipif(HAS_ZSTD, reason="a zstd implementation is available")
+def test_zstd_unavailable(tmp_path):
+    with pytest.raises(ImportError, match="zstandard"):
+        ndjson.NdjsonWriter(tmp_path / "firms.ndjson.zst")
@@ -0,0 +1,119 @@
+import json
+import pathlib
+
+import httpx
+import pytest
+
+from fca_api import types
+from fca_api.raw_api import FcaApiResponse
+
+pyarrow = pytest.importorskip("pyarrow")
+pyarrow_parquet = pytest.importorskip("pyarrow.parquet")
+
+from fca_api.export import arrow  # noqa: E402
+
+RESOURCES = pathlib.Path(__file__).parent / "test_client" / "resources"
+
+
+def recorded_rows(pattern: str) -> list[dict]:
+    rows = []
+    for path in sorted(RESOURCES.glob(pattern)):
+        rows.extend(json.loads(path.read_text())["content"]["json"]["Data"] or [])
+    assert rows, f"No recorded rows for {pattern}"
+    return rows
+
+
+@pytest.mark.parametrize(
+    ("model", "pattern"),
+    [
+        (types.firm.FirmDetails, "test_get_firm_resource.py/TestNutmegFirmDetails/test_get_firm/*.json"),
+        (types.firm.FirmIndividual, "test_get_firm_resource.py/TestNutmegFirmDetails/test_get_firm_individuals/*.json"),
+        (types.firm.FirmWaiver, "test_get_firm_resource.py/TestNutmegFirmDetails/test_get_firm_waivers/*.json"),
+        (types.search.FirmSearchResult, "test_search.py/TestFirmSearch/test_multipage_results/*.json"),
+    ],
+)
+def test_raw_rows_match_model_validation(model, pattern):
+    rows = recorded_rows(pattern)
+    from_raw = arrow.RecordBatchBuilder(model)
+    from_models = arrow.RecordBatchBuilder(model)
+    for row in rows:
+        from_raw.append(row)
+        from_models.append_model(model.model_validate(row))
+    assert len(from_raw) == len(rows)
+    assert from_raw.flush().equals(from_models.flush())
+    assert len(from_raw) == 0
+
+
+def test_schema():
+    schema = arrow.schema(types.firm.FirmDetails)
+    assert schema.field("timestamp").type == pyarrow.timestamp("us")
+    assert not schema.field("timestamp").nullable
+    assert schema.field("status_effective_date").nullable
+    assert schema.field("names_url").type == pyarrow.string()
+    assert schema.field("exceptional_info_details").type == pyarrow.string()
+
+    assert arrow.schema(types.firm.FirmWaiver).field("rule_article_numbers").type == pyarrow.list_(pyarrow.string())
+    permissions = arrow.schema(types.firm.FirmPassportPermission).field("permissions").type
+    assert pyarrow.types.is_list(permissions)
+    assert pyarrow.types.is_struct(permissions.value_type)
+
+    aliased = arrow.schema(types.firm.FirmDetails, by_alias=True)
+    assert "firm_name" in aliased.names
+
+
+def test_invalid_rows_are_not_buffered():
+    builder = arrow.RecordBatchBuilder(types.firm.FirmIndividual)
+    with pytest.raises(ValueError, match="field required"):
+        builder.append({"IRN": "ABC01234", "Name": "A Person"})
+    with pytest.raises(ValueError, match="Unexpected fields"):
+        builder.append({"IRN": "ABC01234", "Name": "A", "Status": "Active", "URL": "https://x.test", "Extra": "1"})
+    assert len(builder) == 0
+
+
+def test_parquet_row_groups(tmp_path):
+    rows = recorded_rows("test_get_firm_resource.py/TestNutmegFirmDetails/test_get_firm_individuals/*.json")
+    path = tmp_path / "individuals.parquet"
+    with arrow.ParquetWriter(path, types.firm.FirmIndividual, row_group_size=10) as writer:
+        writer.write_raw(rows)
+    assert writer.count == len(rows)
+
+    parquet_file = pyarrow_parquet.ParquetFile(path)
+    assert parquet_file.metadata.num_rows == len(rows)
+    assert parquet_file.metadata.num_row_groups == -(-len(rows) // 10)
+    table = parquet_file.read()
+    assert table.schema == arrow.schema(types.firm.FirmIndividual)
+    assert table.column("irn").to_pylist() == [types.firm.FirmIndividual.model_validate(row).irn for row in rows]
+
+
+class FakeRawClient:
+    def __init__(self, pages: list[list[dict]]):
+        self.pages = pages
+
+    async def get_rows(self, ref_number, page=None):
+        per_page = len(self.pages[0])
+        return FcaApiResponse(
+            httpx.Response(
+                200,
+                json={
+                    "Status": "FSR-API-02-07-00",
+                    "Data": self.pages[page - 1],
+                    "ResultInfo": {
+                        "page": str(page),
+                        "per_page": str(per_page),
+                        "total_count": str(sum(len(el) for el in self.pages)),
+                        "Next": "https://register.fca.org.uk/next" if page < len(self.pages) else None,
+                        "Previous": None,
+                    },
+                },
+            )
+        )
+
+
+@pytest.mark.asyncio
+async def test_export_parquet(tmp_path):
+    rows = recorded_rows("test_get_firm_resource.py/TestNutmegFirmDetails/test_get_firm_individuals/*.json")[:30]
+    client = FakeRawClient([rows[:10], rows[10:20], rows[20:]])
+    path = tmp_path / "individuals.parquet"
+    count = await arrow.export_parquet(path, types.firm.FirmIndividual, client.get_rows, "123456")
+    assert count == 30
+    assert pyarrow_parquet.read_table(path).num_rows == 30
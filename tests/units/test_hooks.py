@@ -0,0 +1,162 @@
+import asyncio
+import contextlib
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+import fca_api
+from fca_api.const import EndpointFamily
+from fca_api.hooks import HookRegistry, HookStage
+
+_OK = {"Status": "FSR-API-02-01-00", "Message": "ok", "Data": [{}]}
+
+
+def _raw_client(handler, **kwargs):
+    return fca_api.raw_api.RawClient(credentials=httpx.AsyncClient(transport=httpx.MockTransport(handler)), **kwargs)
+
+
+class TestHookRegistry:
+    def test_register_and_unregister(self):
+        registry = HookRegistry()
+
+        @registry.on_request
+        def first(event):
+            pass
+
+        def second(event):
+            pass
+
+        assert registry.register("on_request", second) is second
+        assert registry.request_hooks == (first, second)
+        assert registry.response_hooks == ()
+
+        registry.unregister(HookStage.REQUEST, first)
+        assert registry.request_hooks == (second,)
+        with pytest.raises(ValueError):
+            registry.unregister(HookStage.REQUEST, first)
+        with pytest.raises(ValueError):
+            registry.register("on_nothing", first)
+
+
+class TestRawClientHooks:
+    @pytest.mark.asyncio
+    async def test_lifecycle(self):
+        events = []
+
+        @contextlib.asynccontextmanager
+        async def limiter():
+            yield
+
+        client = _raw_client(lambda request: httpx.Response(200, json=_OK), api_limiter=limiter)
+        client.hooks.on_limit_wait(events.append)
+        client.hooks.on_request(events.append)
+
+        @client.hooks.on_response
+        async def on_response(event):
+            await asyncio.sleep(0)
+            events.append(event)
+
+        response = await client.get_firm("123456")
+        limit_wait, request, received = events
+        assert isinstance(limit_wait, fca_api.hooks.LimitWaitEvent)
+        assert limit_wait.family is EndpointFamily.FIRM
+        assert limit_wait.duration >= 0
+        assert request == fca_api.hooks.RequestEvent(limit_wait.url, EndpointFamily.FIRM, 0)
+        assert received.response is response
+        assert received.attempt == 0
+        assert received.duration >= 0
+
+    @pytest.mark.asyncio
+    async def test_hook_errors_propagate(self):
+        client = _raw_client(lambda request: httpx.Response(200, json=_OK))
+
+        @client.hooks.on_request
+        def veto(event):
+            raise RuntimeError("not now")
+
+        with pytest.raises(RuntimeError):
+            await client.get_firm("123456")
+
+    @pytest.mark.asyncio
+    async def test_shared_registry(self):
+        registry = HookRegistry()
+        events = []
+        registry.on_request(events.append)
+        client = fca_api.async_api.Client(
+            credentials=httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, json=_OK))),
+            hooks=registry,
+        )
+        assert client.raw_client.hooks is registry
+        await client.raw_client.get_firm("123456")
+        assert len(events) == 1
+
+
+class TestRetries:
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(503, text="unavailable")
+
+        with pytest.raises(fca_api.exc.FcaRequestError):
+            await _raw_client(handler).get_firm("123456")
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_retries_upstream_failures(self, mocker):
+        sleep = mocker.patch.object(fca_api.raw_api.asyncio, "sleep", AsyncMock())
+        responses = iter(
+            [
+                httpx.Response(503, headers={"Retry-After": "7"}, text="unavailable"),
+                httpx.Response(200, json={"Status": "FSR-API-99-99-99", "Message": "system error", "Data": None}),
+                httpx.Response(200, json=_OK),
+            ]
+        )
+        client = _raw_client(lambda request: next(responses), max_retries=3, retry_backoff=0.5)
+        retries = []
+        client.hooks.on_retry(retries.append)
+
+        response = await client.get_firm("123456")
+        assert response.data == [{}]
+        assert [(el.attempt, el.delay) for el in retries] == [(1, 7.0), (2, 1.0)]
+        assert retries[0].response.status_code == 503
+        assert [call.args[0] for call in sleep.await_args_list] == [7.0, 1.0]
+
+    @pytest.mark.asyncio
+    async def test_retries_transport_errors(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            raise httpx.ConnectError("boom", request=request)
+
+        client = _raw_client(handler, max_retries=2, retry_backoff=0)
+        retries = []
+        client.hooks.on_retry(retries.append)
+        with pytest.raises(fca_api.exc.FcaRequestError):
+            await client.get_firm("123456")
+        assert len(calls) == 3
+        assert [el.attempt for el in retries] == [1, 2]
+        assert all(isinstance(el.error, fca_api.exc.FcaRequestError) for el in retries)
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_is_not_retried(self):
+        breaker = fca_api.breaker.CircuitBreaker(minimum_calls=1, failure_rate_threshold=1.0)
+        client = _raw_client(
+            lambda request: httpx.Response(503, text="unavailable"),
+            circuit_breaker=breaker,
+            max_retries=5,
+            retry_backoff=0,
+        )
+        retries = []
+        client.hooks.on_retry(retries.append)
+        with pytest.raises(fca_api.exc.FcaCircuitOpenError):
+            await client.get_firm("123456")
+        assert len(retries) == 1
+
+    def test_invalid_settings(self):
+        with pytest.raises(ValueError):
+            fca_api.raw_api.RawClient(credentials=("email", "key"), max_retries=-1)
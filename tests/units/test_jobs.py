@@ -0,0 +1,187 @@
+import sqlite3
+import threading
+
+import pytest
+
+from fca_api import types
+from fca_api.jobs import CheckpointStore, ItemStatus, JobRunner
+
+
+class CrashError(Exception):
+    pass
+
+
+class FakeClient:
+    """Serves three pages of three rows for every reference number."""
+
+    def __init__(self):
+        self.requested_pages: list[tuple[str, int]] = []
+
+    async def get_rows(self, ref_number, next_page=None):
+        state = types.pagination._PageState.decode(next_page) if next_page else types.pagination._PageState.first()
+        self.requested_pages.append((ref_number, state.page))
+        has_next = state.page < 3
+        return types.pagination.MultipageList(
+            data=[f"{ref_number}-{state.page}-{idx}" for idx in range(3)],
+            pagination=types.pagination.PaginationInfo(
+                has_next=has_next,
+                next_page=types.pagination._PageState(page=state.page + 1).encode() if has_next else None,
+                size=9,
+            ),
+        )
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = CheckpointStore(tmp_path / "checkpoints.sqlite3")
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def client():
+    return FakeClient()
+
+
+def make_handler(rows, crash_on=None):
+    async def handler(client, ref_number, checkpoint):
+        def on_page(data):
+            if data[0] == crash_on:
+                raise CrashError(crash_on)
+            rows.extend(data)
+
+        await checkpoint.paginate("rows", client.get_rows, ref_number, on_page=on_page)
+
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_run_to_completion(store, client):
+    rows = []
+    report = await JobRunner(client, store, "job").run(["1", "2"], make_handler(rows))
+    assert (report.done, report.failed, report.pending) == (2, 0, 0)
+    assert len(rows) == 18
+    assert store.get("job", "1").status is ItemStatus.DONE
+
+
+@pytest.mark.asyncio
+async def test_resume_after_failure(store, client):
+    rows = []
+    runner = JobRunner(client, store, "job", concurrency=1)
+    report = await runner.run(["1", "2"], make_handler(rows, crash_on="2-2-0"))
+    assert (report.done, report.failed) == (1, 1)
+    failed = store.get("job", "2")
+    assert failed.status is ItemStatus.FAILED
+    assert failed.attempts == 1
+    assert "CrashError" in failed.error
+    assert store.page_position("job", "2", "rows") == (types.pagination._PageState(page=2).encode(), False)
+
+    client.requested_pages.clear()
+    report = await runner.run(["1", "2"], make_handler(rows))
+    assert (report.done, report.failed, report.pending) == (2, 0, 0)
+    # Item 1 was not revisited and item 2 resumed from its second page
+    assert client.requested_pages == [("2", 2), ("2", 3)]
+    assert rows.count("1-1-0") == 1
+    assert [row for row in rows if row.startswith("2-")] == [
+        f"2-{page}-{idx}" for page in (1, 2, 3) for idx in range(3)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_resume_in_new_process(tmp_path, client):
+    path = tmp_path / "checkpoints.sqlite3"
+    store = CheckpointStore(path)
+    await JobRunner(client, store, "job").run(["1"], make_handler([], crash_on="1-3-0"))
+    store.close()
+
+    store = CheckpointStore(path)
+    client.requested_pages.clear()
+    report = await JobRunner(client, store, "job").run(["1"], make_handler([]))
+    store.close()
+    assert report.done == 1
+    assert client.requested_pages == [("1", 3)]
+
+
+@pytest.mark.asyncio
+async def test_max_attempts(store, client):
+    runner = JobRunner(client, store, "job", max_attempts=2)
+    for _ in range(3):
+        report = await runner.run(["1"], make_handler([], crash_on="1-1-0"))
+    assert report.failed == 1
+    assert store.get("job", "1").attempts == 2
+
+
+class Awaitable:
+    """An awaitable that is neither a coroutine nor a future."""
+
+    def __init__(self, rows, data):
+        self.rows = rows
+        self.data = data
+
+    def __await__(self):
+        yield from ()
+        self.rows.extend(self.data)
+
+
+@pytest.mark.asyncio
+async def test_on_page_may_return_any_awaitable(store, client):
+    rows = []
+
+    async def handler(client, ref_number, checkpoint):
+        await checkpoint.paginate("rows", client.get_rows, ref_number, on_page=lambda data: Awaitable(rows, data))
+
+    report = await JobRunner(client, store, "job").run(["1"], handler)
+    assert report.done == 1
+    assert len(rows) == 9
+
+
+def test_mark_done_is_atomic(store):
+    store.add("job", ["1"])
+    store.save_page_position("job", "1", "rows", "token")
+    store._conn.execute("CREATE TRIGGER crash BEFORE DELETE ON pages BEGIN SELECT RAISE(ABORT, 'crash'); END")
+    with pytest.raises(sqlite3.DatabaseError):
+        store.mark_done("job", "1")
+    assert store.get("job", "1").status is ItemStatus.PENDING
+    assert store.page_position("job", "1", "rows") == ("token", False)
+
+
+class ThreadRecordingStore(CheckpointStore):
+    """Records the threads its writes run in."""
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.write_threads = set()
+
+    def _update(self, *args, **kwargs):
+        self.write_threads.add(threading.get_ident())
+        super()._update(*args, **kwargs)
+
+    def save_page_position(self, *args, **kwargs):
+        self.write_threads.add(threading.get_ident())
+        super().save_page_position(*args, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_store_runs_off_the_event_loop(tmp_path, client):
+    store = ThreadRecordingStore(tmp_path / "checkpoints.sqlite3")
+    try:
+        report = await JobRunner(client, store, "job").run(["1"], make_handler([]))
+    finally:
+        store.close()
+    assert report.done == 1
+    assert store.write_threads
+    assert threading.get_ident() not in store.write_threads
+
+
+def test_jobs_are_isolated(store):
+    store.add("first", ["1", "2"])
+    store.add("second", ["1"])
+    store.mark_done("first", "1")
+    assert store.counts("first") == {ItemStatus.PENDING: 1, ItemStatus.DONE: 1, ItemStatus.FAILED: 0}
+    assert [state.item for state in store.items("second", ItemStatus.PENDING)] == ["1"]
+    assert store.get("second", "2") is None
+
+
+def test_invalid_settings(store, client):
+    with pytest.raises(ValueError):
+        JobRunner(client, store, "job", concurrency=0)
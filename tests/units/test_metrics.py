@@ -0,0 +1,130 @@
+import contextlib
+
+import httpx
+import pytest
+
+import fca_api
+from fca_api.const import EndpointFamily
+from fca_api.metrics import ConcurrencyLimitRecorder, Counter, Histogram, MetricsRecorder, MetricsRegistry
+
+
+class TestRegistry:
+    def test_is_a_recorder(self):
+        assert isinstance(MetricsRegistry(), MetricsRecorder)
+        assert isinstance(MetricsRegistry(), ConcurrencyLimitRecorder)
+
+    def test_invalid_buckets(self):
+        with pytest.raises(ValueError):
+            Histogram("x", "x", (1.0, 0.5))
+        with pytest.raises(ValueError):
+            Counter("x_total", "x").inc(amount=-1)
+
+    def test_histogram_buckets_are_cumulative(self):
+        histogram = Histogram("latency_seconds", "Latency.", (0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 5.0):
+            histogram.observe(value, (("family", "Firm"),))
+        assert histogram.count((("family", "Firm"),)) == 4
+        assert histogram.sum((("family", "Firm"),)) == pytest.approx(5.65)
+        assert histogram.render() == [
+            'latency_seconds_bucket{family="Firm",le="0.1"} 2',
+            'latency_seconds_bucket{family="Firm",le="1"} 3',
+            'latency_seconds_bucket{family="Firm",le="+Inf"} 4',
+            'latency_seconds_sum{family="Firm"} 5.65',
+            'latency_seconds_count{family="Firm"} 4',
+        ]
+
+    def test_render_prometheus(self):
+        registry = MetricsRegistry()
+        registry.observe_request(EndpointFamily.FIRM, 0.2, 1024)
+        registry.observe_request(EndpointFamily.FIRM, 0.3, 512)
+        code = fca_api.raw_status_codes.find_code("FSR-API-02-01-00")
+        registry.observe_status_code(EndpointFamily.FIRM, code)
+        registry.observe_status_code(EndpointFamily.FIRM, None)
+        registry.observe_validation('firm."Firm"', 0.01, 3)
+
+        text = registry.render_prometheus()
+        assert "# TYPE fca_api_request_duration_seconds histogram" in text
+        assert 'fca_api_request_duration_seconds_count{family="Firm"} 2' in text
+        assert 'fca_api_response_bytes_total{family="Firm"} 1536' in text
+        assert 'fca_api_status_codes_total{family="Firm",code="FSR-API-02-01-00",error="false"} 1' in text
+        assert 'fca_api_status_codes_total{family="Firm",code="unknown",error="unknown"} 1' in text
+        assert 'fca_api_validated_items_total{model="firm.\\"Firm\\""} 3' in text
+        assert text.endswith("\n")
+
+
+class TestRawClientMetrics:
+    @pytest.mark.asyncio
+    async def test_request_metrics(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if "Individuals" in request.url.path:
+                return httpx.Response(503, text="unavailable")
+            return httpx.Response(200, json={"Status": "FSR-API-02-01-00", "Message": "ok", "Data": [{}]})
+
+        @contextlib.asynccontextmanager
+        async def limiter():
+            yield
+
+        registry = MetricsRegistry()
+        raw_client = fca_api.raw_api.RawClient(
+            credentials=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            api_limiter=limiter,
+            metrics=registry,
+        )
+        assert raw_client.metrics is registry
+        response = await raw_client.get_firm("123456")
+        assert response.data == [{}]
+        with pytest.raises(fca_api.exc.FcaRequestError):
+            await raw_client.get_individual("ABC01234")
+
+        firm = (("family", "Firm"),)
+        individuals = (("family", "Individuals"),)
+        assert registry.request_duration.count(firm) == 1
+        assert registry.request_duration.count(individuals) == 1
+        assert registry.response_bytes.value(firm) == len(response.content)
+        assert registry.limiter_wait_duration.count(firm) == 1
+        assert registry.json_decode_duration.count(firm) == 1
+        # Error responses are not decoded
+        assert registry.json_decode_duration.count(individuals) == 0
+        assert registry.status_codes.value((*firm, ("code", "FSR-API-02-01-00"), ("error", "false"))) == 1
+
+    def test_json_is_decoded_once(self):
+        response = fca_api.raw_api.FcaApiResponse(httpx.Response(200, json={"Status": "x", "Data": [1]}))
+        assert response.json() is response.json()
+        assert response.data == [1]
+        # Copies decode their own body
+        assert fca_api.raw_api.FcaApiResponse(response).json() is not response.json()
+
+
+class TestClientMetrics:
+    @pytest.mark.asyncio
+    async def test_pages_and_validation(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            page = int(request.url.params.get("pgnp", 1))
+            return httpx.Response(
+                200,
+                json={
+                    "Status": "FSR-API-02-07-00",
+                    "ResultInfo": {
+                        "page": str(page),
+                        "per_page": "1",
+                        "total_count": "2",
+                        "Next": "https://example.com/?pgnp=2" if page == 1 else None,
+                        "Previous": None,
+                    },
+                    "Data": [{"Regulator Name": f"Regulator {page}", "Effective Date": "01/01/2020"}],
+                },
+            )
+
+        registry = MetricsRegistry()
+        client = fca_api.async_api.Client(
+            credentials=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            metrics=registry,
+        )
+        result = await client.get_firm_regulators("123456", result_count=2)
+        assert [el.name for el in result.data] == ["Regulator 1", "Regulator 2"]
+
+        assert registry.pages_per_call.count((("endpoint", "get_firm_regulators"),)) == 1
+        assert registry.pages_per_call.sum((("endpoint", "get_firm_regulators"),)) == 2
+        assert registry.validation_duration.count((("model", "firm.FirmRegulator"),)) == 2
+        assert registry.validated_items.value((("model", "firm.FirmRegulator"),)) == 2
+        assert registry.request_duration.count((("family", "Firm"),)) == 2
@@ -0,0 +1,43 @@
+import subprocess
+import sys
+
+import pytest
+
+import fca_api
+
+
+def loaded_modules(code: str) -> set[str]:
+    result = subprocess.run(
+        [sys.executable, "-c", f"import sys\n{code}\nprint(' '.join(sys.modules))"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return set(result.stdout.split())
+
+
+def test_import_is_lazy():
+    modules = loaded_modules("import fca_api")
+    assert "fca_api" in modules
+    assert "fca_api.async_api" not in modules
+    assert "fca_api.types" not in modules
+
+
+def test_types_are_imported_on_use():
+    modules = loaded_modules("import fca_api\nfca_api.async_api.Client")
+    assert "fca_api.types" in modules
+    assert "fca_api.types.firm" not in modules
+
+    modules = loaded_modules("import fca_api\nfca_api.types.search.FirmSearchResult")
+    assert "fca_api.types.search" in modules
+    assert "fca_api.types.firm" not in modules
+
+
+def test_attribute_access():
+    assert fca_api.types.firm.FirmDetails.__name__ == "FirmDetails"
+    assert "async_api" in dir(fca_api)
+    assert "firm" in dir(fca_api.types)
+    with pytest.raises(AttributeError, match="no attribute 'missing'"):
+        _ = fca_api.missing
+    with pytest.raises(AttributeError, match="no attribute 'missing'"):
+        _ = fca_api.types.missing
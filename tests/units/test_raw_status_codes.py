@@ -37,3 +37,20 @@ def test_find_code_with_valid_status():
     result = fca_api.raw_status_codes.find_code("FSR-API-01-01-00")
     assert result is not None
     assert result.value == "FSR-API-01-01-00"
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("FSR-API-02-01-11", True),  # Firm not found
+        ("fsr-api-04-01-11", True),  # No search result found
+        ("FSR-API-02-01-00", False),  # Request successful
+        ("FSR-API-02-04-22", False),  # Page not found
+        ("FSR-API-01-01-21", False),  # API and Email key not found
+        ("unknown_status_code", False),
+        (None, False),
+    ],
+)
+def test_is_not_found(value, expected, recwarn):
+    assert fca_api.raw_status_codes.is_not_found(value) is expected
+    assert not recwarn.list
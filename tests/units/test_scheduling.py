@@ -0,0 +1,137 @@
+import asyncio
+import contextlib
+
+import httpx
+import pytest
+
+import fca_api
+from fca_api.scheduling import BATCH, INTERACTIVE, PriorityClass, PriorityLimiter, current_priority, priority
+
+_REGULATORS = {
+    "Status": "FSR-API-02-07-00",
+    "Message": "ok",
+    "Data": [{"Regulator Name": "Financial Conduct Authority", "Effective Date": "01/04/2013"}],
+}
+
+
+def _queue(limiter, name, order):
+    async def request():
+        async with limiter():
+            order.append(name)
+
+    with priority(name):
+        return asyncio.ensure_future(request())
+
+
+class TestPriorityLimiter:
+    def test_invalid_settings(self):
+        with pytest.raises(ValueError):
+            PriorityLimiter(capacity=0)
+        with pytest.raises(ValueError):
+            PriorityLimiter(classes=(PriorityClass("a"), PriorityClass("a")), default="a")
+        with pytest.raises(ValueError):
+            PriorityLimiter(capacity=1, classes=(PriorityClass("a", reserved=2),), default="a")
+        with pytest.raises(ValueError):
+            PriorityLimiter(default="other")
+
+    def test_priority_context(self):
+        assert current_priority() is None
+        with priority(BATCH):
+            assert current_priority() == BATCH
+        assert current_priority() is None
+
+    @pytest.mark.asyncio
+    async def test_unknown_priority(self):
+        with pytest.raises(ValueError):
+            with priority("urgent"):
+                async with PriorityLimiter()():
+                    pass
+
+    @pytest.mark.asyncio
+    async def test_reserved_capacity(self):
+        limiter = PriorityLimiter(capacity=2)
+        order = []
+        with priority(BATCH):
+            async with limiter():
+                assert limiter.in_flight(BATCH) == 1
+                batch = _queue(limiter, BATCH, order)
+                await asyncio.sleep(0)
+                # The remaining slot is reserved for interactive requests
+                assert limiter.queued(BATCH) == 1
+                with priority(INTERACTIVE):
+                    async with limiter():
+                        assert limiter.in_flight() == 2
+                assert order == []
+        await batch
+        assert order == [BATCH]
+        assert limiter.in_flight() == 0
+
+    @pytest.mark.asyncio
+    async def test_weighted_fair_queuing(self):
+        limiter = PriorityLimiter(
+            capacity=1,
+            classes=(PriorityClass(INTERACTIVE, weight=3.0), PriorityClass(BATCH, weight=1.0)),
+        )
+        order = []
+        async with limiter():
+            tasks = [_queue(limiter, BATCH, order) for _ in range(8)]
+            tasks += [_queue(limiter, INTERACTIVE, order) for _ in range(8)]
+            await asyncio.sleep(0)
+            assert limiter.queued() == 16
+        await asyncio.gather(*tasks)
+        # Both classes are served while queued, in proportion to their weights
+        assert order[:8].count(INTERACTIVE) == 6
+        assert order.count(BATCH) == 8
+
+    @pytest.mark.asyncio
+    async def test_cancel_queued(self):
+        limiter = PriorityLimiter(capacity=1, classes=(PriorityClass(INTERACTIVE), PriorityClass(BATCH)))
+        order = []
+        async with limiter():
+            batch = [_queue(limiter, BATCH, order) for _ in range(3)]
+            interactive = _queue(limiter, INTERACTIVE, order)
+            await asyncio.sleep(0)
+            assert limiter.cancel_queued(BATCH) == 3
+            assert limiter.queued() == 1
+        results = await asyncio.gather(*batch, return_exceptions=True)
+        assert all(isinstance(el, fca_api.exc.FcaQueueCancelledError) for el in results)
+        await interactive
+        assert order == [INTERACTIVE]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_task_does_not_leak_slot(self):
+        limiter = PriorityLimiter(capacity=1, classes=(PriorityClass(INTERACTIVE),))
+        async with limiter():
+            waiter = _queue(limiter, INTERACTIVE, [])
+            await asyncio.sleep(0)
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+        assert (limiter.in_flight(), limiter.queued()) == (0, 0)
+
+
+class TestClientPriority:
+    @pytest.mark.asyncio
+    async def test_client_views(self):
+        seen = []
+
+        @contextlib.asynccontextmanager
+        async def inner():
+            seen.append(current_priority())
+            yield
+
+        client = fca_api.async_api.Client(
+            credentials=httpx.AsyncClient(
+                transport=httpx.MockTransport(lambda request: httpx.Response(200, json=_REGULATORS))
+            ),
+            api_limiter=PriorityLimiter(inner=inner),
+        )
+        batch = client.with_priority(BATCH)
+        assert (client.priority, batch.priority) == (None, BATCH)
+        assert batch.raw_client is client.raw_client
+
+        await client.get_firm_regulators("122702")
+        await batch.get_firm_regulators("122702")
+        with priority(BATCH):
+            await client.get_firm_regulators("122702")
+        assert seen == [None, BATCH, BATCH]
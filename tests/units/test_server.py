@@ -0,0 +1,159 @@
+import asyncio
+import json
+import pathlib
+
+import httpx
+import pytest
+import pytest_asyncio
+
+import fca_api
+from fca_api import cli
+from fca_api.caching import ResponseCache
+from fca_api.metrics import MetricsRegistry
+from fca_api.server import SidecarServer, SidecarTransport, sidecar_session
+
+_RESOURCES = pathlib.Path(__file__).parent / "test_client" / "resources" / "test_get_firm_resource.py"
+
+
+def _recorded() -> dict[str, dict]:
+    """Recorded FS Register responses by URL."""
+    out = {}
+    for path in (_RESOURCES / "TestNutmegFirmDetails").glob("*/*.json"):
+        recording = json.loads(path.read_text())
+        out[recording["url"]] = recording
+    return out
+
+
+@pytest.fixture
+def upstream(upstream):
+    upstream.recorded = _recorded()
+    return upstream
+
+
+@pytest_asyncio.fixture
+async def sidecar(upstream):
+    client = fca_api.raw_api.RawClient(
+        credentials=upstream.session(),
+        cache=ResponseCache(ttl=60),
+        metrics=MetricsRegistry(),
+    )
+    async with SidecarServer(client, port=0) as server:
+        yield server
+
+
+@pytest_asyncio.fixture
+async def session(sidecar):
+    async with sidecar_session(sidecar.url) as out:
+        yield out
+
+
+class TestSidecarServer:
+    @pytest.mark.asyncio
+    async def test_serves_and_caches_recorded_responses(self, sidecar, upstream):
+        async with fca_api.async_api.Client(credentials=sidecar_session(sidecar.url)) as client:
+            firm = await client.get_firm("552016")
+            assert firm.frn == "552016"
+            assert (await client.get_firm("552016")).name == firm.name
+        assert upstream.requests == ["https://register.fca.org.uk/services/V0.1/Firm/552016"]
+
+    @pytest.mark.asyncio
+    async def test_relative_paths(self, sidecar, session, upstream):
+        response = await session.get("/V0.1/Firm/552016")
+        assert response.status_code == 200
+        assert response.json() == upstream.recorded[upstream.requests[0]]["content"]["json"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_are_coalesced(self, sidecar, session, upstream):
+        upstream.delay = 0.05
+        responses = await asyncio.gather(*(session.get("/V0.1/Firm/552016/Names?pgnp=1") for _ in range(5)))
+        assert {response.status_code for response in responses} == {200}
+        assert len(upstream.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_upstream_failures_are_passed_through_uncached(self, sidecar, session, upstream):
+        upstream.status = 503
+        for _ in range(2):
+            response = await session.get("/V0.1/Firm/552016")
+            assert response.status_code == 503
+        assert len(upstream.requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_client_errors_are_passed_through_uncached(self, sidecar, session, upstream):
+        upstream.status = 401
+        for _ in range(2):
+            response = await session.get("/V0.1/Firm/552016")
+            assert response.status_code == 401
+            assert response.json() == {"Message": "unavailable"}
+        assert len(upstream.requests) == 2
+        assert len(sidecar.client.cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_transport_errors(self, upstream):
+        def fail(request):
+            raise httpx.ConnectError("unreachable")
+
+        client = fca_api.raw_api.RawClient(credentials=httpx.AsyncClient(transport=httpx.MockTransport(fail)))
+        async with SidecarServer(client, port=0) as server, sidecar_session(server.url) as session:
+            response = await session.get("/V0.1/Firm/552016")
+        assert response.status_code == 502
+
+    @pytest.mark.asyncio
+    async def test_request_timeout(self, upstream):
+        upstream.delay = 1.0
+        client = fca_api.raw_api.RawClient(credentials=upstream.session())
+        async with (
+            SidecarServer(client, port=0, request_timeout=0.05) as server,
+            sidecar_session(server.url) as session,
+        ):
+            response = await session.get("/V0.1/Firm/552016")
+        assert response.status_code == 504
+
+    @pytest.mark.asyncio
+    async def test_other_paths(self, sidecar, session, upstream):
+        assert (await session.get("/healthz")).text == "ok\n"
+        assert (await session.get("/V0.1/Unknown/1")).status_code == 404
+        assert (await session.get("/V0.1/Firm/../../admin")).status_code == 404
+        assert (await session.get("/other")).status_code == 404
+        response = await session.post("/V0.1/Firm/552016")
+        assert response.status_code == 405
+        assert response.headers["Allow"] == "GET"
+        assert upstream.requests == []
+
+    @pytest.mark.asyncio
+    async def test_metrics(self, sidecar, session):
+        await session.get("/V0.1/Firm/552016")
+        await session.get("/V0.1/Firm/552016")
+        response = await session.get("/metrics")
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert 'fca_api_request_duration_seconds_count{family="Firm"} 1' in response.text
+        assert 'fca_api_sidecar_requests_total{status="200"} 2' in response.text
+        assert 'fca_api_sidecar_cache_events_total{event="hits"} 1' in response.text
+        assert 'fca_api_sidecar_cache_events_total{event="misses"} 1' in response.text
+
+
+class TestSidecarTransport:
+    @pytest.mark.asyncio
+    async def test_rewrites_register_requests(self):
+        seen = []
+
+        def handler(request):
+            seen.append((str(request.url), request.headers["Host"]))
+            return httpx.Response(200)
+
+        transport = SidecarTransport("http://sidecar:8080", inner=httpx.MockTransport(handler))
+        async with httpx.AsyncClient(transport=transport) as session:
+            await session.get("https://register.fca.org.uk/services/V0.1/Firm/552016?page=2")
+            await session.get("https://example.com/other")
+        assert seen == [
+            ("http://sidecar:8080/services/V0.1/Firm/552016?page=2", "sidecar:8080"),
+            ("https://example.com/other", "example.com"),
+        ]
+
+
+class TestCli:
+    def test_serve_requires_credentials(self, monkeypatch):
+        monkeypatch.delenv("FCA_API_USERNAME", raising=False)
+        monkeypatch.delenv("FCA_API_KEY", raising=False)
+        with pytest.raises(SystemExit) as excinfo:
+            cli.main(["serve", "--port", "0"])
+        assert excinfo.value.code == 2
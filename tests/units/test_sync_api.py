@@ -0,0 +1,122 @@
+import inspect
+import threading
+
+import pytest
+
+import fca_api
+from fca_api import scheduling, sync_api
+
+SEARCH_RESPONSE = {
+    "Status": "FSR-API-04-01-00",
+    "Message": "Ok. Search successful",
+    "ResultInfo": {"Next": None, "Previous": None, "page": "1", "per_page": "20", "total_count": "1"},
+    "Data": [
+        {
+            "Name": "Revolut Ltd (Postcode: E14 4HD)",
+            "Reference Number": "900562",
+            "Status": "Authorised",
+            "Type of business or Individual": "Firm",
+            "URL": "https://register.fca.org.uk/services/V0.1/Firm/900562",
+        }
+    ],
+}
+
+
+@pytest.fixture
+def upstream(upstream):
+    upstream.body = SEARCH_RESPONSE
+    return upstream
+
+
+@pytest.fixture
+def client(upstream):
+    with sync_api.Client(credentials=upstream.session()) as client:
+        yield client
+
+
+def test_method_surface_matches_async_client():
+    async_methods = {
+        name
+        for name, _ in inspect.getmembers(fca_api.async_api.Client, inspect.iscoroutinefunction)
+        if not name.startswith("_") and name != "aclose"
+    }
+    for name in async_methods:
+        method = getattr(sync_api.Client, name)
+        assert not inspect.iscoroutinefunction(method)
+        assert inspect.signature(method) == inspect.signature(getattr(fca_api.async_api.Client, name))
+
+
+def test_search(client, upstream):
+    page = client.search_frn("revolut")
+    assert [el.frn for el in page.data] == ["900562"]
+    assert upstream.threads == {"fca-api-event-loop"}
+
+
+def test_shared_loop_across_threads(client, upstream):
+    errors = []
+
+    def worker():
+        try:
+            for _ in range(5):
+                client.search_frn("revolut")
+        except Exception as e:  # pragma: no cover
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert upstream.calls == 20
+    assert upstream.threads == {"fca-api-event-loop"}
+
+
+def test_clients_share_one_loop(upstream):
+    with (
+        sync_api.Client(credentials=upstream.session()) as first,
+        sync_api.Client(credentials=upstream.session()) as second,
+    ):
+        first.search_frn("revolut")
+        second.search_frn("revolut")
+    assert upstream.threads == {"fca-api-event-loop"}
+
+
+def test_with_priority(client, upstream):
+    batch = client.with_priority(scheduling.BATCH)
+    assert (client.priority, batch.priority) == (None, scheduling.BATCH)
+    assert batch.async_client.raw_client is client.async_client.raw_client
+    assert batch.with_priority(None).priority is None
+
+    client.search_frn("revolut")
+    batch.search_frn("revolut")
+    with batch:
+        batch.search_frn("revolut")
+    # Closing the view leaves the client's session open
+    client.search_frn("revolut")
+    assert upstream.priorities == [None, scheduling.BATCH, scheduling.BATCH, None]
+    assert upstream.threads == {"fca-api-event-loop"}
+
+
+def test_with_priority_follows_reopened_client(upstream):
+    client = sync_api.Client(credentials=("email@example.com", "key"))
+    batch = client.with_priority(scheduling.BATCH)
+    first = batch.async_client
+    client.close()
+    assert batch.async_client is not first
+    assert batch.async_client.raw_client is client.async_client.raw_client
+    assert batch.priority == scheduling.BATCH
+    client.close()
+
+
+def test_api_version(client):
+    assert client.api_version == "V0.1"
+
+
+def test_close_reopens_on_next_call(upstream):
+    client = sync_api.Client(credentials=("email@example.com", "key"))
+    session = client.async_client.raw_client.api_session
+    client.close()
+    assert session.is_closed
+    assert client.async_client.raw_client.api_session is not session
+    client.close()
@@ -0,0 +1,116 @@
+import contextlib
+import contextvars
+import dataclasses
+
+import httpx
+import pytest
+
+import fca_api
+from fca_api.tracing import NOOP_TRACER
+
+_current = contextvars.ContextVar("current_span", default=None)
+
+
+@dataclasses.dataclass
+class RecordedSpan:
+    name: str
+    attributes: dict
+    parent: "RecordedSpan | None"
+    ended: bool = False
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+
+class RecordingTracer:
+    def __init__(self):
+        self.spans = []
+
+    @contextlib.contextmanager
+    def start_as_current_span(self, name, attributes=None):
+        span = RecordedSpan(name, dict(attributes or {}), _current.get())
+        self.spans.append(span)
+        token = _current.set(span)
+        try:
+            yield span
+        finally:
+            _current.reset(token)
+            span.ended = True
+
+    def named(self, name):
+        return [span for span in self.spans if span.name == name]
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    page = int(request.url.params.get("pgnp", 1))
+    return httpx.Response(
+        200,
+        json={
+            "Status": "FSR-API-02-07-00",
+            "ResultInfo": {
+                "page": str(page),
+                "per_page": "1",
+                "total_count": "2",
+                "Next": "https://example.com/?pgnp=2" if page == 1 else None,
+                "Previous": None,
+            },
+            "Data": [{"Regulator Name": f"Regulator {page}", "Effective Date": "01/01/2020"}],
+        },
+    )
+
+
+def test_noop_tracer():
+    with NOOP_TRACER.start_as_current_span("x", attributes={"a": 1}) as span:
+        span.set_attribute("b", 2)
+    assert NOOP_TRACER.start_as_current_span("y") is span
+
+
+@pytest.mark.asyncio
+async def test_disabled_by_default():
+    client = fca_api.async_api.Client(credentials=httpx.AsyncClient(transport=httpx.MockTransport(_handler)))
+    assert client.raw_client.tracer is NOOP_TRACER
+    result = await client.get_firm_regulators("123456", result_count=2)
+    assert len(result.data) == 2
+
+
+@pytest.mark.asyncio
+async def test_nested_spans():
+    tracer = RecordingTracer()
+
+    @contextlib.asynccontextmanager
+    async def limiter():
+        yield
+
+    client = fca_api.async_api.Client(
+        credentials=httpx.AsyncClient(transport=httpx.MockTransport(_handler)),
+        api_limiter=limiter,
+        tracer=tracer,
+    )
+    result = await client.get_firm_regulators(frn="123456", result_count=2)
+    assert len(result.data) == 2
+    assert all(span.ended for span in tracer.spans)
+
+    (call,) = tracer.named("fca_api.Client.get_firm_regulators")
+    assert call.parent is None
+    assert call.attributes == {
+        "fca_api.endpoint": "get_firm_regulators",
+        "fca_api.frn": "123456",
+        "fca_api.item_count": 2,
+    }
+
+    pages = tracer.named("fca_api.page")
+    assert [span.attributes["fca_api.page"] for span in pages] == [1, 2]
+    for span in pages:
+        assert span.parent is call
+        assert span.attributes["fca_api.endpoint"] == "get_firm_regulators"
+        assert span.attributes["fca_api.item_count"] == 1
+
+    limiters = tracer.named("fca_api.limiter")
+    https = tracer.named("fca_api.http")
+    validations = tracer.named("fca_api.validate")
+    assert [span.parent for span in limiters] == pages
+    assert [span.parent for span in https] == pages
+    assert [span.parent for span in validations] == pages
+    assert https[0].attributes["fca_api.endpoint_family"] == "Firm"
+    assert https[0].attributes["http.response.status_code"] == 200
+    assert validations[0].attributes == {"fca_api.model": "firm.FirmRegulator", "fca_api.item_count": 1}
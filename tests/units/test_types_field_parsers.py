@@ -4,6 +4,7 @@ import datetime
 
 import pytest
 
+from fca_api import types
 from fca_api.types import field_parsers
 
 
@@ -171,3 +172,35 @@ class TestFixIncompleteUrl:
 
     def test_whitespace_stripped(self):
         assert field_parsers.FixIncompleteUrl.func("  https://example.com  ") == "https://example.com"
+
+
+class TestInterned:
+    """Tests for the Interned validator."""
+
+    def test_strings_are_interned(self):
+        first = "".join(["author", "ised"])
+        second = "".join(["autho", "rised"])
+        assert first is not second
+        assert field_parsers.Interned.func(first) is field_parsers.Interned.func(second)
+
+    def test_list_elements_are_interned(self):
+        result = field_parsers.Interned.func(["".join(["re", "tail"]), "".join(["ret", "ail"])])
+        assert result == ["retail", "retail"]
+        assert result[0] is result[1]
+
+    def test_none_passthrough(self):
+        assert field_parsers.Interned.func(None) is None
+
+    def test_models_share_values(self):
+        rows = [
+            {
+                "Name": f"Firm {idx}",
+                "Reference Number": str(100000 + idx),
+                "Status": "".join(["Author", "ised"]),
+                "Type of business or Individual": "Firm",
+                "URL": None,
+            }
+            for idx in range(2)
+        ]
+        first, second = (types.search.FirmSearchResult.model_validate(row) for row in rows)
+        assert first.status is second.status
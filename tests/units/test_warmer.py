@@ -0,0 +1,113 @@
+import httpx
+import pytest
+
+import fca_api
+from fca_api.caching import ResponseCache
+from fca_api.warmer import CacheWarmer
+
+BASE = fca_api.const.ApiConstants.BASEURL.value
+
+
+@pytest.fixture
+def client(upstream):
+    return fca_api.async_api.Client(
+        credentials=upstream.session(),
+        cache=ResponseCache(ttl=60),
+    )
+
+
+def test_requires_cache():
+    raw_client = fca_api.raw_api.RawClient(credentials=httpx.AsyncClient())
+    with pytest.raises(ValueError):
+        CacheWarmer(raw_client)
+
+
+def test_targets(client):
+    warmer = CacheWarmer(client, firms=["122702"], individuals=["MXC29012"])
+    targets = warmer.targets()
+    assert len(targets) == len(set(targets)) == 1 + 12 + 1 + 2
+    assert f"{BASE}/Firm/122702" in targets
+    assert f"{BASE}/Firm/122702/Names?pgnp=1" in targets
+    assert f"{BASE}/Individuals/MXC29012/CF?pgnp=1" in targets
+
+    warmer.unwatch(individuals=["MXC29012"])
+    warmer.sub_resources = False
+    assert warmer.targets() == [f"{BASE}/Firm/122702"]
+
+
+@pytest.mark.asyncio
+async def test_run_once_refreshes_cached_entries(client, upstream):
+    first = await client.raw_client.get_firm("122702")
+    warmer = CacheWarmer(client, firms=["122702"], sub_resources=False, max_rate=1000)
+
+    result = await warmer.run_once(duration=0)
+    assert (result.refreshed, result.failed) == (1, 0)
+    assert len(upstream.requests) == 2
+
+    # The refreshed response is now served from the cache
+    second = await client.raw_client.get_firm("122702")
+    assert first.data == [{"Call": 1}]
+    assert second.data == [{"Call": 2}]
+    assert len(upstream.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_entry(client, upstream):
+    await client.raw_client.get_firm("122702")
+    upstream.modes["/services/V0.1/Firm/122702"] = "down"
+    warmer = CacheWarmer(client, firms=["122702"], sub_resources=False, max_rate=1000)
+
+    result = await warmer.run_once(duration=0)
+    assert (result.refreshed, result.failed) == (0, 1)
+    response = await client.raw_client.get_firm("122702")
+    assert response.data == [{"Call": 1}]
+
+
+@pytest.mark.asyncio
+async def test_refreshes_negatively_cached_entries(client, upstream):
+    upstream.modes["/services/V0.1/Firm/122702"] = "missing"
+    upstream.missing_status = "FSR-API-05-04-11"
+    with pytest.raises(fca_api.exc.FcaRequestError, match="FSR-API-05-04-11"):
+        await client.raw_client.get_firm("122702")
+    warmer = CacheWarmer(client, firms=["122702"], sub_resources=False, max_rate=1000)
+
+    result = await warmer.run_once(duration=0)
+    assert (result.refreshed, result.failed) == (1, 0)
+    assert len(upstream.requests) == 2
+    with pytest.raises(fca_api.exc.FcaRequestError, match="FSR-API-05-04-11"):
+        await client.raw_client.get_firm("122702")
+    assert len(upstream.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_learns_hot_keys(client, upstream):
+    for _ in range(3):
+        await client.raw_client.get_firm("122702")
+    await client.raw_client.get_individual("MXC29012")
+    warmer = CacheWarmer(client, learn_hot_keys=1, max_rate=1000)
+    assert warmer.targets() == [f"{BASE}/Firm/122702"]
+
+    await warmer.run_once(duration=0)
+    assert upstream.requests[-1].endswith("/Firm/122702")
+
+
+@pytest.mark.asyncio
+async def test_refreshes_with_batch_priority(upstream):
+    limiter = fca_api.scheduling.PriorityLimiter()
+    seen = []
+    upstream_handler = upstream.handler
+
+    def handler(request):
+        seen.append(limiter.in_flight(fca_api.scheduling.BATCH))
+        return upstream_handler(request)
+
+    client = fca_api.async_api.Client(
+        credentials=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        cache=ResponseCache(ttl=60),
+        api_limiter=limiter,
+    )
+    await client.raw_client.get_firm("122702")
+    warmer = CacheWarmer(client, firms=["122702"], sub_resources=False)
+    result = await warmer.run_once(duration=0)
+    assert result.refreshed == 1
+    assert seen == [0, 1]